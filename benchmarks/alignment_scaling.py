@@ -0,0 +1,57 @@
+"""Measures how the cost of alignment scales with the number of dimensions.
+
+Run as::
+
+    python benchmarks/alignment_scaling.py
+
+"plan" is the (uncached) time to compute the sequence of isl operations
+needed for the alignment, "align" is the time of a full (cached)
+:func:`namedisl.align_obj` call, including the isl operations.
+"""
+from __future__ import annotations
+
+import random
+from functools import partial
+from timeit import timeit
+
+import namedisl as nisl
+from namedisl.core import _get_alignment_plan
+
+
+def make_set(nparams: int, ndims: int) -> nisl.Set:
+    params = [f"p{i}" for i in range(nparams)]
+    names = [f"x{i}" for i in range(ndims)]
+    conditions = " and ".join(
+        f"0 <= {name} <= {params[i % nparams]}" for i, name in enumerate(names))
+    return nisl.make_set(
+        f"[{', '.join(params)}] -> {{ [{', '.join(names)}] : {conditions} }}")
+
+
+def main() -> None:
+    rng = random.Random(17)
+
+    print(f"{'ndims':>6} {'plan [us]':>12} {'align [us]':>12}")
+    for ndims in [5, 10, 20, 40, 80, 160]:
+        s = make_set(max(ndims // 4, 1), ndims)
+
+        target = {dt: list(names) for dt, names in s.space.dimtype_to_names.items()}
+        for names in target.values():
+            rng.shuffle(names)
+        target_space = nisl.Space.from_names(
+            param=target[nisl.DimType.param],
+            out=target[nisl.DimType.out])
+
+        number = max(2000 // ndims, 5)
+        t_plan = timeit(
+            partial(_get_alignment_plan.__wrapped__,
+                type(s._obj), s.space, target_space, False, False),
+            number=number) / number
+        t_align = timeit(
+            partial(nisl.align_obj, s, target_space),
+            number=number) / number
+
+        print(f"{ndims:>6} {t_plan*1e6:>12.1f} {t_align*1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
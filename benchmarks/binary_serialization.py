@@ -0,0 +1,51 @@
+"""Compares loading sets from :meth:`namedisl.Set.to_bytes` output with
+parsing isl's text syntax, in time and size.
+
+Run as::
+
+    python benchmarks/binary_serialization.py
+"""
+from __future__ import annotations
+
+from functools import partial
+from timeit import timeit
+
+import islpy as isl
+
+import namedisl as nisl
+
+
+def make_set(npieces: int, ndims: int) -> nisl.Set:
+    names = [f"i{j}" for j in range(ndims)]
+    result = nisl.make_set(f"[n] -> {{ [{', '.join(names)}] : false }}")
+    for k in range(npieces):
+        result = result | nisl.make_set(
+            f"[n] -> {{ [{', '.join(names)}] : "
+            + " and ".join(
+                f"{k} <= {name} < n + {j} and {name} <= {k} + 2*{names[j-1]}"
+                for j, name in enumerate(names))
+            + f" and exists a : {names[0]} = 3a + {k} }}")
+    return result
+
+
+def main() -> None:
+    nrounds = 200
+
+    print(f"{'pieces':>7} {'ndims':>6} {'parse [us]':>11} {'bytes [us]':>11} "
+          f"{'text size':>10} {'bytes size':>11}")
+    for npieces, ndims in [(1, 3), (4, 6), (16, 8)]:
+        s = make_set(npieces, ndims)
+        src = str(s)
+        data = s.to_bytes()
+
+        # bypass the parse cache of make_set
+        t_parse = timeit(
+            lambda src=src: nisl.make_set(isl.Set(src)), number=nrounds) / nrounds
+        t_bytes = timeit(
+            partial(nisl.Set.from_bytes, data), number=nrounds) / nrounds
+        print(f"{npieces:>7} {ndims:>6} {t_parse*1e6:>11.1f} {t_bytes*1e6:>11.1f} "
+              f"{len(src):>10} {len(data):>11}")
+
+
+if __name__ == "__main__":
+    main()
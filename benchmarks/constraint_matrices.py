@@ -0,0 +1,57 @@
+"""Compares building a :class:`namedisl.BasicSet` from constraint matrices
+with adding its constraints one at a time.
+
+Run as::
+
+    python benchmarks/constraint_matrices.py
+"""
+from __future__ import annotations
+
+from functools import partial
+from timeit import timeit
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+import namedisl as nisl
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def add_one_by_one(space: nisl.Space, ineq: NDArray[np.int64]) -> nisl.BasicSet:
+    affs = nisl.affs_from_domain_space(space)
+    names = [*space.param_names, *space.set_names]
+    result = nisl.BasicSet.universe(space)
+    for row in cast("list[list[int]]", ineq.tolist()):
+        aff = affs[0] + row[-1]
+        for name, coeff in zip(names, row[:-1], strict=True):
+            if coeff:
+                aff = aff + coeff * affs[name]
+        result = result.add_constraint(nisl.Constraint.inequality_from_aff(aff))
+    return result
+
+
+def main() -> None:
+    rng = np.random.default_rng(17)
+    nrounds = 5
+
+    print(f"{'ndims':>6} {'ncons':>6} {'one-by-one [ms]':>16} {'matrices [ms]':>14}")
+    for ndims, ncons in [(4, 16), (8, 256), (16, 2048)]:
+        space = nisl.Space.from_names(
+            param=["n"], out=[f"i{j}" for j in range(ndims)])
+        ineq = rng.integers(-3, 4, size=(ncons, ndims + 2))
+        ineq[:, -1] = 1000
+
+        t_one = timeit(partial(add_one_by_one, space, ineq), number=nrounds)
+        t_mat = timeit(
+            partial(nisl.BasicSet.from_constraint_matrices, space,
+                    np.zeros((0, ndims + 2), dtype=np.int64), ineq),
+            number=nrounds)
+        print(f"{ndims:>6} {ncons:>6} {t_one/nrounds*1e3:>16.2f} "
+              f"{t_mat/nrounds*1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
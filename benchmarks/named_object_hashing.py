@@ -0,0 +1,81 @@
+"""Measures the cost of using named objects as :class:`dict` keys and
+:class:`set` members, compared with hashing and comparing the underlying
+isl objects on every operation.
+
+Run as::
+
+    python benchmarks/named_object_hashing.py
+"""
+from __future__ import annotations
+
+from functools import partial
+from timeit import timeit
+from typing import TYPE_CHECKING
+
+import namedisl as nisl
+from namedisl.core import plain_is_equal
+
+
+if TYPE_CHECKING:
+    import islpy as isl
+
+
+def make_domains(n: int, ndims: int) -> list[nisl.Set]:
+    names = [f"i{j}" for j in range(ndims)]
+    return [
+        nisl.make_set(
+            f"[n] -> {{ [{', '.join(names)}] : "
+            + " and ".join(f"{k} <= {name} < n + {j}" for j, name in enumerate(names))
+            + " }")
+        for k in range(n)]
+
+
+def memo_lookups(table: dict[nisl.Set, int], keys: list[nisl.Set]) -> int:
+    return sum(table[key] for key in keys)
+
+
+def set_membership(members: set[nisl.Set], keys: list[nisl.Set]) -> int:
+    return sum(key in members for key in keys)
+
+
+def isl_memo_lookups(
+            table: dict[int, list[tuple[isl.Set, int]]], keys: list[isl.Set]
+        ) -> int:
+    # what the lookups cost when hashing and comparing through isl each time
+    total = 0
+    for key in keys:
+        for cand, value in table[hash(key)]:
+            if plain_is_equal(key, cand):
+                total += value
+                break
+    return total
+
+
+def main() -> None:
+    nkeys = 200
+    nrounds = 20
+
+    print(f"{'ndims':>6} {'dict [us]':>10} {'set [us]':>9} {'isl [us]':>9}")
+    for ndims in [2, 6, 12]:
+        domains = make_domains(nkeys, ndims)
+        table = {dom: i for i, dom in enumerate(domains)}
+        members = set(domains)
+
+        isl_domains = [dom.as_isl() for dom in domains]
+        isl_table: dict[int, list[tuple[isl.Set, int]]] = {}
+        for i, dom in enumerate(isl_domains):
+            isl_table.setdefault(hash(dom), []).append((dom, i))
+
+        nops = nkeys * nrounds
+        t_dict = timeit(
+            partial(memo_lookups, table, domains), number=nrounds) / nops
+        t_set = timeit(
+            partial(set_membership, members, domains), number=nrounds) / nops
+        t_isl = timeit(
+            partial(isl_memo_lookups, isl_table, isl_domains), number=nrounds) / nops
+
+        print(f"{ndims:>6} {t_dict*1e6:>10.3f} {t_set*1e6:>9.3f} {t_isl*1e6:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
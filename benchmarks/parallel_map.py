@@ -0,0 +1,52 @@
+"""Measures the speedup of :func:`namedisl.parallel.map` over a serial loop
+for a batch of independent convex hull computations.
+
+Run as::
+
+    python benchmarks/parallel_map.py
+"""
+from __future__ import annotations
+
+import os
+from functools import partial
+from operator import methodcaller
+from timeit import timeit
+
+import namedisl as nisl
+import namedisl.parallel as nisl_parallel
+
+
+def make_domains(n: int, ndims: int) -> list[nisl.Set]:
+    names = [f"i{j}" for j in range(ndims)]
+    return [
+        nisl.make_set(
+            f"[n] -> {{ [{', '.join(names)}] : "
+            + " and ".join(
+                f"{k % 5} <= {name} < n + {j} and {name} <= {k} + {names[j-1]}"
+                for j, name in enumerate(names))
+            + " }")
+        | nisl.make_set(
+            f"[n] -> {{ [{', '.join(names)}] : "
+            + " and ".join(f"0 <= {name} <= {k}" for name in names)
+            + " }")
+        for k in range(n)]
+
+
+def main() -> None:
+    domains = make_domains(100, 4)
+    op = methodcaller("convex_hull")
+
+    t_serial = timeit(lambda: [op(dom) for dom in domains], number=1)
+    print(f"{'workers':>8} {'time [s]':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {t_serial:>9.3f} {1:>8.2f}")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        t = timeit(
+            partial(nisl_parallel.map, op, domains, workers=workers), number=1)
+        print(f"{workers:>8} {t:>9.3f} {t_serial/t:>8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
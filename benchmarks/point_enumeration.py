@@ -0,0 +1,46 @@
+"""Compares :meth:`namedisl.Set.enumerate_points` with collecting the points
+of a set one at a time through :meth:`islpy.Set.foreach_point`.
+
+Run as::
+
+    python benchmarks/point_enumeration.py
+"""
+from __future__ import annotations
+
+from functools import partial
+from timeit import timeit
+
+import islpy as isl
+
+import namedisl as nisl
+
+
+def collect_points(set_: isl.Set) -> list[list[int]]:
+    ndims = set_.dim(isl.dim_type.set)
+    points: list[list[int]] = []
+    set_.foreach_point(lambda pt: points.append([
+        pt.get_coordinate_val(isl.dim_type.set, i).to_python()
+        for i in range(ndims)]))
+    return points
+
+
+def stream_points(set_: nisl.Set, chunk_size: int) -> int:
+    return sum(len(chunk) for chunk in set_.enumerate_points(chunk_size=chunk_size))
+
+
+def main() -> None:
+    print(f"{'npoints':>9} {'foreach [s]':>12} {'array [s]':>10} {'stream [s]':>11}")
+    for n in [10, 40, 160]:
+        set_ = nisl.make_set(
+            f"{{ [i, j, k] : 0 <= i < {n} and 0 <= j <= i and 0 <= k < 40 "
+            "and (i + j + k) mod 7 <= 3 }")
+        npoints = len(set_.enumerate_points())
+
+        t_foreach = timeit(partial(collect_points, set_.as_isl()), number=1)
+        t_array = timeit(set_.enumerate_points, number=1)
+        t_stream = timeit(partial(stream_points, set_, 2**16), number=1)
+        print(f"{npoints:>9} {t_foreach:>12.3f} {t_array:>10.3f} {t_stream:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
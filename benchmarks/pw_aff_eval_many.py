@@ -0,0 +1,61 @@
+"""Compares :meth:`namedisl.PwAff.eval_many` with evaluating a
+:class:`namedisl.PwAff` point by point through
+:meth:`namedisl.PwAff.eval_with_dict`.
+
+Run as::
+
+    python benchmarks/pw_aff_eval_many.py
+"""
+from __future__ import annotations
+
+from functools import partial
+from timeit import timeit
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+import namedisl as nisl
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def eval_one_by_one(
+            pw_aff: nisl.PwAff, points: NDArray[np.int64]
+        ) -> list[int | None]:
+    domain = pw_aff.aggregate_domain()
+    names = [*pw_aff.space.dimtype_to_names[nisl.DimType.param],
+             *pw_aff.space.dimtype_to_names[nisl.DimType.in_]]
+    results: list[int | None] = []
+    for point in cast("list[list[int]]", points.tolist()):
+        value_dict = dict(zip(names, point, strict=True))
+        pt_set = nisl.Point.from_dict(domain.space, value_dict).as_set()
+        results.append(
+            None if (domain & pt_set).is_empty()
+            else pw_aff.eval_with_dict(value_dict).to_python())
+    return results
+
+
+def main() -> None:
+    pw_aff = nisl.make_pw_aff(
+        "[n] -> { [i, j] -> [(floor((i + floor(j/3))/2) + n)] : "
+        "0 <= i < n and j mod 5 = 1; "
+        "[i, j] -> [(3i)/2 - (j mod 7)] : i < 0 and i mod 2 = 0 }")
+    rng = np.random.default_rng(17)
+
+    print(f"{'npoints':>9} {'one-by-one [s]':>15} {'eval_many [s]':>14}")
+    for npoints in [10**3, 10**4, 10**6]:
+        points = rng.integers(-1000, 1000, size=(npoints, 3))
+        points[:, 0] = 500
+
+        t_many = timeit(partial(pw_aff.eval_many, points), number=1)
+        if npoints <= 10**4:
+            t_one = timeit(partial(eval_one_by_one, pw_aff, points), number=1)
+            print(f"{npoints:>9} {t_one:>15.3f} {t_many:>14.3f}")
+        else:
+            print(f"{npoints:>9} {'-':>15} {t_many:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measures memory footprint and hashing/lookup cost of :class:`namedisl.Space`,
+compared to the previous representation (a frozen dataclass with a per-instance
+``__dict__`` holding the lazily computed name lookup table).
+
+Run as::
+
+    python benchmarks/space_footprint.py
+
+Memory is measured after touching :attr:`namedisl.Space.name_to_dim`.
+"""
+from __future__ import annotations
+
+import tracemalloc
+from dataclasses import dataclass
+from functools import cached_property, partial
+from timeit import timeit
+from typing import TYPE_CHECKING
+
+from constantdict import constantdict
+from typing_extensions import override
+
+from namedisl import DimType, Space
+from namedisl.core import DimId, DimTypeToNames, NameToDim
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+@dataclass(frozen=True, eq=False)
+class PreviousSpace:
+    dimtype_to_names: DimTypeToNames
+
+    @override
+    def __hash__(self) -> int:
+        return hash((type(self), self.dimtype_to_names))
+
+    @cached_property
+    def name_to_dim(self) -> NameToDim:
+        return {name: DimId(dt, i)
+            for dt, names in self.dimtype_to_names.items()
+            for i, name in enumerate(names)}
+
+
+def make_dimtype_to_names(
+            i: int, nparams: int, ndims: int
+        ) -> constantdict[DimType, tuple[str, ...]]:
+    return constantdict({
+        DimType.param: tuple(f"p{j}" for j in range(nparams)),
+        DimType.out: tuple(f"x{i}_{j}" for j in range(ndims)),
+    })
+
+
+def measure(
+            make_space: Callable[[DimTypeToNames], Space | PreviousSpace],
+            dtns: Sequence[DimTypeToNames],
+        ) -> tuple[float, float, float]:
+    for dtn in dtns:
+        hash(dtn)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    spaces = [make_space(dtn) for dtn in dtns]
+    for sp in spaces:
+        _ = sp.name_to_dim
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sp = spaces[0]
+    number = 200_000
+    t_hash = timeit(partial(hash, sp), number=number) / number
+    t_n2d = timeit(partial(getattr, sp, "name_to_dim"), number=number) / number
+
+    return (after - before) / len(dtns), t_hash, t_n2d
+
+
+def main() -> None:
+    nspaces = 20_000
+
+    print(f"{'ndims':>6} {'repr':>9} {'bytes/space':>12} {'hash [ns]':>10} "
+          f"{'name_to_dim [ns]':>17}")
+    for ndims in [2, 8, 32]:
+        for label, make_space in [
+                ("previous", PreviousSpace),
+                ("current", Space),
+                ]:
+            dtns = [make_dimtype_to_names(i, 4, ndims) for i in range(nspaces)]
+            nbytes, t_hash, t_n2d = measure(make_space, dtns)
+            print(f"{ndims:>6} {label:>9} {nbytes:>12.0f} "
+                  f"{t_hash*1e9:>10.0f} {t_n2d*1e9:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
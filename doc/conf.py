@@ -20,6 +20,7 @@ version = ".".join(release.split(".")[:2])
 intersphinx_mapping = {
     "islpy": ("https://documen.tician.de/islpy", None),
     "constantdict": ("https://matthiasdiener.github.io/constantdict/", None),
+    "numpy": ("https://numpy.org/doc/stable/", None),
     "python": ("https://docs.python.org/3", None),
 }
 
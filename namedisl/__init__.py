@@ -29,7 +29,18 @@ from typing import overload
 
 from islpy import Error
 
-from .core import Cache, DimType, IslObject, Space, align_obj, align_two
+from .core import (
+    Cache,
+    CacheOperationStats,
+    CacheStats,
+    DimType,
+    IslObject,
+    Space,
+    align_many,
+    align_obj,
+    align_two,
+    caching,
+)
 from .expression_like import (
     Aff,
     Constraint,
@@ -44,6 +55,7 @@ from .expression_like import (
     make_constraint,
     make_multi_aff,
     make_pw_aff,
+    make_pw_affs,
     make_pw_multi_aff,
     make_pw_qpolynomial,
     make_qpolynomial,
@@ -52,6 +64,7 @@ from .expression_like import (
 from .set_like import (
     BasicMap,
     BasicSet,
+    ConstraintMatrix,
     Map,
     Point,
     Set,
@@ -60,7 +73,9 @@ from .set_like import (
     make_basic_set,
     make_map,
     make_map_from_domain_and_range,
+    make_maps,
     make_set,
+    make_sets,
 )
 
 
@@ -69,7 +84,10 @@ __all__ = [
     "BasicMap",
     "BasicSet",
     "Cache",
+    "CacheOperationStats",
+    "CacheStats",
     "Constraint",
+    "ConstraintMatrix",
     "DimType",
     "Error",
     "Map",
@@ -84,20 +102,25 @@ __all__ = [
     "StrideInfo",
     "Term",
     "affs_from_domain_space",
+    "align_many",
     "align_obj",
     "align_two",
+    "caching",
     "make_aff",
     "make_basic_map",
     "make_basic_set",
     "make_constraint",
     "make_map",
     "make_map_from_domain_and_range",
+    "make_maps",
     "make_multi_aff",
     "make_pw_aff",
+    "make_pw_affs",
     "make_pw_multi_aff",
     "make_pw_qpolynomial",
     "make_qpolynomial",
     "make_set",
+    "make_sets",
     "pw_affs_from_domain_space",
 ]
 
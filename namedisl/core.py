@@ -1,12 +1,20 @@
 """
 .. autofunction:: align_obj
 .. autofunction:: align_two
+.. autofunction:: align_many
+
+.. currentmodule:: namedisl
+.. autofunction:: caching
+
+.. currentmodule:: namedisl.core
 
 .. currentmodule:: namedisl
 .. autoclass:: Error
 .. autoclass:: DimType
 .. autoclass:: Space
 .. autoclass:: Cache
+.. autoclass:: CacheStats
+.. autoclass:: CacheOperationStats
 .. autoclass:: align_two
 """
 
@@ -39,10 +47,22 @@ THE SOFTWARE.
 
 import enum
 import re
-from collections.abc import Callable, Collection, Hashable, Iterable, Mapping, Sequence
-from dataclasses import dataclass
-from functools import cached_property
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Collection,
+    Generator,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from importlib import metadata
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     ClassVar,
@@ -54,6 +74,7 @@ from typing import (
     cast,
     final,
 )
+from weakref import WeakValueDictionary
 
 from constantdict import constantdict
 from typing_extensions import NamedTuple, Self, override
@@ -62,6 +83,8 @@ import islpy as isl
 
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from islpy._isl import dim_type
 
 
@@ -127,6 +150,11 @@ IslBasicT_co = TypeVar(
     bound=IslBasic,
     covariant=True
 )
+IslUnbasicT = TypeVar(
+    "IslUnbasicT",
+    isl.Set,
+    isl.Map,
+)
 IslUnbasicT_co = TypeVar(
     "IslUnbasicT_co",
     bound=IslUnbasic,
@@ -190,6 +218,12 @@ class DimId(NamedTuple):
     dim_index: int
 
 
+@cache
+def _shared_dim_id(dim_type: DimType, dim_index: int) -> DimId:
+    # DimIds are shared among spaces to keep their footprint small.
+    return DimId(dim_type, dim_index)
+
+
 NameToDim: TypeAlias = Mapping[str, DimId]
 DimTypeToNames: TypeAlias = Mapping[DimType, Sequence[str]]
 
@@ -201,6 +235,8 @@ VERSION = tuple(int(nr) for nr in _match.group(1).split("."))
 
 __all__ = [
     "_align_and_apply_binary_op",
+    "_make_many",
+    "_parse_cached",
     "_restore_names",
     "align_two",
     "chunk_indices",
@@ -306,135 +342,483 @@ def chunked_dims_by_type(
     return {dt: chunk_indices(sorted(idxs)) for dt, idxs in dim_to_indices.items()}
 
 
-# FIXME: think through whether or not alphabetical ordering will require more
-# work on average than using one of the objects as a template in alignment
-def _find_joint_space(
-    space1: Space,
-    space2: Space,
-) -> Space:
+def _alignment_cost(source: Space, target: DimTypeToNames) -> int:
+    """Estimate the number of dimensions that need to be inserted or moved
+    to align an object in *source* to *target*.
+    """
+    from bisect import bisect_left
+
+    cost = 0
+    for dt, target_names in target.items():
+        source_name_to_idx = {
+            name: i for i, name in enumerate(source.dimtype_to_names[dt])}
+
+        # Dimensions along a longest increasing subsequence of source positions
+        # can stay where they are, all others have to move.
+        lis_tails: list[int] = []
+        nretained = 0
+        for name in target_names:
+            idx = source_name_to_idx.get(name)
+            if idx is None:
+                cost += 1
+                continue
+
+            nretained += 1
+            pos = bisect_left(lis_tails, idx)
+            if pos == len(lis_tails):
+                lis_tails.append(idx)
+            else:
+                lis_tails[pos] = idx
+
+        cost += nretained - len(lis_tails)
+
+    return cost
+
+
+_MAX_JOINT_SPACE_TEMPLATES = 8
+
+
+def _find_joint_space_many(spaces: Iterable[Space]) -> Space:
     """
-    Enforces alphabetical ordering of all dimensions found in :arg:`obj1` and
-    :arg:`obj2` within each dimension-type chunk. This ordering is used in
-    alignment before performing operations between two set-like objects.
+    Find a :class:`Space` containing all dimensions found in *spaces*. This
+    is used in alignment before performing operations between objects.
+
+    Candidate orderings are those of the most frequent spaces (up to
+    ``_MAX_JOINT_SPACE_TEMPLATES`` of them), with missing dimensions appended
+    in order of first appearance, as well as alphabetical ordering within each
+    dimension type. Of those, the one estimated to require the least work to
+    align all spaces to is used (first by the number of objects that need
+    realignment, then by the number of dimensions to insert or move).
+    Remaining ties are broken by comparing the candidate orderings, so that
+    the result does not depend on the order of *spaces*. In particular,
+    ``a & b`` and ``b & a`` live in the same space.
     """
-    assert space1.dimtype_to_names.keys() == space2.dimtype_to_names.keys()
+    from collections import Counter
+
+    space_counts = Counter(spaces)
+    if not space_counts:
+        raise ValueError("no spaces given")
+
+    first_space = next(iter(space_counts))
+    if len(space_counts) == 1:
+        return first_space
+
+    dim_types = first_space.dimtype_to_names.keys()
+    if any(space.dimtype_to_names.keys() != dim_types for space in space_counts):
+        raise ValueError("spaces do not have matching dimension types")
+
+    def order_key(dimtype_to_names: DimTypeToNames) -> tuple[tuple[str, ...], ...]:
+        return tuple(tuple(names) for _, names in sorted(dimtype_to_names.items()))
+
+    # most frequent first, independent of the order of *spaces*
+    sorted_spaces = sorted(
+        space_counts,
+        key=lambda space: (-space_counts[space], order_key(space.dimtype_to_names)))
+
+    # dicts preserve order of first appearance
+    dim_type_to_names: dict[DimType, dict[str, None]] = {dt: {} for dt in dim_types}
+    for space in sorted_spaces:
+        for dt, names in space.dimtype_to_names.items():
+            dim_type_to_names[dt].update(dict.fromkeys(names))
 
-    dim_type_to_names = {
-        dt: {
-            *space1.dimtype_to_name_sets[dt],
-            *space2.dimtype_to_name_sets[dt]
-        }
-        for dt in space1.dimtype_to_names
-    }
     for dt1, names1 in dim_type_to_names.items():
         for dt2, names2 in dim_type_to_names.items():
             if dt1 >= dt2:
                 continue
-            dup_names = names1 & names2
+            dup_names = names1.keys() & names2.keys()
             if dup_names:
                 raise ValueError(
                     "duplicate dimension names across dimension types: "
                     f"{', '.join(sorted(dup_names))} across {dt1!r} and {dt2!r}"
                 )
 
-    return Space(constantdict({
-        dt: tuple(sorted(names))
-        for dt, names in dim_type_to_names.items()
-    }))
+    def template_order(template: Space) -> DimTypeToNames:
+        return {
+            dt: (*names, *(
+                name for name in dim_type_to_names[dt]
+                if name not in template.dimtype_to_name_sets[dt]))
+            for dt, names in template.dimtype_to_names.items()}
+
+    candidates = [
+        *(template_order(space)
+          for space in sorted_spaces[:_MAX_JOINT_SPACE_TEMPLATES]),
+        {dt: tuple(sorted(names)) for dt, names in dim_type_to_names.items()},
+    ]
+
+    def total_cost(
+                candidate: DimTypeToNames
+            ) -> tuple[int, int, tuple[tuple[str, ...], ...]]:
+        nrealigned = 0
+        total = 0
+        for space, count in space_counts.items():
+            cost = _alignment_cost(space, candidate)
+            # Leaving objects alone altogether is worth the most.
+            nrealigned += count * (cost > 0)
+            total += count * cost
+        return nrealigned, total, order_key(candidate)
+
+    best = min(candidates, key=total_cost)
+
+    return Space(constantdict(best))
 
 
-def _dimtype_to_names_from_name_to_dim(name_to_dim: NameToDim) -> DimTypeToNames:
-    dimtype_to_names: dict[DimType, tuple[str, ...]] = {}
-    for (dt, idx), name in sorted(
-            (dim_id, name) for name, dim_id in name_to_dim.items()):
-        tup = dimtype_to_names.get(dt, ())
-        assert idx == len(tup)
-        dimtype_to_names[dt] = (*tup, name)
+def _find_joint_space(
+    space1: Space,
+    space2: Space,
+) -> Space:
+    """
+    Find a :class:`Space` containing all dimensions found in :arg:`space1` and
+    :arg:`space2`. See :func:`_find_joint_space_many`, the result does not
+    depend on the order of the arguments.
+    """
+    assert space1.dimtype_to_names.keys() == space2.dimtype_to_names.keys()
+    return _find_joint_space_many((space1, space2))
 
-    return constantdict(dimtype_to_names)
 
+class _RemainingDims:
+    """Tracks which of a fixed sequence of dimensions have not yet been moved
+    to their target position, supporting removal and counting the remaining
+    dimensions before a given index in *O(log n)* time (via a Fenwick tree).
+    """
+    def __init__(self, n: int) -> None:
+        # All slots start out present: node i covers the (i & -i) slots
+        # ending at (1-based) index i.
+        self._tree: list[int] = [0] + [i & -i for i in range(1, n + 1)]
+
+    def remove(self, index: int) -> None:
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+
+    def count_before(self, index: int) -> int:
+        result = 0
+        i = index
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
 
-def align_obj(
-    named_obj: NamedIslObjectT,
-    space: Space,
-    *, allow_cross_dim_type: bool = False,
-    obj_larger_than_space_ok: bool = False,
-) -> NamedIslObjectT:
-    obj = named_obj._obj
-    running_name_to_dim_id = dict(named_obj.space.name_to_dim)
 
-    if isinstance(obj, (isl.PwMultiAff, isl.Constraint)):
-        raise NotImplementedError
+class _InsertDims(NamedTuple):
+    dim_type: DimType
+    position: int
+    n: int
+    # Only set for parameters, since isl insists on those being named.
+    names: tuple[str, ...] | None
+
+    def apply(self, obj: IslObjectT) -> IslObjectT:
+        isl_obj: IslObject = obj
+        assert not isinstance(isl_obj, (isl.PwMultiAff, isl.Constraint))
+        obj = cast("IslObjectT",
+            isl_obj.insert_dims(self.dim_type.as_isl(), self.position, self.n))
+        if self.names is not None:
+            for i, name in enumerate(self.names):
+                obj = _set_dim_name(obj, self.dim_type, self.position + i, name)
+
+            # ban spooky islpy upcasts
+            assert not isinstance(obj, isl.UnionPwAff)
+
+        return obj
+
+
+class _MoveDims(NamedTuple):
+    dst_type: DimType
+    dst_position: int
+    src_type: DimType
+    src_position: int
+    n: int
+
+    def apply(self, obj: IslObjectT) -> IslObjectT:
+        isl_obj: IslObject = obj
+        assert not isinstance(isl_obj, (isl.PwMultiAff, isl.Constraint))
+        return cast("IslObjectT", isl_obj.move_dims(
+            self.dst_type.as_isl(), self.dst_position,
+            self.src_type.as_isl(), self.src_position,
+            self.n))
+
+
+def _make_params_space(ctx: isl.Context, names: Sequence[str]) -> isl.Space:
+    model = isl.Space.params_alloc(ctx, len(names))
+    for i, name in enumerate(names):
+        model = model.set_dim_name(isl.dim_type.param, i, name)
+    return model
+
+
+class _AlignParams(NamedTuple):
+    """Reorder (and insert) parameters in a single isl operation.
+    *model* is built in :data:`islpy.DEFAULT_CONTEXT` along with the plan and
+    only rebuilt for objects living in other contexts.
+    """
+    names: tuple[str, ...]
+    model: isl.Space
+
+    @classmethod
+    def from_names(cls, names: Sequence[str]) -> _AlignParams:
+        return cls(tuple(names), _make_params_space(isl.DEFAULT_CONTEXT, names))
+
+    def apply(self, obj: IslObjectT) -> IslObjectT:
+        isl_obj: IslObject = obj
+        assert not isinstance(isl_obj, (isl.PwQPolynomial, isl.Constraint))
+        ctx = isl_obj.get_ctx()
+        model = (self.model if ctx == self.model.get_ctx()
+                 else _make_params_space(ctx, self.names))
+        return cast("IslObjectT", isl_obj.align_params(model))
+
+
+class _PermuteDims(NamedTuple):
+    """Reorder all dimensions of one (non-parameter) dim type in a single isl
+    operation. Dimension *i* of the result is dimension ``permutation[i]``
+    of the input.
+    """
+    dim_type: DimType
+    permutation: tuple[int, ...]
+
+    def _make_multi_aff(self, isl_set_space: isl.Space, *, inverse: bool
+                ) -> isl.MultiAff:
+        perm = self.permutation
+        if inverse:
+            inv_perm = [0] * len(perm)
+            for i, j in enumerate(perm):
+                inv_perm[j] = i
+            perm = inv_perm
+
+        ls = isl.LocalSpace.from_space(isl_set_space)
+        ma = isl.MultiAff.identity(isl_set_space.map_from_set())
+        for i, j in enumerate(perm):
+            ma = ma.set_at(i, isl.Aff.var_on_domain(ls, isl.dim_type.set, j))
+        return ma
+
+    def apply(self, obj: IslObjectT) -> IslObjectT:
+        # Pulling back/taking the preimage under x -> (y_inv_perm[i])_i
+        # moves dimension perm[i] to position i.
+        if isinstance(obj, (isl.BasicSet, isl.Set)):
+            return cast("IslObjectT", obj.preimage_multi_aff(
+                self._make_multi_aff(obj.get_space(), inverse=True)))
+
+        elif isinstance(obj, (isl.BasicMap, isl.Map)):
+            if self.dim_type == DimType.in_:
+                return cast("IslObjectT", obj.preimage_domain_multi_aff(
+                    self._make_multi_aff(obj.get_space().domain(), inverse=True)))
+            else:
+                return cast("IslObjectT", obj.preimage_range_multi_aff(
+                    self._make_multi_aff(obj.get_space().range(), inverse=True)))
+
+        elif isinstance(obj, (isl.Aff, isl.PwAff, isl.MultiAff)):
+            if self.dim_type == DimType.in_:
+                return cast("IslObjectT", obj.pullback_multi_aff(
+                    self._make_multi_aff(obj.get_domain_space(), inverse=True)))
+            else:
+                assert isinstance(obj, isl.MultiAff)
+                return cast("IslObjectT",
+                    self._make_multi_aff(obj.get_space().range(), inverse=False)
+                    .pullback_multi_aff(obj))
+
+        else:
+            raise NotImplementedError(f"permuting dimensions of {type(obj)}")
+
+
+_AlignmentStep: TypeAlias = _InsertDims | _MoveDims | _AlignParams | _PermuteDims
+
+# isl lacks align_params and pullbacks for some types, which then
+# fall back to moving dimensions individually.
+_ALIGN_PARAMS_TYPES: tuple[type[IslObject], ...] = (
+    isl.BasicSet, isl.Set, isl.BasicMap, isl.Map,
+    isl.Aff, isl.PwAff, isl.MultiAff, isl.QPolynomial)
+_PERMUTE_DIMS_TYPES: Mapping[DimType, tuple[type[IslObject], ...]] = {
+    DimType.in_: (isl.BasicMap, isl.Map, isl.Aff, isl.PwAff, isl.MultiAff),
+    DimType.out: (isl.BasicSet, isl.Set, isl.BasicMap, isl.Map, isl.MultiAff),
+}
 
-    for target_dt, names in space.dimtype_to_names.items():
+
+def _plan_bulk_alignment(
+    isl_type: type[IslObject],
+    source: Space,
+    target: Space,
+) -> tuple[list[_AlignmentStep], Space]:
+    """Bring all dim types of *source* that support it into the order of
+    *target* with a constant number of isl operations each.
+    Leaves alone any dim type that participates in moves across dim types.
+
+    :returns: the steps and the resulting intermediate :class:`Space`.
+    """
+    steps: list[_AlignmentStep] = []
+    new_dimtype_to_names = dict(source.dimtype_to_names)
+
+    for dt, target_names in target.dimtype_to_names.items():
+        source_names = source.dimtype_to_names.get(dt, ())
+
+        if dt == DimType.param:
+            if not issubclass(isl_type, _ALIGN_PARAMS_TYPES):
+                continue
+        elif not issubclass(isl_type, _PERMUTE_DIMS_TYPES.get(dt, ())):
+            continue
+
+        if any(source.name_to_dim[name].dim_type != dt
+                for name in target_names if name in source.name_to_dim):
+            continue
+        if any(target.name_to_dim[name].dim_type != dt
+                for name in source_names if name in target.name_to_dim):
+            continue
+
+        leftover_names = tuple(
+            name for name in source_names if name not in target.name_to_dim)
+        new_names = (*target_names, *leftover_names)
+        if new_names == source_names:
+            continue
+
+        if dt == DimType.param:
+            steps.append(_AlignParams.from_names(target_names))
+        else:
+            missing_names = tuple(
+                name for name in target_names if name not in source.name_to_dim)
+            if missing_names:
+                steps.append(_InsertDims(
+                    dt, len(source_names), len(missing_names), None))
+
+            current_names = (*source_names, *missing_names)
+            if new_names != current_names:
+                name_to_current_idx = {
+                    name: i for i, name in enumerate(current_names)}
+                steps.append(_PermuteDims(
+                    dt, tuple(name_to_current_idx[name] for name in new_names)))
+
+        new_dimtype_to_names[dt] = new_names
+
+    return steps, Space(constantdict(new_dimtype_to_names))
+
+
+class _AlignmentPlan(NamedTuple):
+    """The sequence of isl dimension operations that transforms an object
+    in one :class:`Space` into one in another, along with the resulting
+    :class:`Space`.
+    """
+    steps: tuple[_AlignmentStep, ...]
+    space: Space
+
+
+_ALIGNMENT_PLAN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_ALIGNMENT_PLAN_CACHE_SIZE)
+def _get_alignment_plan(
+    isl_type: type[IslObject],
+    source: Space,
+    target: Space,
+    allow_cross_dim_type: bool,
+    obj_larger_than_space_ok: bool,
+) -> _AlignmentPlan:
+    steps, source = _plan_bulk_alignment(isl_type, source, target)
+
+    # Whatever could not be aligned in bulk is moved one dimension at a time.
+    # Dimensions already moved into place occupy a prefix of each dim type,
+    # followed by the not-yet-moved ones in their original relative order.
+    # This permits finding the current position of each dimension without
+    # rewriting the positions of all others after each move.
+    nplaced: dict[DimType, int] = {}
+    remaining = {
+        dt: _RemainingDims(len(names))
+        for dt, names in source.dimtype_to_names.items()}
+
+    for target_dt, names in target.dimtype_to_names.items():
         for target_dim, name in enumerate(names):
-            old_dim_id = running_name_to_dim_id.get(name)
-            target_dim_id = DimId(target_dt, target_dim)
+            old_dim_id = source.name_to_dim.get(name)
 
             if old_dim_id is None:
-                obj = obj.insert_dims(target_dt.as_isl(), target_dim, 1)
-                if target_dt == DimType.param:
-                    # isl doesn't seem to like unnamed param dimensions. Make it happy.
-                    obj = _set_dim_name(obj, target_dt, target_dim, name)
-
-                    # ban spooky islpy upcasts
-                    assert not isinstance(obj, isl.UnionPwAff)
+                steps.append(_InsertDims(
+                    target_dt, target_dim, 1,
+                    # isl doesn't seem to like unnamed param dimensions.
+                    # Make it happy.
+                    (name,) if target_dt == DimType.param else None))
 
             else:
-                if old_dim_id == target_dim_id:
-                    continue
-
-                if old_dim_id.dim_type == target_dim_id.dim_type:
-                    another_dim_type = DimType.param
-                    if another_dim_type == old_dim_id.dim_type:
-                        # determine a safe 'alternate' dim type
-                        if isinstance(obj, (isl.Set, isl.BasicSet)):
-                            another_dim_type = DimType.out
-                        else:
-                            another_dim_type = DimType.in_
-
-                    obj = obj.move_dims(
-                        another_dim_type.as_isl(), 0,
-                        old_dim_id.dim_type.as_isl(), old_dim_id.dim_index,
-                        1)
-                    obj = obj.move_dims(
-                        target_dim_id.dim_type.as_isl(), target_dim_id.dim_index,
-                        another_dim_type.as_isl(), 0,
-                        1)
+                source_dt, source_idx = old_dim_id
+                current_dim = (
+                    nplaced.get(source_dt, 0)
+                    + remaining[source_dt].count_before(source_idx))
+                remaining[source_dt].remove(source_idx)
+
+                if source_dt == target_dt:
+                    if current_dim != target_dim:
+                        another_dim_type = DimType.param
+                        if another_dim_type == source_dt:
+                            # determine a safe 'alternate' dim type
+                            if issubclass(isl_type, (isl.Set, isl.BasicSet)):
+                                another_dim_type = DimType.out
+                            else:
+                                another_dim_type = DimType.in_
+
+                        steps.extend([
+                            _MoveDims(
+                                another_dim_type, 0,
+                                source_dt, current_dim,
+                                1),
+                            _MoveDims(
+                                target_dt, target_dim,
+                                another_dim_type, 0,
+                                1),
+                            ])
 
                 else:
                     if not allow_cross_dim_type:
                         raise ValueError("moves across dim_types are not allowed")
 
-                    obj = obj.move_dims(
-                        target_dim_id.dim_type.as_isl(), target_dim_id.dim_index,
-                        old_dim_id.dim_type.as_isl(), old_dim_id.dim_index,
-                        1)
-
-            # FIXME: This is kind of expensive.
-            for other_name in list(running_name_to_dim_id):
-                other_dt, other_idx = running_name_to_dim_id[other_name]
-                if (old_dim_id
-                        and other_dt == old_dim_id.dim_type
-                        and other_idx > old_dim_id.dim_index):
-                    other_idx -= 1
-                if other_dt == target_dt and other_idx >= target_dim:
-                    other_idx += 1
-                running_name_to_dim_id[other_name] = DimId(other_dt, other_idx)
-
-            running_name_to_dim_id[name] = DimId(target_dt, target_dim)
-
-    if len(running_name_to_dim_id) == len(space.name_to_dim):
-        assert running_name_to_dim_id == space.name_to_dim
-        new_space = space
+                    steps.append(_MoveDims(
+                        target_dt, target_dim,
+                        source_dt, current_dim,
+                        1))
+
+            nplaced[target_dt] = target_dim + 1
+
+    leftover_names = {
+        dt: tuple(name for name in names if name not in target.name_to_dim)
+        for dt, names in source.dimtype_to_names.items()}
+
+    if not any(leftover_names.values()):
+        new_space = target
     else:
         if obj_larger_than_space_ok:
-            new_space = Space(
-                _dimtype_to_names_from_name_to_dim(running_name_to_dim_id))
+            new_space = Space(constantdict({
+                dt: (*names, *leftover_names.get(dt, ()))
+                for dt, names in target.dimtype_to_names.items()
+            }))
         else:
             raise ValueError("object has more dimensions than space")
 
-    return type(named_obj)(obj, new_space)
+    return _AlignmentPlan(tuple(steps), new_space)
+
+
+def align_obj(
+    named_obj: NamedIslObjectT,
+    space: Space,
+    *, allow_cross_dim_type: bool = False,
+    obj_larger_than_space_ok: bool = False,
+) -> NamedIslObjectT:
+    """Return a version of *named_obj* whose dimensions are ordered
+    as in *space*, inserting dimensions not present in *named_obj*.
+
+    Where isl supports it for the type of object at hand, each dim type
+    is reordered in a single isl operation (via :meth:`islpy.Set.align_params`
+    or a preimage/pullback under a permutation). The sequence of isl
+    operations required for a given pair of spaces is computed once and
+    memoized.
+    """
+    if named_obj.space.order_equals(space):
+        return named_obj
+
+    obj = named_obj._obj
+
+    if isinstance(obj, (isl.PwMultiAff, isl.Constraint)):
+        raise NotImplementedError
+
+    plan = _get_alignment_plan(
+        type(obj), named_obj.space, space,
+        allow_cross_dim_type, obj_larger_than_space_ok)
+
+    for step in plan.steps:
+        obj = step.apply(obj)
+
+    return type(named_obj)(obj, plan.space)
 
 
 def align_two(
@@ -456,6 +840,32 @@ def align_two(
     return named_obj1, named_obj2
 
 
+def align_many(
+    named_objs: Iterable[NamedIslObjectT],
+) -> list[NamedIslObjectT]:
+    """
+    Returns versions of all passed objects so that they live in a single
+    shared :class:`Space`, in the same order. The joint space is computed
+    once for the entire collection, and each object is aligned (at most)
+    once. Objects already in the joint space are returned unchanged.
+
+    This allows operating on the underlying :mod:`islpy` objects of
+    the results directly (e.g. to reduce over them), with the result
+    living in the space of any of the returned objects.
+
+    :raises ValueError: if the objects do not have matching dimension types
+        (e.g. a mix of sets and maps), or if a name occurs in different
+        dimension types across objects.
+    """
+    named_objs = list(named_objs)
+    if not named_objs:
+        return []
+
+    space = _find_joint_space_many(named_obj.space for named_obj in named_objs)
+
+    return [align_obj(named_obj, space) for named_obj in named_objs]
+
+
 def align_expr_and_set(
     expr_obj: NamedIslObjectT, set_obj: NamedIslObjectT2,
 ) -> tuple[NamedIslObjectT, NamedIslObjectT2]:
@@ -544,7 +954,15 @@ def _align_and_apply_binary_op(
     return type(lhs)(result, lhs.space)
 
 
-@dataclass(frozen=True, eq=False)
+_SPACE_INTERN_TABLE: WeakValueDictionary[DimTypeToNames, Space] = (
+    WeakValueDictionary())
+
+# Guards insertion into _SPACE_INTERN_TABLE (whose setdefault is not atomic).
+_SPACE_LOCK = Lock()
+
+
+@final
+@dataclass(frozen=True, init=False, eq=False, repr=False)
 class Space:
     """
     .. autoattribute:: dimtype_to_names
@@ -574,17 +992,67 @@ class Space:
     .. automethod:: as_isl
     .. automethod:: as_isl_set_space
     """
+    # Only the names and their positions are stored eagerly. The remaining
+    # slots are computed on demand.
+    __slots__ = (
+        "__weakref__",
+        "_dimtype_to_name_sets_cache",
+        "_expr_space_cache",
+        "_hash",
+        "_isl_set_space_cache",
+        "_isl_space_cache",
+        "_names_cache",
+        "_set_space_cache",
+        "dimtype_to_names",
+        "name_to_dim",
+    )
+
     dimtype_to_names: DimTypeToNames
+    name_to_dim: NameToDim
+    _hash: int
+
+    _dimtype_to_name_sets_cache: Mapping[DimType, frozenset[str]]
+    _names_cache: frozenset[str]
+    _expr_space_cache: Space
+    _set_space_cache: Space
+    # only for isl.DEFAULT_CONTEXT
+    _isl_space_cache: isl.Space
+    _isl_set_space_cache: isl.Space
+
+    def __new__(cls, dimtype_to_names: DimTypeToNames) -> Self:
+        # Spaces are interned, so that structurally equal spaces are
+        # the same object, sharing all lazily computed attributes.
+        try:
+            return cast("Self", _SPACE_INTERN_TABLE[dimtype_to_names])
+        except KeyError:
+            pass
 
-    if __debug__:
-        def __post_init__(self) -> None:
-            hash(self.dimtype_to_names)
+        self = super().__new__(cls)
+
+        name_to_dim: dict[str, DimId] = {}
+        nnames = 0
+        for dt, names in dimtype_to_names.items():
+            nnames += len(names)
+            for i, name in enumerate(names):
+                name_to_dim[name] = _shared_dim_id(dt, i)
 
-            all_names: list[str] = []
-            for names in self.dimtype_to_names.values():
-                all_names.extend(names)
-            if len(all_names) != len(set(all_names)):
-                raise ValueError("names must be unique across dim types")
+        if len(name_to_dim) != nnames:
+            raise ValueError("names must be unique across dim types")
+
+        object.__setattr__(self, "dimtype_to_names", dimtype_to_names)
+        object.__setattr__(self, "name_to_dim", name_to_dim)
+        object.__setattr__(self, "_hash", hash((cls, dimtype_to_names)))
+
+        with _SPACE_LOCK:
+            return cast("Self", _SPACE_INTERN_TABLE.setdefault(dimtype_to_names, self))
+
+    @override
+    def __reduce__(self) -> tuple[type[Space], tuple[DimTypeToNames]]:
+        return (Space, (self.dimtype_to_names,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Space(dimtype_to_names={self.dimtype_to_names!r})"
 
     @staticmethod
     def from_names(
@@ -616,13 +1084,11 @@ class Space:
 
     @override
     def __hash__(self) -> int:
-        return hash((type(self), self.dimtype_to_names))
+        return self._hash
 
     def order_equals(self, other: Space) -> bool:
-        if self is other:
-            return True
-
-        return self.dimtype_to_names == other.dimtype_to_names
+        # Spaces are interned, so identity decides.
+        return self is other
 
     def semantically_equals(self, other: Space) -> bool:
         if self is other:
@@ -638,29 +1104,29 @@ class Space:
         return name in self.name_to_dim
 
     @property
-    def name_to_dim(self) -> NameToDim:
+    def dimtype_to_name_sets(self) -> Mapping[DimType, frozenset[str]]:
         try:
-            return self._name_to_dim_cache  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
+            return self._dimtype_to_name_sets_cache
         except AttributeError:
             pass
 
-        result = {name: DimId(dt, i)
-            for dt, names in self.dimtype_to_names.items()
-            for i, name in enumerate(names)}
-
-        object.__setattr__(self, "_name_to_dim_cache", result)
-        return result
-
-    @cached_property
-    def dimtype_to_name_sets(self) -> Mapping[DimType, frozenset[str]]:
-        return {
+        result = {
             dt: frozenset(names)
             for dt, names in self.dimtype_to_names.items()
         }
+        object.__setattr__(self, "_dimtype_to_name_sets_cache", result)
+        return result
 
-    @cached_property
+    @property
     def names(self) -> frozenset[str]:
-        return frozenset(self.name_to_dim.keys())
+        try:
+            return self._names_cache
+        except AttributeError:
+            pass
+
+        result = frozenset(self.name_to_dim.keys())
+        object.__setattr__(self, "_names_cache", result)
+        return result
 
     def dim_names(self, dim_type: DimType) -> frozenset[str]:
         return self.dimtype_to_name_sets[dim_type]
@@ -718,7 +1184,7 @@ class Space:
 
     def as_expr_space(self) -> Space:
         try:
-            return self._expr_space_cache  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
+            return self._expr_space_cache
         except AttributeError:
             pass
 
@@ -729,7 +1195,7 @@ class Space:
 
     def as_set_space(self) -> Space:
         try:
-            return self._set_space_cache  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
+            return self._set_space_cache
         except AttributeError:
             pass
 
@@ -739,10 +1205,16 @@ class Space:
         return result
 
     def as_isl(self, ctx: isl.Context | None = None) -> isl.Space:
-        if ctx is None:
-            ctx = isl.DEFAULT_CONTEXT
+        """The result is cached for :data:`islpy.DEFAULT_CONTEXT`."""
+        is_default_ctx = _is_default_context(ctx)
+        if is_default_ctx:
+            try:
+                return self._isl_space_cache
+            except AttributeError:
+                pass
+
         result = isl.Space.alloc(
-            ctx,
+            isl.DEFAULT_CONTEXT if ctx is None else ctx,
             nparam=len(self.dimtype_to_names.get(DimType.param, ())),
             n_in=len(self.dimtype_to_names.get(DimType.in_, ())),
             n_out=len(self.dimtype_to_names.get(DimType.out, ())),
@@ -752,16 +1224,24 @@ class Space:
             for i, name in enumerate(names):
                 result = result.set_dim_name(dim_type.as_isl(), i, name)
 
+        if is_default_ctx:
+            object.__setattr__(self, "_isl_space_cache", result)
         return result
 
     def as_isl_set_space(self, ctx: isl.Context | None = None) -> isl.Space:
-        if self.dimtype_to_names.get(DimType.in_, []):
+        """The result is cached for :data:`islpy.DEFAULT_CONTEXT`."""
+        if self.dimtype_to_names.get(DimType.in_):
             raise ValueError("in-dimensions not allowed")
 
-        if ctx is None:
-            ctx = isl.DEFAULT_CONTEXT
+        is_default_ctx = _is_default_context(ctx)
+        if is_default_ctx:
+            try:
+                return self._isl_set_space_cache
+            except AttributeError:
+                pass
+
         result = isl.Space.set_alloc(
-            ctx,
+            isl.DEFAULT_CONTEXT if ctx is None else ctx,
             nparam=len(self.dimtype_to_names.get(DimType.param, ())),
             dim=len(self.dimtype_to_names.get(DimType.out, ())),
         )
@@ -770,9 +1250,18 @@ class Space:
             for i, name in enumerate(names):
                 result = result.set_dim_name(dim_type.as_isl(), i, name)
 
+        if is_default_ctx:
+            object.__setattr__(self, "_isl_set_space_cache", result)
         return result
 
 
+def _is_default_context(ctx: isl.Context | None) -> bool:
+    # islpy creates new wrappers for the same context (e.g. in get_ctx()),
+    # which compare equal but do not hash equal (and are not weakly
+    # referenceable), so contexts other than the default one are not cached.
+    return ctx is None or ctx is isl.DEFAULT_CONTEXT or ctx == isl.DEFAULT_CONTEXT
+
+
 @dataclass(frozen=True, eq=False, repr=False)
 class NamedIslObject(Generic[IslObjectT_co]):
     # .. autoattribute:: _obj
@@ -794,6 +1283,8 @@ class NamedIslObject(Generic[IslObjectT_co]):
     _obj: IslObjectT_co
     space: Space
     _isl_names_ok: bool = False
+    # set lazily by __hash__
+    _hash_cache: int = field(init=False, repr=False, compare=False)
 
     _isl_type: ClassVar[type[IslObject]]
 
@@ -938,6 +1429,9 @@ class NamedIslObject(Generic[IslObjectT_co]):
         if self._isl_names_ok:
             return self._obj
 
+        # Concurrent callers may both restore names, which is harmless.
+        # _obj is replaced before the flag is set, so that a thread observing
+        # the flag also observes the renamed object.
         res = _restore_names(self._obj, self.space.dimtype_to_names)
         object.__setattr__(self, "_obj", res)
         object.__setattr__(self, "_isl_names_ok", True)
@@ -953,7 +1447,14 @@ class NamedIslObject(Generic[IslObjectT_co]):
 
     @override
     def __hash__(self) -> int:
-        return hash(self._obj)
+        try:
+            return self._hash_cache
+        except AttributeError:
+            pass
+
+        result = hash(self._obj)
+        object.__setattr__(self, "_hash_cache", result)
+        return result
 
     @override
     def __eq__(self, other: object) -> bool:
@@ -962,6 +1463,8 @@ class NamedIslObject(Generic[IslObjectT_co]):
         'mathematically exact' notion of equality as a different method
         that is more expensive to check for.
         """
+        if self is other:
+            return True
         if type(self) is not type(other):
             return NotImplemented
         other = cast("Self", other)
@@ -969,6 +1472,14 @@ class NamedIslObject(Generic[IslObjectT_co]):
         if not self.space.order_equals(other.space):
             return False
 
+        # If both hashes are known (e.g. in dict lookup), differing hashes
+        # decide without consulting isl.
+        try:
+            if self._hash_cache != other._hash_cache:
+                return False
+        except AttributeError:
+            pass
+
         return plain_is_equal(self._obj, other._obj)
 
     @override
@@ -979,12 +1490,684 @@ class NamedIslObject(Generic[IslObjectT_co]):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({str(self.as_isl())!r})"
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Self], tuple[object, ...]]:
+        # Only the names and the isl object travel; caches are recomputed
+        # on demand. Names in the isl object are restored before pickling,
+        # so the unpickled object does not need to restore them again.
+        return (_unpickle_named_isl_object,
+                (type(self), self._get_isl_pickle_state(), self.space))
+
+    def _get_isl_pickle_state(self) -> object:
+        return self.as_isl()
+
+    @classmethod
+    def _from_isl_pickle_state(cls, state: object, _space: Space, /) -> IslObject:
+        return cast("IslObject", state)
+
+
+def _unpickle_named_isl_object(
+            cls: type[NamedIslObjectT], state: object, space: Space
+        ) -> NamedIslObjectT:
+    return cls(cls._from_isl_pickle_state(state, space), space, _isl_names_ok=True)
+
+
+_PARSE_CACHE_SIZE = 1024
+
+
+def _parse_cached(
+            make: Callable[[IslObjectT], NamedIslObjectT],
+            parse: Callable[[str, isl.Context | None], IslObjectT],
+            src: str,
+            ctx: isl.Context | None,
+        ) -> NamedIslObjectT:
+    # Wrappers of contexts other than the default one compare equal but do
+    # not hash equal (cf. _is_default_context), so they would never hit the
+    # cache and only keep their contexts alive. Only parsing in the default
+    # context is cached.
+    if not _is_default_context(ctx):
+        return make(parse(src, ctx))
+    return cast("NamedIslObjectT", _parse_cached_in_default_context(make, parse, src))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_cached_in_default_context(
+            make: Callable[[IslObjectT], NamedIslObjectT],
+            parse: Callable[[str, isl.Context | None], IslObjectT],
+            src: str,
+        ) -> NamedIslObjectT:
+    # Named objects are immutable, so parsing results may be shared.
+    return make(parse(src, isl.DEFAULT_CONTEXT))
+
+
+def _make_many(
+            named_type: type[NamedIslObjectT],
+            parse: Callable[[str, isl.Context | None], IslObjectT],
+            normalize: Callable[[IslObjectT], IslObjectT] | None,
+            srcs: Iterable[str],
+            ctx: isl.Context | None,
+        ) -> list[NamedIslObjectT]:
+    # Inputs commonly share their header (e.g. "[n] -> { [i, j] : ..."), so
+    # spaces are shared among objects whose isl spaces print the same.
+    # Unnamed dimensions print like named ones, so those are checked for.
+    by_src: dict[str, NamedIslObjectT] = {}
+    by_header: dict[str, Space] = {}
+
+    result: list[NamedIslObjectT] = []
+    for src in srcs:
+        named = by_src.get(src)
+        if named is None:
+            obj = parse(src, ctx)
+            if normalize is not None:
+                obj = normalize(obj)
+            header = str(obj.get_space())
+            space = by_header.get(header)
+            if space is None or len(obj.get_var_dict()) != len(space.names):
+                space = Space.from_isl(obj, named_type.active_dim_types)
+                by_header[header] = space
+            named = by_src[src] = named_type(obj, space)
+        result.append(named)
+
+    return result
+
+
+def _estimate_size(obj: object) -> int:
+    """Estimate the memory footprint of *obj* in units of stored coefficients,
+    i.e. as the number of constraints (or pieces) times the number of
+    dimensions.
+    """
+    if not isinstance(obj, IslObject):
+        return 1
+
+    sp = obj.space
+    ncoefficients = 1 + sum(
+        sp.dim(dt) for dt in (isl.dim_type.param, isl.dim_type.in_, isl.dim_type.out))
+
+    if isinstance(obj, isl.Set):
+        nconstraints = sum(bset.n_constraint() for bset in obj.get_basic_sets())
+    elif isinstance(obj, isl.Map):
+        nconstraints = sum(bmap.n_constraint() for bmap in obj.get_basic_maps())
+    elif isinstance(obj, (isl.BasicSet, isl.BasicMap)):
+        nconstraints = obj.n_constraint()
+    elif isinstance(obj, (isl.PwAff, isl.PwQPolynomial, isl.PwMultiAff)):
+        nconstraints = obj.n_piece()
+    else:
+        nconstraints = 1
+
+    return max(nconstraints, 1) * ncoefficients
+
+
+@dataclass
+class CacheOperationStats:
+    """Usage statistics of a :class:`Cache`, for all or a single operation.
+
+    .. autoattribute:: hits
+    .. autoattribute:: identity_hits
+    .. autoattribute:: persistent_hits
+    .. autoattribute:: misses
+    .. autoattribute:: evictions
+    .. autoattribute:: comparisons
+    .. autoattribute:: max_chain_length
+    .. autoattribute:: time_saved
+    """
+
+    hits: int = 0
+
+    identity_hits: int = 0
+    """The number of :attr:`hits` found by the identity of the arguments,
+    without hashing or comparing them."""
+
+    persistent_hits: int = 0
+    """The number of :attr:`hits` served from the persistent store
+    of the :class:`Cache`."""
+
+    misses: int = 0
+    evictions: int = 0
+
+    comparisons: int = 0
+    """The number of (plain) equality comparisons against cached arguments
+    with matching hash."""
+
+    max_chain_length: int = 0
+    """The largest number of cached arguments with matching hash
+    encountered in a lookup."""
+
+    time_saved: float = 0
+    """The time (in seconds) originally spent computing the results that
+    were later returned from the cache."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of the usage statistics of a :class:`Cache`.
+
+    .. autoattribute:: total
+    .. autoattribute:: by_operation
+    """
+
+    total: CacheOperationStats
+
+    by_operation: Mapping[str, CacheOperationStats]
+    """Statistics by the :attr:`~definition.__qualname__` of the wrapped
+    operation, e.g. ``"Set.dim_max"``."""
+
+
+_PERSISTENT_CACHE_FORMAT_VERSION = 2
+
+_PERSISTABLE_ISL_TYPES: Mapping[str, type[IslObject]] = {
+    isl_type.__name__: isl_type
+    for isl_type in (
+        isl.BasicSet, isl.Set, isl.BasicMap, isl.Map,
+        isl.Aff, isl.PwAff, isl.MultiAff, isl.PwMultiAff, isl.PwQPolynomial)
+}
+
+
+def _with_canonical_dim_names(obj: IslObjectT) -> IslObjectT:
+    # Names of non-parameter dimensions held by the isl objects underlying
+    # named objects may be stale (cf. NamedIslObject.as_isl), and isl does
+    # not use them to match dimensions. Replace them by positional ones.
+    space = obj.get_space()
+    for dt in (DimType.in_, DimType.out):
+        for i in range(space.dim(dt.as_isl())):
+            if space.get_dim_name(dt.as_isl(), i) is not None:
+                obj = _set_dim_name(obj, dt, i, f"_nisl_{dt.name.rstrip('_')}{i}")
+    return obj
+
+
+def _canonical_arg(arg: object) -> str | None:
+    if isinstance(arg, tuple):
+        canonical_items: list[str] = []
+        for item in cast("tuple[object, ...]", arg):
+            canonical_item = _canonical_arg(item)
+            if canonical_item is None:
+                return None
+            canonical_items.append(canonical_item)
+        return f"({', '.join(canonical_items)},)"
+
+    if type(arg) in (bool, int, str, type(None), isl.dim_type):
+        return repr(arg)
+
+    if isinstance(arg, IslObject):
+        if _PERSISTABLE_ISL_TYPES.get(type(arg).__name__) is not type(arg):
+            return None
+        return f"{type(arg).__name__}({str(_with_canonical_dim_names(arg))!r})"
+
+    return None
+
+
+def _persistent_cache_key(
+            op_name: str,
+            obj: IslObject,
+            args: tuple[object, ...],
+            kwargs: Mapping[str, object],
+        ) -> str | None:
+    """Return a key identifying the result of *op_name* applied to *obj*,
+    stable across processes, or *None* if the arguments have no canonical
+    textual form.
+    """
+    from hashlib import sha256
+
+    canonical_obj = _canonical_arg(obj)
+    canonical_args = _canonical_arg((*args, *sorted(kwargs.items())))
+    if canonical_obj is None or canonical_args is None:
+        return None
+
+    key_data = "\0".join([
+        str(_PERSISTENT_CACHE_FORMAT_VERSION),
+        op_name,
+        canonical_obj,
+        canonical_args,
+    ])
+    return sha256(key_data.encode()).hexdigest()
+
+
+def _serialize_result(result: object) -> tuple[str, str] | None:
+    if type(result) in (bool, int):
+        return type(result).__name__, repr(result)
+
+    type_name = type(result).__name__
+    if _PERSISTABLE_ISL_TYPES.get(type_name) is type(result):
+        return type_name, str(_with_canonical_dim_names(cast("IslObject", result)))
+
+    return None
+
+
+def _deserialize_result(type_name: str, value: str, ctx: isl.Context) -> object:
+    if type_name == "bool":
+        return value == "True"
+    if type_name == "int":
+        return int(value)
+
+    return _PERSISTABLE_ISL_TYPES[type_name].read_from_str(ctx, value)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+
+
+class _PersistentStore:
+    """An SQLite-backed store of serialized results, see :class:`Cache`."""
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        import sqlite3
+
+        # The connection is shared among threads, serialize access to it.
+        self._lock: Lock = Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False)
+        # allow concurrent readers while another process writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, "
+            "type TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "compute_time REAL NOT NULL)")
+
+    def get(self, key: str) -> tuple[str, str, float] | None:
+        with self._lock:
+            return cast("tuple[str, str, float] | None", self._connection.execute(
+                "SELECT type, value, compute_time FROM results WHERE key = ?",
+                (key,)).fetchone())
+
+    def put(self, key: str, type_name: str, value: str, compute_time: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, type_name, value, compute_time))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class _OperandKey(NamedTuple):
+    """Stands in for an isl object among the arguments in the key of a cache
+    entry. The objects themselves are compared separately."""
+    type: type[IslObject]
+    hash: int
+
+
+class _OperandId(NamedTuple):
+    """Stands in for an isl object among the arguments in the identity key
+    of a cache entry."""
+    id: int
+
+
+class _CacheEntry(NamedTuple):
+    operands: tuple[IslObject, ...]
+    result: object
+    size: int
+    compute_time: float
+    op_name: str
+
+
+class _IdentityEntry(NamedTuple):
+    key: Hashable
+    # keeps the operands alive, so that their ids are not reused
+    operands: tuple[IslObject, ...]
+    entry: _CacheEntry
+    # Nonzero only for aliases, i.e. entries for operands other than those
+    # of *entry*, which count towards the limits of the cache.
+    size: int
+
 
 class Cache:
-    _cache: dict[Hashable, list[tuple[IslObject, object]]]
+    """A cache for the results of (expensive) isl operations, to be passed
+    as the *cache* argument of methods that support it.
+
+    :arg maxsize: The maximum number of cached results. If exceeded, the
+        least recently used results are evicted. *None* means unbounded.
+    :arg max_memory: A budget for the estimated size of the cached arguments
+        and results, in units of stored coefficients (roughly, the number of
+        constraints times the number of dimensions of each object). If
+        exceeded, the least recently used results are evicted. *None* means
+        unbounded.
+    :arg persistent_path: If given, the path of an SQLite database in which
+        results are additionally stored, so that they survive the current
+        process. The database is created if it does not exist, and it may be
+        shared among processes. Results are keyed by the operation, the
+        printed form of its (isl) argument and its remaining arguments.
+        Names of dimensions other than parameters are not part of the key,
+        and they are not preserved in stored results.
+        Only results that are isl sets, maps, or (piecewise) expressions
+        (other than :class:`islpy.QPolynomial`), or :class:`bool` or
+        :class:`int` are stored. The limits above do not apply to the
+        persistent store.
+
+    Repeated lookups with the identical (Python) operand objects are served
+    from a first-level table keyed by object identity, avoiding isl hashing
+    and equality comparison altogether. (isl objects cannot be weakly
+    referenced, so this table holds on to the operands for as long as the
+    corresponding result is cached.) Entries in this table for operands that
+    are equal to, but distinct from, those of a cached result count towards
+    *maxsize* and *max_memory* like results do, and they are evicted (least
+    recently used first) before any result.
+
+    A cache may be shared among threads. Its bookkeeping is protected by
+    a lock that is not held while isl operations run, so that concurrent
+    misses on the same arguments may compute the result more than once.
+
+    .. automethod:: clear
+    .. automethod:: close
+    .. automethod:: __len__
+    .. automethod:: stats
+    """
+    maxsize: int | None
+    max_memory: int | None
+
+    _cache: OrderedDict[Hashable, list[_CacheEntry]]
+    _identity: dict[Hashable, _IdentityEntry]
+    _identity_keys: dict[Hashable, set[Hashable]]
+    _identity_aliases: OrderedDict[Hashable, None]
+    _nentries: int
+    _memory: int
+    _stats: dict[str, CacheOperationStats]
+    _store: _PersistentStore | None
+    _lock: Lock
+
+    def __init__(self,
+                maxsize: int | None = None,
+                max_memory: int | None = None,
+                *, persistent_path: str | PathLike[str] | None = None,
+            ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if max_memory is not None and max_memory < 0:
+            raise ValueError("max_memory must be non-negative")
+
+        self.maxsize = maxsize
+        self.max_memory = max_memory
+
+        self._lock = Lock()
+        self._cache = OrderedDict()
+        self._identity = {}
+        self._identity_keys = {}
+        self._identity_aliases = OrderedDict()
+        self._nentries = 0
+        self._memory = 0
+        self._stats = {}
+
+        self._store = (
+            _PersistentStore(persistent_path)
+            if persistent_path is not None else None)
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        with self._lock:
+            return self._nentries
+
+    def clear(self) -> None:
+        """Remove all cached results held in memory. Usage statistics and
+        the persistent store are retained."""
+        with self._lock:
+            self._cache.clear()
+            self._identity.clear()
+            self._identity_keys.clear()
+            self._identity_aliases.clear()
+            self._nentries = 0
+            self._memory = 0
+
+    def close(self) -> None:
+        """Close the persistent store, if any. Afterwards, this cache
+        only keeps results in memory. Must not be called while the cache
+        is in use by other threads."""
+        with self._lock:
+            store, self._store = self._store, None
+        if store is not None:
+            store.close()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the usage statistics of this cache."""
+        from dataclasses import replace
+
+        with self._lock:
+            by_operation = {
+                op_name: replace(op_stats)
+                for op_name, op_stats in self._stats.items()}
+
+        total = CacheOperationStats()
+        for op_stats in by_operation.values():
+            total.hits += op_stats.hits
+            total.identity_hits += op_stats.identity_hits
+            total.persistent_hits += op_stats.persistent_hits
+            total.misses += op_stats.misses
+            total.evictions += op_stats.evictions
+            total.comparisons += op_stats.comparisons
+            total.max_chain_length = max(
+                total.max_chain_length, op_stats.max_chain_length)
+            total.time_saved += op_stats.time_saved
+
+        return CacheStats(total=total, by_operation=by_operation)
+
+    def _get_op_stats(self, op_name: str) -> CacheOperationStats:
+        # Must be called with self._lock held.
+        try:
+            return self._stats[op_name]
+        except KeyError:
+            result = self._stats[op_name] = CacheOperationStats()
+            return result
+
+    def _remember_identity(
+                self,
+                identity_key: Hashable, key: Hashable,
+                operands: tuple[IslObject, ...], entry: _CacheEntry,
+                size: int = 0,
+            ) -> None:
+        # Must be called with self._lock held.
+        if key not in self._cache or identity_key in self._identity:
+            return
+
+        self._identity[identity_key] = _IdentityEntry(key, operands, entry, size)
+        self._identity_keys.setdefault(key, set()).add(identity_key)
+        if operands is not entry.operands:
+            self._identity_aliases[identity_key] = None
+            self._memory += size
+
+    def _forget_identity(self, identity_key: Hashable) -> None:
+        # Must be called with self._lock held.
+        identity_entry = self._identity.pop(identity_key)
+        if identity_key in self._identity_aliases:
+            del self._identity_aliases[identity_key]
+            self._memory -= identity_entry.size
+
+    def _lookup_identity(
+                self, identity_key: Hashable, op_name: str
+            ) -> tuple[bool, object]:
+        with self._lock:
+            try:
+                identity_entry = self._identity[identity_key]
+            except KeyError:
+                return False, None
+
+            self._cache.move_to_end(identity_entry.key)
+            if identity_key in self._identity_aliases:
+                self._identity_aliases.move_to_end(identity_key)
+            op_stats = self._get_op_stats(op_name)
+            op_stats.hits += 1
+            op_stats.identity_hits += 1
+            op_stats.time_saved += identity_entry.entry.compute_time
+            return True, identity_entry.entry.result
+
+    def _lookup(
+                self,
+                key: Hashable, identity_key: Hashable,
+                op_name: str, operands: tuple[IslObject, ...]
+            ) -> tuple[bool, object]:
+        with self._lock:
+            candidates = tuple(self._cache.get(key, ()))
+            op_stats = self._get_op_stats(op_name)
+            op_stats.max_chain_length = max(
+                op_stats.max_chain_length, len(candidates))
+
+        # This is so complicated because islpy's __eq__ doesn't route to
+        # plain_is_equal, but may instead use expensive forms of equality.
+        ncomparisons = 0
+        hit: _CacheEntry | None = None
+        for entry in candidates:
+            ncomparisons += 1
+            if all(plain_is_equal(operand, cand_operand)
+                   for operand, cand_operand in zip(
+                       operands, entry.operands, strict=True)):
+                hit = entry
+                break
+
+        alias_size = 0
+        if hit is not None and self.max_memory is not None:
+            alias_size = sum(_estimate_size(operand) for operand in operands)
+
+        with self._lock:
+            op_stats.comparisons += ncomparisons
+            if hit is None:
+                return False, None
+
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._remember_identity(
+                    identity_key, key, operands, hit, alias_size)
+                self._evict()
+            op_stats.hits += 1
+            op_stats.time_saved += hit.compute_time
+            return True, hit.result
+
+    def _call(
+                self,
+                f: Callable[..., R],
+                obj: IslObject,
+                args: tuple[object, ...],
+                kwargs: Mapping[str, object],
+            ) -> R:
+        from time import perf_counter
+
+        op_name = f.__qualname__
+
+        # isl objects among the arguments are operands, too
+        operands = (obj, *(arg for arg in args if isinstance(arg, IslObject)))
+        kwargs_key = constantdict(kwargs)
+
+        identity_key = (
+            f, id(obj),
+            tuple(
+                _OperandId(id(arg)) if isinstance(arg, IslObject) else arg
+                for arg in args),
+            kwargs_key)
+        found, result = self._lookup_identity(identity_key, op_name)
+        if found:
+            return cast("R", result)
+
+        key = (
+            f, _OperandKey(type(obj), hash(obj)),
+            tuple(
+                _OperandKey(type(arg), hash(arg))
+                if isinstance(arg, IslObject) else arg
+                for arg in args),
+            kwargs_key)
+        found, result = self._lookup(key, identity_key, op_name, operands)
+        if found:
+            return cast("R", result)
+
+        store = self._store
+        persistent_key = None
+        if store is not None:
+            persistent_key = _persistent_cache_key(op_name, obj, args, kwargs)
+            if persistent_key is not None:
+                stored = store.get(persistent_key)
+                if stored is not None:
+                    type_name, value, compute_time = stored
+                    result = _deserialize_result(type_name, value, obj.get_ctx())
+                    with self._lock:
+                        op_stats = self._get_op_stats(op_name)
+                        op_stats.hits += 1
+                        op_stats.persistent_hits += 1
+                        op_stats.time_saved += compute_time
+                    self._add(
+                        key, identity_key, op_name, operands, result, compute_time)
+                    return cast("R", result)
+
+        with self._lock:
+            self._get_op_stats(op_name).misses += 1
+
+        start_time = perf_counter()
+        result = f(obj, *args, **kwargs)
+        compute_time = perf_counter() - start_time
+
+        self._add(key, identity_key, op_name, operands, result, compute_time)
+
+        if store is not None and persistent_key is not None:
+            serialized = _serialize_result(result)
+            if serialized is not None:
+                store.put(persistent_key, *serialized, compute_time)
 
-    def __init__(self) -> None:
-        self._cache = {}
+        return result
+
+    def _add(self,
+                key: Hashable, identity_key: Hashable, op_name: str,
+                operands: tuple[IslObject, ...], result: object, compute_time: float,
+            ) -> None:
+        if self.max_memory is not None:
+            size = (
+                sum(_estimate_size(operand) for operand in operands)
+                + _estimate_size(result))
+        else:
+            size = 0
+
+        entry = _CacheEntry(operands, result, size, compute_time, op_name)
+        with self._lock:
+            self._cache.setdefault(key, []).append(entry)
+            self._cache.move_to_end(key)
+            self._remember_identity(identity_key, key, operands, entry)
+            self._nentries += 1
+            self._memory += size
+
+            self._evict()
+
+    def _over_limits(self) -> bool:
+        # Must be called with self._lock held.
+        return (
+            (self.maxsize is not None
+                and self._nentries + len(self._identity_aliases) > self.maxsize)
+            or (self.max_memory is not None and self._memory > self.max_memory))
+
+    def _evict(self) -> None:
+        # Must be called with self._lock held.
+        # Identity aliases only save a comparison, so they go first.
+        while self._identity_aliases and self._over_limits():
+            identity_key = next(iter(self._identity_aliases))
+            self._identity_keys[self._identity[identity_key].key].discard(
+                identity_key)
+            self._forget_identity(identity_key)
+
+        # Eviction happens by key, i.e. including all (rare) entries whose
+        # arguments only differ in ways not captured by their hash.
+        while self._cache and self._over_limits():
+            key, candidates = self._cache.popitem(last=False)
+            for identity_key in self._identity_keys.pop(key, ()):
+                self._forget_identity(identity_key)
+            self._nentries -= len(candidates)
+            for entry in candidates:
+                self._memory -= entry.size
+                self._get_op_stats(entry.op_name).evictions += 1
+
+
+_AMBIENT_CACHE: ContextVar[Cache | None] = ContextVar(
+    "namedisl_ambient_cache", default=None)
+
+
+@contextmanager
+def caching(cache: Cache) -> Generator[Cache, None, None]:
+    """Within the managed context, use *cache* for all operations that
+    accept a *cache* argument, unless another one is passed explicitly.
+
+    .. code-block:: python
+
+        with nisl.caching(nisl.Cache(maxsize=10_000)):
+            ...
+
+    The ambient cache is tracked in a :class:`contextvars.ContextVar`, so
+    that it is local to the current thread or :mod:`asyncio` task (and
+    inherited by tasks created within the context). Contexts may be nested.
+    """
+    token = _AMBIENT_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _AMBIENT_CACHE.reset(token)
 
 
 def with_cache(
@@ -994,28 +2177,22 @@ def with_cache(
     *args: P.args,
     **kwargs: P.kwargs
 ) -> R:
+    """Return ``f(obj, *args, **kwargs)``, reusing a previously computed
+    result from *cache* (unless it is *None*) if available.
+
+    *obj* and any isl objects among *args* are the operands of *f*. They are
+    matched against previous calls by plain equality, the remaining arguments
+    by (hashable) equality.
+
+    If *cache* is *None*, the cache established by :func:`caching` (if any)
+    is used.
+    """
     if cache is None:
-        return f(obj, *args, **kwargs)
+        cache = _AMBIENT_CACHE.get()
+        if cache is None:
+            return f(obj, *args, **kwargs)
 
-    # This is so complicated because islpy's __eq__ doesn't route to plain_is_equal,
-    # but may instead use expensive forms of equality.
-    obj_hash = hash(obj)
-    key = (f, obj_hash, tuple(args), constantdict(kwargs))
-    try:
-        candidates = cast("list[tuple[IslObjectT, R]]", cache._cache[key])
-    except KeyError:
-        pass
-    else:
-        for cand_obj, result in candidates:
-            if plain_is_equal(obj, cand_obj):
-                return result
-
-    result = f(obj, *args, **kwargs)
-    cast(
-        "list[tuple[IslObjectT, R]]",
-        cache._cache.setdefault(key, [])
-    ).append((obj, result))
-    return result
+    return cache._call(f, obj, args, kwargs)
 
 
 def _dump_isl_space(sp: isl.Space):  # pyright: ignore[reportUnusedFunction]
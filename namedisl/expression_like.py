@@ -16,6 +16,7 @@ Piecewise quasi-affine expression
 ---------------------------------
 .. autoclass:: PwAff
 .. autofunction:: make_pw_aff
+.. autofunction:: make_pw_affs
 .. autofunction:: pw_affs_from_domain_space
 
 Quasipolynomial term
@@ -71,7 +72,7 @@ THE SOFTWARE.
 """
 
 import operator
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from functools import cached_property
 from typing import (
@@ -88,6 +89,7 @@ from typing_extensions import Self, override
 import islpy as isl
 
 from .core import (
+    Cache,
     DimType,
     IslAffLikeT_co,
     IslExpressionLikeT,
@@ -100,15 +102,21 @@ from .core import (
     IslScalarExpressionLikeT_co,
     NamedIslObject,
     Space,
+    _make_many,
+    _parse_cached,
     add_mro_docstrings,
     align_expr_and_set,
     align_two,
+    with_cache,
 )
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
     from .set_like import Point, Set
 
 
@@ -129,6 +137,12 @@ def _unparam_expr_domain(obj: IslExpressionLikeT) -> IslExpressionLikeT:
     return cast("IslExpressionLikeT", obj.add_dims(dt, 0))
 
 
+def _normalize_expr(obj: IslExpressionLikeT) -> IslExpressionLikeT:
+    if obj.get_domain_space().is_params():
+        obj = _unparam_expr_domain(obj)
+    return obj
+
+
 def _align_two_expr_likes(
     lhs: _NamedExpressionLike[IslScalarExpressionLikeT],
     rhs: _NamedExpressionLike[IslScalarExpressionLikeT],
@@ -441,9 +455,10 @@ def make_aff(src: isl.Aff) -> Aff:
 
 
 def make_aff(src: str | isl.Aff, ctx: isl.Context | None = None) -> Aff:
-    obj = isl.Aff(src, ctx) if isinstance(src, str) else src
-    if obj.get_domain_space().is_params():
-        obj = _unparam_expr_domain(obj)
+    if isinstance(src, str):
+        return _parse_cached(make_aff, isl.Aff, src, ctx)
+
+    obj = _normalize_expr(src)
     return Aff(obj, Space.from_isl(obj, Aff.active_dim_types))
 
 
@@ -533,11 +548,220 @@ class Constraint(_NamedHasCoefficients[isl.Constraint]):
             isl.BasicMap.universe(self._obj.get_space()) .add_constraint(self._obj),
             self.space)
 
+    @override
+    def _get_isl_pickle_state(self) -> object:
+        # isl constraints do not pickle. Constraints are stored as their
+        # coefficients along with the div definitions of their local space.
+        c = self._obj
+        is_set = c.get_space().is_set()
+        div_ls = c.get_local_space() if is_set else c.get_local_space().wrap()
+        return (
+            is_set,
+            c.is_equality(),
+            tuple(_div_definition(div_ls, i)
+                  for i in range(div_ls.dim(isl.dim_type.div))),
+            (*(str(c.get_coefficient_val(dt, i))
+               for dt in (*_CONSTRAINT_DIM_TYPES, isl.dim_type.div)
+               for i in range(c.dim(dt))),
+             str(c.get_constant_val())))
+
+    @override
+    @classmethod
+    def _from_isl_pickle_state(cls, state: object, space: Space) -> IslObject:
+        is_set, is_equality, divs, coeffs = cast(
+            "tuple[bool, bool, tuple[tuple[str, ...], ...], tuple[str, ...]]",
+            state)
+        isl_space = space.as_isl_set_space() if is_set else space.as_isl()
+        ctx = isl_space.get_ctx()
+
+        # Divs of map local spaces are built on the wrapped space. isl keeps
+        # the divs of a local space sorted when merging, so their order may
+        # differ from the pickled one. Divs are hence tracked by their
+        # (printed) definitions.
+        ls = isl.LocalSpace.from_space(isl_space if is_set else isl_space.wrap())
+        definitions: list[str] = []
+        positions: list[int] = []
+        for div in divs:
+            aff = isl.Aff.zero_on_domain(ls)
+            if len(div) != 1 + sum(
+                    aff.dim(dt) for dt in _DIV_DIM_TYPES) + len(positions):
+                raise ValueError("unable to restore pickled constraint")
+            vals_iter = (isl.Val(v, ctx) for v in div)
+            for dt in _DIV_DIM_TYPES:
+                for i in range(aff.dim(dt)):
+                    aff = aff.set_coefficient_val(dt, i, next(vals_iter))
+            for i in positions:
+                aff = aff.set_coefficient_val(isl.dim_type.div, i, next(vals_iter))
+            aff = aff.set_constant_val(next(vals_iter))
+
+            definitions.append(str(aff))
+            ls = ls.intersect(
+                isl.Constraint.inequality_from_aff(aff.floor()).get_local_space())
+            positions = _div_positions(ls, definitions)
+
+        if not is_set:
+            # Unwrapping simplifies, so keep the divs alive with a constraint
+            # involving all of them.
+            keep = isl.Constraint.alloc_inequality(ls)
+            for i in range(ls.dim(isl.dim_type.div)):
+                keep = keep.set_coefficient_val(
+                    isl.dim_type.div, i, isl.Val(1, ctx))
+            ls = isl.BasicSet.from_constraint(keep).unwrap().get_local_space()
+            positions = _div_positions(ls.wrap(), definitions)
+
+        c = (isl.Constraint.alloc_equality(ls) if is_equality
+             else isl.Constraint.alloc_inequality(ls))
+        if len(coeffs) != 1 + sum(
+                c.dim(dt) for dt in _CONSTRAINT_DIM_TYPES) + len(positions):
+            raise ValueError("unable to restore pickled constraint")
+        coeffs_iter = (isl.Val(v, ctx) for v in coeffs)
+        for dt in _CONSTRAINT_DIM_TYPES:
+            for i in range(c.dim(dt)):
+                c = c.set_coefficient_val(dt, i, next(coeffs_iter))
+        for i in positions:
+            c = c.set_coefficient_val(isl.dim_type.div, i, next(coeffs_iter))
+        return c.set_constant_val(next(coeffs_iter))
+
+
+_CONSTRAINT_DIM_TYPES = (isl.dim_type.param, isl.dim_type.in_, isl.dim_type.out)
+_DIV_DIM_TYPES = (isl.dim_type.param, isl.dim_type.in_)
+
+
+def _div_definition(ls: isl.LocalSpace, pos: int) -> tuple[str, ...]:
+    # A div only depends on the divs preceding it.
+    div = ls.get_div(pos)
+    return (*(str(div.get_coefficient_val(dt, i))
+              for dt in _DIV_DIM_TYPES for i in range(div.dim(dt))),
+            *(str(div.get_coefficient_val(isl.dim_type.div, i))
+              for i in range(pos)),
+            str(div.get_constant_val()))
+
+
+def _div_positions(ls: isl.LocalSpace, definitions: Sequence[str]) -> list[int]:
+    ls_definitions = [
+        str(ls.get_div(i)) for i in range(ls.dim(isl.dim_type.div))]
+    try:
+        return [ls_definitions.index(d) for d in definitions]
+    except ValueError:
+        raise ValueError("unable to restore pickled constraint") from None
+
 
 def make_constraint(obj: isl.Constraint) -> Constraint:
     return Constraint(obj, Space.from_isl(obj, Constraint.active_dim_types))
 
 
+# {{{ vectorized evaluation
+
+def _aff_row(aff: isl.Aff) -> tuple[list[int], int]:
+    # Integer coefficients of *aff* over [*params, *dims, *divs, 1], and the
+    # common denominator.
+    den = aff.get_denominator_val()
+    row = [
+        (aff.get_coefficient_val(dt, i) * den).to_python()
+        for dt in (isl.dim_type.param, isl.dim_type.in_, isl.dim_type.div)
+        for i in range(aff.dim(dt))]
+    row.append((aff.get_constant_val() * den).to_python())
+    return row, den.to_python()
+
+
+def _div_rows(obj: isl.Aff | isl.LocalSpace) -> list[tuple[list[int], int]]:
+    # Each div is the floor of an affine expression that may involve
+    # the divs before it.
+    return [_aff_row(obj.get_div(i)) for i in range(obj.dim(isl.dim_type.div))]
+
+
+def _eval_row(
+            row: Sequence[int],
+            cols: Sequence[NDArray[np.int64]],
+            npoints: int,
+        ) -> NDArray[np.int64]:
+    import numpy as np
+
+    # Integer matmul is not BLAS-backed, skip zero coefficients. While
+    # evaluating divs, *cols* only has those before the current one,
+    # later ones have zero coefficients.
+    result = np.full(npoints, row[-1], dtype=np.int64)
+    for coeff, col in zip(row, cols, strict=False):
+        if coeff:
+            result += coeff * col
+    return result
+
+
+def _eval_divs(
+            div_rows: Sequence[tuple[Sequence[int], int]],
+            base_cols: Sequence[NDArray[np.int64]],
+            npoints: int,
+        ) -> list[NDArray[np.int64]]:
+    cols = list(base_cols)
+    for row, den in div_rows:
+        cols.append(_eval_row(row, cols, npoints) // den)
+    return cols
+
+
+@dataclass(frozen=True)
+class _VectorizedBasicSet:
+    div_rows: Sequence[tuple[Sequence[int], int]]
+    eq: Sequence[Sequence[int]]
+    ineq: Sequence[Sequence[int]]
+
+    @staticmethod
+    def from_isl(bset: isl.BasicSet) -> _VectorizedBasicSet:
+        from .set_like import _SET_MATRIX_DIM_TYPES, _isl_mat_to_rows
+        return _VectorizedBasicSet(
+            _div_rows(bset.get_local_space()),
+            _isl_mat_to_rows(bset.equalities_matrix(*_SET_MATRIX_DIM_TYPES)),
+            _isl_mat_to_rows(bset.inequalities_matrix(*_SET_MATRIX_DIM_TYPES)))
+
+    def contains(
+                self, base_cols: Sequence[NDArray[np.int64]], npoints: int
+            ) -> NDArray[np.bool_]:
+        import numpy as np
+
+        cols = _eval_divs(self.div_rows, base_cols, npoints)
+        result: NDArray[np.bool_] = np.ones(npoints, dtype=bool)
+        for row in self.eq:
+            result &= np.equal(_eval_row(row, cols, npoints), 0)
+        for row in self.ineq:
+            result &= _eval_row(row, cols, npoints) >= 0
+        return result
+
+
+@dataclass(frozen=True)
+class _VectorizedPiece:
+    domain: Sequence[_VectorizedBasicSet]
+    div_rows: Sequence[tuple[Sequence[int], int]]
+    row: Sequence[int]
+    den: int
+
+    @staticmethod
+    def from_isl(set_: isl.Set, aff: isl.Aff) -> _VectorizedPiece:
+        # compute_divs makes sure each div of the domain has an explicit
+        # definition, so that it can be evaluated.
+        return _VectorizedPiece(
+            [_VectorizedBasicSet.from_isl(bset)
+             for bset in set_.compute_divs().get_basic_sets()],
+            _div_rows(aff),
+            *_aff_row(aff))
+
+    def contains(
+                self, base_cols: Sequence[NDArray[np.int64]], npoints: int
+            ) -> NDArray[np.bool_]:
+        import numpy as np
+
+        result = np.zeros(npoints, dtype=bool)
+        for bset in self.domain:
+            result |= bset.contains(base_cols, npoints)
+        return result
+
+    def eval_numerator(
+                self, base_cols: Sequence[NDArray[np.int64]], npoints: int
+            ) -> NDArray[np.int64]:
+        return _eval_row(
+            self.row, _eval_divs(self.div_rows, base_cols, npoints), npoints)
+
+# }}}
+
+
 @add_mro_docstrings
 class PwAff(_NamedAffLike[isl.PwAff]):
     """
@@ -556,6 +780,7 @@ class PwAff(_NamedAffLike[isl.PwAff]):
     .. automethod:: max
     .. automethod:: min
     .. automethod:: aggregate_domain
+    .. automethod:: eval_many
     .. automethod:: union_max
     .. automethod:: union_min
     .. automethod:: union_add
@@ -643,13 +868,17 @@ class PwAff(_NamedAffLike[isl.PwAff]):
     def gt_set(self, rhs: int | PwAff) -> Set: return self.where(">", rhs)
     def lt_set(self, rhs: int | PwAff) -> Set: return self.where("<", rhs)
 
-    def max(self, other: PwAff) -> PwAff:
+    def max(self, other: PwAff, *, cache: Cache | None = None) -> PwAff:
         self_a, other_a = _align_two_expr_likes(self, other)
-        return PwAff(self_a._obj.max(other_a._obj), self_a.space)
+        return PwAff(
+            with_cache(cache, isl.PwAff.max, self_a._obj, other_a._obj),
+            self_a.space)
 
-    def min(self, other: PwAff) -> PwAff:
+    def min(self, other: PwAff, *, cache: Cache | None = None) -> PwAff:
         self_a, other_a = _align_two_expr_likes(self, other)
-        return PwAff(self_a._obj.min(other_a._obj), self_a.space)
+        return PwAff(
+            with_cache(cache, isl.PwAff.min, self_a._obj, other_a._obj),
+            self_a.space)
 
     def pieces(self) -> list[tuple[Set, Aff]]:
         set_space = self.space.as_set_space()
@@ -661,8 +890,9 @@ class PwAff(_NamedAffLike[isl.PwAff]):
             for set, aff in self._obj.get_pieces()
         ]
 
-    def coalesce(self) -> Self:
-        return type(self)(self._obj.coalesce(), self.space)
+    def coalesce(self, *, cache: Cache | None = None) -> Self:
+        return type(self)(
+            with_cache(cache, type(self._obj).coalesce, self._obj), self.space)
 
     def aggregate_domain(self) -> Set:
         from .set_like import Set
@@ -671,6 +901,79 @@ class PwAff(_NamedAffLike[isl.PwAff]):
             agg_domain.from_params() if agg_domain.is_params() else agg_domain,
             self.space.as_set_space())
 
+    @cached_property
+    def _vectorized_pieces(self) -> list[_VectorizedPiece]:
+        return [_VectorizedPiece.from_isl(set_, aff)
+                for set_, aff in self._obj.get_pieces()]
+
+    def eval_many(
+                self, points: ArrayLike | Mapping[str, ArrayLike]
+            ) -> np.ma.MaskedArray[tuple[int, ...], np.dtype[np.int64]]:
+        """Evaluate *self* at many points at once, using integer
+        :mod:`numpy` arithmetic instead of one :meth:`eval` per point.
+        Requires :mod:`numpy`.
+
+        *points* is either a mapping from each dimension name to an array of
+        coordinates (arrays are broadcast against each other), or a
+        two-dimensional array with one row per point, whose columns correspond
+        to the parameters, followed by the 'in' dimensions, in the order of
+        :attr:`space`.
+
+        Returns a :class:`numpy.ma.MaskedArray` of :class:`numpy.int64`, in
+        which points outside the domain of *self* are masked. Arithmetic is
+        carried out in 64-bit integers without overflow checks.
+
+        :raises ValueError: if a value within the domain is not an integer.
+        """
+        import numpy as np
+
+        names = (*self.space.dimtype_to_names.get(DimType.param, ()),
+                 *self.space.dimtype_to_names.get(DimType.in_, ()))
+
+        arrays: list[NDArray[np.generic]]
+        shape: tuple[int, ...]
+        if isinstance(points, Mapping):
+            if set(points) != set(names):
+                raise ValueError(
+                    f"expected values for {sorted(names)}, got {sorted(points)}")
+            arrays = list(np.broadcast_arrays(
+                *(np.asarray(points[name]) for name in names)))
+            shape = arrays[0].shape if arrays else ()
+        else:
+            arr = np.asarray(points)
+            shape = arr.shape
+            if len(shape) != 2 or shape[1] != len(names):
+                raise ValueError(
+                    f"expected array of shape (npoints, {len(names)}), "
+                    f"got {shape}")
+            arrays = [arr[:, i] for i in range(len(names))]
+            shape = shape[:1]
+
+        for array in arrays:
+            if array.size and array.dtype.kind not in "iu":
+                raise TypeError(f"expected integer array, got '{array.dtype}'")
+        cols = [array.astype(np.int64).ravel() for array in arrays]
+
+        npoints = int(np.prod(shape))
+        values = np.zeros(npoints, dtype=np.int64)
+        in_domain = np.zeros(npoints, dtype=bool)
+        for piece in self._vectorized_pieces:
+            in_piece = piece.contains(cols, npoints)
+            npiece = int(np.count_nonzero(in_piece))
+            if not npiece:
+                continue
+
+            num = piece.eval_numerator([col[in_piece] for col in cols], npiece)
+            if piece.den != 1:
+                if (num % piece.den).any():
+                    raise ValueError("expression takes non-integer values")
+                num //= piece.den
+            values[in_piece] = num
+            in_domain |= in_piece
+
+        return np.ma.MaskedArray(
+            np.reshape(values, shape), mask=np.reshape(~in_domain, shape))
+
     def union_max(self, other: PwAff) -> Self:
         self_a, other_a = _align_two_expr_likes(self, other)
         return type(self)(self_a._obj.union_max(other_a._obj), self_a.space)
@@ -700,13 +1003,23 @@ def make_pw_aff(src: isl.PwAff) -> PwAff:
 def make_pw_aff(src: str | isl.PwAff, ctx: isl.Context | None = None) -> PwAff:
     """
     Create a :class:`PwAff` from isl syntax or an :class:`islpy.PwAff`.
+    Results of parsing in :data:`islpy.DEFAULT_CONTEXT` are cached.
     """
-    obj = isl.PwAff(src, ctx) if isinstance(src, str) else src
-    if obj.get_domain_space().is_params():
-        obj = _unparam_expr_domain(obj)
+    if isinstance(src, str):
+        return _parse_cached(make_pw_aff, isl.PwAff, src, ctx)
+
+    obj = _normalize_expr(src)
     return PwAff(obj, Space.from_isl(obj, PwAff. active_dim_types))
 
 
+def make_pw_affs(srcs: Iterable[str], ctx: isl.Context | None = None) -> list[PwAff]:
+    r"""
+    Create :class:`PwAff`\ s from isl syntax, sharing work (and
+    :class:`Space`\ s) among inputs with identical dimensions.
+    """
+    return _make_many(PwAff, isl.PwAff, _normalize_expr, srcs, ctx)
+
+
 @dataclass(frozen=True)
 class _PwAffMapping(Mapping[str | Literal[0], PwAff]):
     expr_space: Space
@@ -784,6 +1097,18 @@ class Term:
     def get_div_exp(self, index: int) -> int:
         return self._obj.get_exp(isl.dim_type.div, index)
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Term], tuple[object, ...]]:
+        return (_unpickle_term, (
+            isl.PwQPolynomial.from_qpolynomial(
+                isl.QPolynomial.from_term(self._obj)),
+            self.space))
+
+
+def _unpickle_term(pwqp: isl.PwQPolynomial, space: Space) -> Term:
+    term, = _qpolynomial_from_pw(pwqp).get_terms()
+    return Term(term, space)
+
 
 @add_mro_docstrings
 class QPolynomial(_NamedPolynomialLike[isl.QPolynomial]):
@@ -795,6 +1120,25 @@ class QPolynomial(_NamedPolynomialLike[isl.QPolynomial]):
     def terms(self) -> Sequence[Term]:
         return [Term(trm, self.space) for trm in self._obj.get_terms()]
 
+    @override
+    def _get_isl_pickle_state(self) -> object:
+        # isl quasi-polynomials do not pickle, but piecewise ones do.
+        return isl.PwQPolynomial.from_qpolynomial(self.as_isl())
+
+    @override
+    @classmethod
+    def _from_isl_pickle_state(cls, state: object, space: Space) -> IslObject:
+        return _qpolynomial_from_pw(cast("isl.PwQPolynomial", state))
+
+
+def _qpolynomial_from_pw(pwqp: isl.PwQPolynomial) -> isl.QPolynomial:
+    pieces = pwqp.get_pieces()
+    if not pieces:
+        # isl drops pieces that are identically zero
+        return isl.QPolynomial.zero_on_domain(pwqp.get_domain_space())
+    (_where, qpoly), = pieces
+    return qpoly
+
 
 @overload
 def make_qpolynomial(src: str, ctx: isl.Context | None = None) -> QPolynomial:
@@ -811,20 +1155,21 @@ def make_qpolynomial(
     """
     Create a :class:`QPolynomial` from isl syntax or an isl qpolynomial.
     """
-    # NOTE: ISL does not have a QPolynomial constructor, but we can make one
-    # here by first creating a PwQPolynomial, then taking the only QPolynomial
-    # that comes out of it :shrug:
     if isinstance(src, str):
-        (_where, obj), = isl.PwQPolynomial(src, ctx).get_pieces()
-    else:
-        obj = src
-
-    if obj.get_domain_space().is_params():
-        obj = _unparam_expr_domain(obj)
+        return _parse_cached(make_qpolynomial, _read_qpolynomial, src, ctx)
 
+    obj = _normalize_expr(src)
     return QPolynomial(obj, Space.from_isl(obj, QPolynomial.active_dim_types))
 
 
+def _read_qpolynomial(src: str, ctx: isl.Context | None) -> isl.QPolynomial:
+    # NOTE: ISL does not have a QPolynomial constructor, but we can make one
+    # here by first creating a PwQPolynomial, then taking the only QPolynomial
+    # that comes out of it :shrug:
+    (_where, obj), = isl.PwQPolynomial(src, ctx).get_pieces()
+    return obj
+
+
 @add_mro_docstrings
 class PwQPolynomial(_NamedPolynomialLike[isl.PwQPolynomial]):
     """
@@ -871,8 +1216,9 @@ class PwQPolynomial(_NamedPolynomialLike[isl.PwQPolynomial]):
             for set, qp in self._obj.get_pieces()
         ]
 
-    def coalesce(self) -> Self:
-        return type(self)(self._obj.coalesce(), self.space)
+    def coalesce(self, *, cache: Cache | None = None) -> Self:
+        return type(self)(
+            with_cache(cache, type(self._obj).coalesce, self._obj), self.space)
 
     def add_disjoint(self, other: Self) -> Self:
         self_a, other_a = _align_two_expr_likes(self, other)
@@ -898,9 +1244,10 @@ def make_pw_qpolynomial(
     """
     Create a :class:`PwQPolynomial` from isl syntax or an isl object.
     """
-    obj = isl.PwQPolynomial(src, ctx) if isinstance(src, str) else src
-    if obj.get_domain_space().is_params():
-        obj = _unparam_expr_domain(obj)
+    if isinstance(src, str):
+        return _parse_cached(make_pw_qpolynomial, isl.PwQPolynomial, src, ctx)
+
+    obj = _normalize_expr(src)
     return PwQPolynomial(
         obj,
         Space.from_isl(obj, PwQPolynomial.active_dim_types))
@@ -943,8 +1290,9 @@ def make_multi_aff(
     """
     Create a :class:`MultiAff` from isl syntax or an :class:`islpy.MultiAff`.
     """
-    obj = isl.MultiAff(src, ctx) if isinstance(src, str) else src
-    return MultiAff(obj, Space.from_isl(obj, MultiAff.active_dim_types))
+    if isinstance(src, str):
+        return _parse_cached(make_multi_aff, isl.MultiAff, src, ctx)
+    return MultiAff(src, Space.from_isl(src, MultiAff.active_dim_types))
 
 
 @add_mro_docstrings
@@ -983,7 +1331,8 @@ def make_pw_multi_aff(
         src: str | isl.PwMultiAff,
         ctx: isl.Context | None = None
     ) -> PwMultiAff:
-    obj = isl.PwMultiAff(src, ctx) if isinstance(src, str) else src
-    return PwMultiAff(obj, Space.from_isl(obj, PwMultiAff.active_dim_types))
+    if isinstance(src, str):
+        return _parse_cached(make_pw_multi_aff, isl.PwMultiAff, src, ctx)
+    return PwMultiAff(src, Space.from_isl(src, PwMultiAff.active_dim_types))
 
 # }}}
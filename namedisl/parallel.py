@@ -0,0 +1,140 @@
+"""
+Running independent operations in parallel
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Since :mod:`islpy` does not release the GIL, running independent, expensive
+operations (e.g. :meth:`namedisl.Set.coalesce` or :meth:`namedisl.Set.dim_max`)
+on many objects concurrently requires separate processes. The functions in
+this module distribute such work across a process pool. Named objects
+are transferred using their (compact) pickled form, see :ref:`pickling`.
+
+*op* must be picklable, i.e. it should be a module-level function or
+something like :func:`operator.methodcaller`. Results are
+returned in input order. Results computed by worker processes are
+transferred back by pickling, which places them in
+:data:`islpy.DEFAULT_CONTEXT` if the operands live there. Results computed in
+the calling process (see :func:`starmap`) are returned as *op* produced them,
+e.g. in the context of the operands.
+Exceptions raised by *op* (including :class:`islpy.Error`) are re-raised
+in the calling process.
+
+Caches (cf. :class:`namedisl.Cache`), including the ambient one set up by
+:func:`namedisl.caching`, are not shared with the worker processes.
+
+.. autofunction:: map
+.. autofunction:: starmap
+"""
+
+from __future__ import annotations
+
+
+__copyright__ = """
+Copyright (C) 2025- University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import starmap as _starmap
+from typing import TYPE_CHECKING, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+T = TypeVar("T")
+ResultT = TypeVar("ResultT")
+
+# Chunks per worker: enough to even out load imbalance between chunks,
+# few enough to amortize the per-chunk pickling overhead.
+_CHUNKS_PER_WORKER = 4
+
+
+def _get_nworkers(workers: int | None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers}")
+    return workers
+
+
+def _get_chunksize(nitems: int, nworkers: int, chunksize: int | None) -> int:
+    if chunksize is None:
+        return max(1, -(-nitems // (nworkers * _CHUNKS_PER_WORKER)))
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, got {chunksize}")
+    return chunksize
+
+
+def _call_unpacked(op: Callable[..., ResultT], args: tuple[object, ...]) -> ResultT:
+    return op(*args)
+
+
+def starmap(
+            op: Callable[..., ResultT],
+            args: Iterable[tuple[object, ...]],
+            *,
+            workers: int | None = None,
+            chunksize: int | None = None,
+        ) -> list[ResultT]:
+    """Return ``[op(*a) for a in args]``, computed on a pool of *workers*
+    processes (by default, one per CPU). Work is sent to the workers in
+    chunks of *chunksize* items, by default chosen so that each worker
+    receives a few chunks.
+
+    If only one worker is requested (or there is at most one item), *op*
+    is called in the calling process, and its results are returned
+    unchanged, i.e. they are not moved to :data:`islpy.DEFAULT_CONTEXT`.
+    """
+    args = list(args)
+    nworkers = min(_get_nworkers(workers), max(len(args), 1))
+    chunksize = _get_chunksize(len(args), nworkers, chunksize)
+
+    if nworkers == 1:
+        return list(_starmap(op, args))
+
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        return list(executor.map(
+            partial(_call_unpacked, op), args, chunksize=chunksize))
+
+
+def map(
+            op: Callable[[T], ResultT],
+            objs: Iterable[T],
+            *,
+            workers: int | None = None,
+            chunksize: int | None = None,
+        ) -> list[ResultT]:
+    """Return ``[op(obj) for obj in objs]``, computed in parallel as
+    described in :func:`starmap`.
+
+    .. code-block:: python
+
+        from operator import methodcaller
+        import namedisl.parallel
+
+        hulls = namedisl.parallel.map(methodcaller("convex_hull"), domains)
+    """
+    return starmap(op, ((obj,) for obj in objs),
+                   workers=workers, chunksize=chunksize)
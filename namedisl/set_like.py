@@ -9,11 +9,13 @@ Quasiconvex set
 ^^^^^^^^^^^^^^^
 .. autoclass:: BasicSet
 .. autofunction:: make_basic_set
+.. autoclass:: ConstraintMatrix
 
 General set
 ^^^^^^^^^^^
 .. autoclass:: Set
 .. autofunction:: make_set
+.. autofunction:: make_sets
 .. autoclass:: StrideInfo
 
 Quasiconvex map
@@ -25,6 +27,7 @@ General map
 ^^^^^^^^^^^
 .. autoclass:: Map
 .. autofunction:: make_map
+.. autofunction:: make_maps
 """
 
 from __future__ import annotations
@@ -55,12 +58,15 @@ THE SOFTWARE.
 """
 
 import operator
+import sys
+import zlib
+from array import array
 from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, ClassVar, Literal, cast, overload
 
 from constantdict import constantdict
-from typing_extensions import Self, override
+from typing_extensions import NamedTuple, Self, override
 
 import islpy as isl
 
@@ -74,12 +80,16 @@ from .core import (
     IslSetOrMapLike,
     IslSetOrMapLikeT,
     IslSetOrMapLikeT_co,
+    IslUnbasicT,
     IslUnbasicT_co,
     NamedIslObject,
     Space,
     _align_and_apply_binary_op,
+    _make_many,
+    _parse_cached,
     add_mro_docstrings,
     align_for_compostition,
+    align_many,
     align_two,
     chunked_dims_by_type,
     with_cache,
@@ -87,7 +97,17 @@ from .core import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Mapping, Sequence
+    from collections.abc import (
+        Callable,
+        Collection,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
 
     from .expression_like import (
         Aff,
@@ -101,14 +121,251 @@ if TYPE_CHECKING:
 def _compare_set_or_map_like(
     lhs: _NamedIslSetOrMapLike[IslSetOrMapLikeT],
     rhs: _NamedIslSetOrMapLike[IslSetOrMapLikeT],
-    op: Callable[[IslSetOrMapLikeT, IslSetOrMapLikeT], bool],
+    op_name: str,
+    cache: Cache | None = None,
 ) -> bool:
     if type(lhs) is not type(rhs):
         return NotImplemented
 
     aligned_lhs, aligned_rhs = align_two(lhs, rhs)
 
-    return op(aligned_lhs._obj, aligned_rhs._obj)
+    op = cast("Callable[[IslSetOrMapLikeT, IslSetOrMapLikeT], bool]",
+              getattr(type(aligned_lhs._obj), op_name))
+    return with_cache(cache, op, aligned_lhs._obj, aligned_rhs._obj)
+
+
+# Column order of constraint matrices. The constant comes last, matching
+# the order of coefficients in an affine constraint.
+_SET_MATRIX_DIM_TYPES = (
+    isl.dim_type.param, isl.dim_type.set, isl.dim_type.div, isl.dim_type.cst)
+_MAP_MATRIX_DIM_TYPES = (
+    isl.dim_type.param, isl.dim_type.in_, isl.dim_type.out, isl.dim_type.div,
+    isl.dim_type.cst)
+
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
+
+
+def _matrix_dim_types(is_set: bool) -> tuple[isl.dim_type, ...]:
+    return _SET_MATRIX_DIM_TYPES if is_set else _MAP_MATRIX_DIM_TYPES
+
+
+def _mat_element(val: isl.Val) -> int:
+    result = val.get_num_si()
+    if result == 0 and not val.is_zero():
+        # get_num_si returns zero if the value does not fit
+        return val.to_python()
+    return result
+
+
+def _isl_mat_to_rows(mat: isl.Mat) -> list[list[int]]:
+    ncols = mat.cols()
+    get = mat.get_element_val
+    return [
+        [_mat_element(get(i, j)) for j in range(ncols)]
+        for i in range(mat.rows())]
+
+
+_MAT_BLOCK_NROWS = 16
+
+
+def _isl_mat_from_rows(
+            ctx: isl.Context, rows: Sequence[Sequence[int]], ncols: int
+        ) -> isl.Mat:
+    # Each set_element_val copies the matrix, so blocks of rows are built
+    # separately and then concatenated pairwise, avoiding quadratic cost.
+    blocks: list[isl.Mat] = []
+    for start in range(0, len(rows), _MAT_BLOCK_NROWS):
+        block_rows = rows[start:start + _MAT_BLOCK_NROWS]
+        # isl_mat_alloc leaves entries uninitialized, added rows are zero.
+        mat = isl.Mat.alloc(ctx, 0, ncols).add_zero_rows(len(block_rows))
+        for i, row in enumerate(block_rows):
+            if len(row) != ncols:
+                raise ValueError(
+                    f"constraint matrix row has {len(row)} entries, "
+                    f"expected {ncols}")
+            for j, value in enumerate(row):
+                if value:
+                    mat = mat.set_element_val(
+                        i, j,
+                        value if _INT64_MIN <= value <= _INT64_MAX
+                        else isl.Val(str(value), ctx))
+        blocks.append(mat)
+
+    if not blocks:
+        return isl.Mat.alloc(ctx, 0, ncols)
+
+    while len(blocks) > 1:
+        blocks = [
+            blocks[i].concat(blocks[i+1]) if i + 1 < len(blocks) else blocks[i]
+            for i in range(0, len(blocks), 2)]
+    return blocks[0]
+
+
+# binary format, see to_bytes
+
+_BYTES_MAGIC = b"nisl"
+_BYTES_FORMAT_VERSION = 1
+_BYTES_KINDS = ("BasicSet", "Set", "BasicMap", "Map")
+_BYTES_DIM_TYPES = (DimType.param, DimType.in_, DimType.out)
+_BYTES_HEADER_SIZE = len(_BYTES_MAGIC) + 3
+
+# how the data following the header is stored
+_BYTES_UNCOMPRESSED = 0
+_BYTES_DEFLATE = 1
+
+# Coefficients of a basic set/map are stored as signed integers of the
+# smallest sufficient width in bytes, or as decimal text (width 0).
+_BYTES_DECIMAL = 0
+_BYTES_WIDTH_TO_TYPECODE = {array(tc).itemsize: tc for tc in "bhilq"}
+_BYTES_WIDTHS = (1, 2, 4, 8)
+
+
+def _pack_uint(buf: bytearray, value: int) -> None:
+    # LEB128: seven bits per byte, the high bit marks continuation
+    while value >= 0x80:
+        buf.append(value & 0x7f | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _unpack_uint(data: memoryview, offset: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated data")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def _get_div_rows(
+            basic: isl.BasicSet | isl.BasicMap, ncols: int
+        ) -> list[list[int]]:
+    # One row per div, its denominator followed by the coefficients of its
+    # numerator in the column order of the constraint matrices. The
+    # denominator is zero for divs without a known definition.
+    div_bset = basic if isinstance(basic, isl.BasicSet) else basic.wrap()
+    rows: list[list[int]] = []
+    for pos in range(div_bset.dim(isl.dim_type.div)):
+        try:
+            div = div_bset.get_div(pos)
+        except isl.Error:
+            rows.append([0] * (ncols + 1))
+            continue
+
+        denom = div.get_denominator_val()
+        rows.append([
+            _mat_element(denom),
+            *(_mat_element(div.get_coefficient_val(dt, i).mul(denom))
+              for dt in (isl.dim_type.param, isl.dim_type.in_, isl.dim_type.div)
+              for i in range(div.dim(dt))),
+            _mat_element(div.get_constant_val().mul(denom))])
+    return rows
+
+
+def _div_constraint_rows(
+            div_rows: Sequence[Sequence[int]], ncols: int
+        ) -> list[list[int]]:
+    # The pair of inequalities defining the div e = floor(f/d),
+    #     f - d*e >= 0  and  -f + d*e + d - 1 >= 0,
+    # from which isl recovers the definition of e.
+    ndiv = len(div_rows)
+    div_col = ncols - 1 - ndiv
+    rows: list[list[int]] = []
+    for pos, (denom, *numerator) in enumerate(div_rows):
+        if not denom:
+            continue
+        lower = list(numerator)
+        lower[div_col + pos] -= denom
+        upper = [-value for value in numerator]
+        upper[div_col + pos] += denom
+        upper[-1] += denom - 1
+        rows += [lower, upper]
+    return rows
+
+
+def _encode_basic(buf: bytearray, basic: isl.BasicSet | isl.BasicMap) -> None:
+    dim_types = _matrix_dim_types(isinstance(basic, isl.BasicSet))
+    eq = _isl_mat_to_rows(basic.equalities_matrix(*dim_types))
+    ineq = _isl_mat_to_rows(basic.inequalities_matrix(*dim_types))
+    ncols = basic.dim(isl.dim_type.all) + 1
+    divs = _get_div_rows(basic, ncols)
+    values = [value for rows in (divs, eq, ineq) for row in rows for value in row]
+
+    bound = max((max(value, -value - 1) for value in values), default=0)
+    width = next(
+        (width for width in _BYTES_WIDTHS if bound < 2**(8*width - 1)),
+        _BYTES_DECIMAL)
+
+    _pack_uint(buf, len(divs))
+    _pack_uint(buf, len(eq))
+    _pack_uint(buf, len(ineq))
+    buf.append(width)
+    if width == _BYTES_DECIMAL:
+        text = ",".join(str(value) for value in values).encode("ascii")
+        _pack_uint(buf, len(text))
+        buf += text
+    else:
+        packed: array[int] = array(_BYTES_WIDTH_TO_TYPECODE[width], values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        buf += packed.tobytes()
+
+
+def _decode_basic(
+            data: memoryview, offset: int, isl_space: isl.Space, ncols_no_div: int
+        ) -> tuple[isl.BasicSet | isl.BasicMap, int]:
+    ndiv, offset = _unpack_uint(data, offset)
+    neq, offset = _unpack_uint(data, offset)
+    nineq, offset = _unpack_uint(data, offset)
+    if offset >= len(data):
+        raise ValueError("truncated data")
+    width = data[offset]
+    offset += 1
+
+    ncols = ncols_no_div + ndiv
+    nvalues = ndiv * (ncols + 1) + (neq + nineq) * ncols
+
+    values: Sequence[int]
+    if width == _BYTES_DECIMAL:
+        nbytes, offset = _unpack_uint(data, offset)
+        text = bytes(data[offset:offset + nbytes]).decode("ascii")
+        values = [int(value) for value in text.split(",")] if text else []
+        offset += nbytes
+    elif width in _BYTES_WIDTHS:
+        packed: array[int] = array(_BYTES_WIDTH_TO_TYPECODE[width])
+        nbytes = width*nvalues
+        if offset + nbytes > len(data):
+            raise ValueError("truncated data")
+        packed.frombytes(data[offset:offset + nbytes])
+        if sys.byteorder == "big":
+            packed.byteswap()
+        values = packed
+        offset += nbytes
+    else:
+        raise ValueError(f"unknown coefficient encoding: {width}")
+
+    if len(values) != nvalues:
+        raise ValueError("truncated data")
+
+    ndiv_values = ndiv * (ncols + 1)
+    div_rows = [values[i:i+ncols+1] for i in range(0, ndiv_values, ncols + 1)]
+    rows = [values[i:i+ncols] for i in range(ndiv_values, nvalues, ncols)]
+    ctx = isl_space.get_ctx()
+    is_set = isl_space.is_set()
+    basic_type = isl.BasicSet if is_set else isl.BasicMap
+    basic = basic_type.from_constraint_matrices(
+        isl_space,
+        _isl_mat_from_rows(ctx, rows[:neq], ncols),
+        _isl_mat_from_rows(
+            ctx, [*rows[neq:], *_div_constraint_rows(div_rows, ncols)], ncols),
+        *_matrix_dim_types(is_set))
+    return basic, offset
 
 
 @dataclass(frozen=True)
@@ -174,6 +431,25 @@ class Point:
     def __repr__(self) -> str:
         return f"{type(self).__name__}({str(self._obj)!r})"
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Point], tuple[object, ...]]:
+        if self.is_void:
+            coords = None
+        else:
+            coords = tuple(
+                str(self.get_coordinate(name)) for name in self.space.names)
+        return (_unpickle_point, (self.space, coords))
+
+
+def _unpickle_point(space: Space, coords: tuple[str, ...] | None) -> Point:
+    if coords is None:
+        pt = Point.zero(space)
+        return Point(isl.Point.void(pt._obj.space), space)
+
+    return Point.from_dict(space, {
+        name: isl.Val(value) for name, value in zip(space.names, coords, strict=True)
+        })
+
 
 class _NamedIslSetOrMapLike(NamedIslObject[IslSetOrMapLikeT_co]):
     """
@@ -195,12 +471,17 @@ class _NamedIslSetOrMapLike(NamedIslObject[IslSetOrMapLikeT_co]):
     .. automethod:: __or__
     .. automethod:: __sub__
     .. automethod:: equals
+    .. automethod:: is_subset
     .. automethod:: __lt__
     .. automethod:: __le__
+    .. automethod:: to_bytes
+    .. automethod:: from_bytes
     """
 
-    def is_empty(self) -> bool:
-        return self._obj.is_empty()
+    def is_empty(self, *, cache: Cache | None = None) -> bool:
+        is_empty = cast("Callable[[IslSetOrMapLikeT_co], bool]",
+                        type(self._obj).is_empty)
+        return with_cache(cache, is_empty, self._obj)
 
     def plain_is_empty(self) -> bool:
         return self._obj.plain_is_empty()
@@ -305,10 +586,13 @@ class _NamedIslSetOrMapLike(NamedIslObject[IslSetOrMapLikeT_co]):
 
         return self.project_out(names_to_project_out - set(names_to_keep), cache=cache)
 
-    def gist(self, context: Self) -> Self:
+    def gist(self, context: Self, *, cache: Cache | None = None) -> Self:
         self_aligned, context_aligned = align_two(self, context)
+        gist = cast(
+            "Callable[[IslSetOrMapLikeT_co, IslSetOrMapLikeT_co], IslSetOrMapLikeT_co]",
+            type(self_aligned._obj).gist)
         return type(self)(
-            self_aligned._obj.gist(context_aligned._obj),
+            with_cache(cache, gist, self_aligned._obj, context_aligned._obj),
             self_aligned.space,
         )
 
@@ -333,14 +617,147 @@ class _NamedIslSetOrMapLike(NamedIslObject[IslSetOrMapLikeT_co]):
     def __sub__(self, other: Self) -> Self:
         return cast("Self", _align_and_apply_binary_op(self, other, operator.sub))
 
-    def equals(self, other: Self) -> bool:
-        return _compare_set_or_map_like(self, other, operator.eq)
+    def equals(self, other: Self, *, cache: Cache | None = None) -> bool:
+        return _compare_set_or_map_like(self, other, "is_equal", cache)
+
+    def is_subset(self, other: Self, *, cache: Cache | None = None) -> bool:
+        return _compare_set_or_map_like(self, other, "is_subset", cache)
 
     def __lt__(self, other: Self) -> bool:
-        return _compare_set_or_map_like(self, other, operator.lt)
+        return _compare_set_or_map_like(self, other, "__lt__")
 
     def __le__(self, other: Self) -> bool:
-        return _compare_set_or_map_like(self, other, operator.le)
+        return self.is_subset(other)
+
+    def _isl_basics(self) -> Sequence[isl.BasicSet | isl.BasicMap]:
+        obj = self._obj
+        if isinstance(obj, isl.Set):
+            return obj.get_basic_sets()
+        if isinstance(obj, isl.Map):
+            return obj.get_basic_maps()
+        return [obj]
+
+    def to_bytes(self) -> bytes:
+        """Return a compact binary representation of *self* that can be
+        turned back into an equal object using :meth:`from_bytes`, much faster
+        than parsing isl's text syntax.
+
+        The representation consists of the dimension names and, for each
+        basic set or map, the definitions of its existentially quantified
+        variables along with its equality and inequality constraint
+        matrices. Coefficients are stored as integers of the smallest
+        sufficient width, and the result is compressed using
+        :mod:`zlib` if that makes it smaller.
+        """
+        body = bytearray()
+        for dt in _BYTES_DIM_TYPES:
+            names = self.space.dimtype_to_names.get(dt, ())
+            _pack_uint(body, len(names))
+            for name in names:
+                encoded = name.encode()
+                _pack_uint(body, len(encoded))
+                body += encoded
+
+        basics = self._isl_basics()
+        _pack_uint(body, len(basics))
+        for basic in basics:
+            _encode_basic(body, basic)
+
+        # Constraint matrices are mostly zero and compress well.
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        compressed = compressor.compress(body) + compressor.flush()
+        compression = _BYTES_UNCOMPRESSED
+        if len(compressed) < len(body):
+            body = compressed
+            compression = _BYTES_DEFLATE
+
+        return b"".join([
+            _BYTES_MAGIC,
+            bytes([_BYTES_FORMAT_VERSION,
+                   _BYTES_KINDS.index(type(self).__name__),
+                   compression]),
+            body])
+
+    @classmethod
+    def _decode_bytes(
+                cls, view: memoryview, ctx: isl.Context | None
+            ) -> tuple[IslSetOrMapLike, Space]:
+        if len(view) < _BYTES_HEADER_SIZE:
+            raise ValueError("truncated data")
+        if bytes(view[:len(_BYTES_MAGIC)]) != _BYTES_MAGIC:
+            raise ValueError("not a namedisl binary representation")
+        version, kind, compression = view[len(_BYTES_MAGIC):_BYTES_HEADER_SIZE]
+        if version != _BYTES_FORMAT_VERSION:
+            raise ValueError(f"unsupported format version: {version}")
+        if kind >= len(_BYTES_KINDS):
+            raise ValueError(f"unknown kind of object: {kind}")
+        if _BYTES_KINDS[kind] != cls.__name__:
+            raise ValueError(
+                f"data represents a '{_BYTES_KINDS[kind]}', not a '{cls.__name__}'")
+
+        view = view[_BYTES_HEADER_SIZE:]
+        if compression == _BYTES_DEFLATE:
+            try:
+                view = memoryview(zlib.decompress(view, wbits=-zlib.MAX_WBITS))
+            except zlib.error as err:
+                raise ValueError(f"invalid compressed data: {err}") from err
+        elif compression != _BYTES_UNCOMPRESSED:
+            raise ValueError(f"unknown compression: {compression}")
+        offset = 0
+
+        dimtype_to_names: dict[DimType, tuple[str, ...]] = {}
+        for dt in _BYTES_DIM_TYPES:
+            nnames, offset = _unpack_uint(view, offset)
+            names: list[str] = []
+            for _ in range(nnames):
+                length, offset = _unpack_uint(view, offset)
+                if offset + length > len(view):
+                    raise ValueError("truncated data")
+                names.append(bytes(view[offset:offset+length]).decode())
+                offset += length
+            if dt in cls.active_dim_types:
+                dimtype_to_names[dt] = tuple(names)
+
+        space = Space(constantdict(dimtype_to_names))
+        is_set = DimType.in_ not in cls.active_dim_types
+        isl_space = space.as_isl_set_space(ctx) if is_set else space.as_isl(ctx)
+        ncols_no_div = len(space.names) + 1
+
+        nbasics, offset = _unpack_uint(view, offset)
+        basics: list[isl.BasicSet | isl.BasicMap] = []
+        for _ in range(nbasics):
+            basic, offset = _decode_basic(view, offset, isl_space, ncols_no_div)
+            basics.append(basic)
+
+        if offset != len(view):
+            raise ValueError("unexpected trailing data")
+
+        if cls._isl_type in (isl.BasicSet, isl.BasicMap):
+            if nbasics != 1:
+                raise ValueError(f"expected a single basic set/map, got {nbasics}")
+            return basics[0], space
+
+        if is_set:
+            set_ = isl.Set.empty(isl_space)
+            for basic in basics:
+                assert isinstance(basic, isl.BasicSet)
+                set_ = set_.union(basic)
+            return set_, space
+
+        map_ = isl.Map.empty(isl_space)
+        for basic in basics:
+            assert isinstance(basic, isl.BasicMap)
+            map_ = map_.union(basic)
+        return map_, space
+
+    @classmethod
+    def from_bytes(cls, data: bytes, ctx: isl.Context | None = None) -> Self:
+        """Restore an object from the output of :meth:`to_bytes`.
+        The object is created in *ctx*, by default in
+        :data:`islpy.DEFAULT_CONTEXT`.
+        """
+        obj, space = cls._decode_bytes(memoryview(data), ctx)
+        return cls(cast("IslSetOrMapLikeT_co", obj), space, _isl_names_ok=True)
 
 
 class _NamedIslSetLike(_NamedIslSetOrMapLike[IslSetLikeT]):
@@ -370,6 +787,25 @@ class _NamedIslSetLike(_NamedIslSetOrMapLike[IslSetLikeT]):
         return Point(self.as_isl().sample_point(), self.space)
 
 
+def _n_pieces(obj: isl.Set | isl.Map) -> int:
+    if isinstance(obj, isl.Set):
+        return obj.n_basic_set()
+    return obj.n_basic_map()
+
+
+def _union(a: IslUnbasicT, b: IslUnbasicT) -> IslUnbasicT:
+    return a | b
+
+
+def _intersect(a: IslUnbasicT, b: IslUnbasicT) -> IslUnbasicT:
+    return a & b
+
+
+def _n_constraints(obj: isl.Set | isl.Map) -> int:
+    pieces = obj.get_basic_sets() if isinstance(obj, isl.Set) else obj.get_basic_maps()
+    return sum(piece.n_constraint() for piece in pieces)
+
+
 class _NamedIslUnbasic(_NamedIslSetOrMapLike[IslUnbasicT_co]):
     """
     .. automethod:: equate_dims
@@ -377,6 +813,8 @@ class _NamedIslUnbasic(_NamedIslSetOrMapLike[IslUnbasicT_co]):
     .. automethod:: remove_redundancies
     .. automethod:: coalesce
     .. automethod:: make_disjoint
+    .. automethod:: union_all
+    .. automethod:: intersect_all
     """
 
     def equate_dims(
@@ -405,15 +843,199 @@ class _NamedIslUnbasic(_NamedIslSetOrMapLike[IslUnbasicT_co]):
         return type(self)(
             cast("IslUnbasicT_co", self._obj.remove_redundancies()), self.space)
 
-    def coalesce(self) -> Self:
-        return type(self)(cast("IslUnbasicT_co", self._obj.coalesce()), self.space)
+    def coalesce(self, *, cache: Cache | None = None) -> Self:
+        return type(self)(
+            cast("IslUnbasicT_co",
+                 with_cache(cache, type(self._obj).coalesce, self._obj)),  # pyright: ignore[reportArgumentType]
+            self.space)
 
     def make_disjoint(self) -> Self:
         return type(self)(cast("IslUnbasicT_co", self._obj.make_disjoint()), self.space)
 
+    @classmethod
+    def _combine_all(
+                cls,
+                objs: Iterable[Self],
+                op: Callable[[IslUnbasicT_co, IslUnbasicT_co], IslUnbasicT_co],
+                coalesce_threshold: int | None,
+                sort_key: Callable[[IslUnbasicT_co], int] | None = None,
+            ) -> Self:
+        aligned = align_many(objs)
+        if not aligned:
+            raise ValueError("at least one operand is required")
+        if len(aligned) == 1:
+            return aligned[0]
+
+        space = aligned[0].space
+        level = [obj._obj for obj in aligned]
+        if sort_key is not None:
+            level.sort(key=sort_key)
+
+        while len(level) > 1:
+            next_level = [
+                op(level[i], level[i+1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                next_level.append(level[-1])
+
+            if coalesce_threshold is not None:
+                next_level = [
+                    cast("IslUnbasicT_co", obj.coalesce())
+                    if _n_pieces(obj) > coalesce_threshold else obj
+                    for obj in next_level]
+
+            level = next_level
+
+        return cls(level[0], space)
+
+    @classmethod
+    def union_all(
+                cls,
+                objs: Iterable[Self],
+                *, coalesce_threshold: int | None = None,
+            ) -> Self:
+        """Return the union of all of *objs*.
+
+        The operands are aligned to a joint space once and combined
+        pairwise in a balanced tree. If *coalesce_threshold* is given,
+        intermediate results consisting of more than that many basic sets
+        (or basic maps) are coalesced.
+
+        :raises ValueError: if *objs* is empty.
+        """
+        return cls._combine_all(objs, _union, coalesce_threshold)
+
+    @classmethod
+    def intersect_all(
+                cls,
+                objs: Iterable[Self],
+                *, coalesce_threshold: int | None = None,
+            ) -> Self:
+        """Return the intersection of all of *objs*.
+
+        Like :meth:`union_all`, but operands are additionally ordered by
+        their number of constraints before being combined, so that operands
+        of similar size are intersected with each other first.
+
+        :raises ValueError: if *objs* is empty.
+        """
+        return cls._combine_all(
+            objs, _intersect, coalesce_threshold, sort_key=_n_constraints)
+
+
+class ConstraintMatrix(NamedTuple):
+    """Coefficients of a system of constraints, one row per constraint.
+    The columns correspond, in order, to the dimensions in :attr:`names`,
+    to :attr:`n_div` existentially quantified variables (cf.
+    :meth:`namedisl.Aff.get_div`), and to the constant.
+
+    .. attribute:: matrix
+
+        A two-dimensional :class:`numpy.ndarray` of :class:`numpy.int64`,
+        or of Python :class:`int` (with :class:`object` dtype) if some
+        coefficient does not fit.
+
+    .. attribute:: names
+
+        Parameter names, followed by the names of the 'in' dimensions
+        (for maps), and the names of the 'out' (or set) dimensions.
+
+    .. attribute:: n_div
+    """
+    matrix: NDArray[np.int64] | NDArray[np.object_]
+    names: tuple[str, ...]
+    n_div: int
+
 
 class _NamedIslBasic(_NamedIslSetOrMapLike[IslBasicT_co]):
-    pass
+    """
+    .. automethod:: equalities_matrix
+    .. automethod:: inequalities_matrix
+    .. automethod:: from_constraint_matrices
+    """
+
+    def _constraint_matrix(self, equalities: bool) -> ConstraintMatrix:
+        import numpy as np
+
+        obj = cast("isl.BasicSet | isl.BasicMap", self._obj)
+        dim_types = _matrix_dim_types(isinstance(obj, isl.BasicSet))
+        mat = (obj.equalities_matrix(*dim_types) if equalities
+               else obj.inequalities_matrix(*dim_types))
+
+        rows = _isl_mat_to_rows(mat)
+        shape = (mat.rows(), mat.cols())
+        try:
+            matrix = np.reshape(np.array(rows, dtype=np.int64), shape)
+        except OverflowError:
+            matrix = np.reshape(np.array(rows, dtype=object), shape)
+
+        return ConstraintMatrix(
+            matrix,
+            tuple(name
+                  for dt in (DimType.param, DimType.in_, DimType.out)
+                  for name in self.space.dimtype_to_names.get(dt, ())),
+            obj.dim(isl.dim_type.div))
+
+    def equalities_matrix(self) -> ConstraintMatrix:
+        """Return the coefficients of the equality constraints, each
+        representing ``row @ [*dims, *divs, 1] == 0``. Requires :mod:`numpy`.
+        """
+        return self._constraint_matrix(equalities=True)
+
+    def inequalities_matrix(self) -> ConstraintMatrix:
+        """Return the coefficients of the inequality constraints, each
+        representing ``row @ [*dims, *divs, 1] >= 0``. Requires :mod:`numpy`.
+        """
+        return self._constraint_matrix(equalities=False)
+
+    @classmethod
+    def from_constraint_matrices(
+                cls,
+                space: Space,
+                eq: ArrayLike,
+                ineq: ArrayLike,
+                ctx: isl.Context | None = None,
+            ) -> Self:
+        """Create an object in *space* from integer matrices of equality
+        and inequality constraints, laid out as described in
+        :meth:`equalities_matrix` and :class:`ConstraintMatrix`. The number of
+        existentially quantified variables follows from the number of
+        columns. Requires :mod:`numpy`.
+        """
+        import numpy as np
+
+        is_set = DimType.in_ not in cls.active_dim_types
+        isl_space = space.as_isl_set_space(ctx) if is_set else space.as_isl(ctx)
+        ctx = isl_space.get_ctx()
+
+        eq_mat: NDArray[np.generic] = np.asarray(eq)
+        ineq_mat: NDArray[np.generic] = np.asarray(ineq)
+        eq_shape: tuple[int, ...] = eq_mat.shape
+        ineq_shape: tuple[int, ...] = ineq_mat.shape
+        ncols_no_div = len(space.names) + 1
+        ncols = max(eq_shape[-1], ineq_shape[-1], ncols_no_div)
+        if eq_mat.size == 0:
+            eq_mat = np.reshape(eq_mat, (0, ncols))
+        if ineq_mat.size == 0:
+            ineq_mat = np.reshape(ineq_mat, (0, ncols))
+
+        for mat in (eq_mat, ineq_mat):
+            if mat.ndim != 2 or mat.shape[1] != ncols:
+                raise ValueError("constraint matrices must be two-dimensional "
+                                 "and have matching numbers of columns")
+            if mat.size and mat.dtype.kind not in "iuO":
+                raise TypeError(f"expected integer matrix, got '{mat.dtype}'")
+
+        dim_types = _matrix_dim_types(is_set)
+        basic_type = isl.BasicSet if is_set else isl.BasicMap
+        obj = basic_type.from_constraint_matrices(
+            isl_space,
+            _isl_mat_from_rows(
+                ctx, cast("list[list[int]]", eq_mat.tolist()), ncols),
+            _isl_mat_from_rows(
+                ctx, cast("list[list[int]]", ineq_mat.tolist()), ncols),
+            *dim_types)
+
+        return cls(cast("IslBasicT_co", obj), space, _isl_names_ok=True)
 
 
 @add_mro_docstrings
@@ -468,13 +1090,18 @@ def make_basic_set(src: str, ctx: isl.Context | None = None) -> BasicSet: ...
 def make_basic_set(src: isl.BasicSet) -> BasicSet: ...
 
 
-def make_basic_set(src: str | isl.BasicSet, ctx: isl.Context | None = None) -> BasicSet:
-    obj = isl.BasicSet(src, ctx) if isinstance(src, str) else src
-
+def _normalize_set_like(obj: IslSetLikeT) -> IslSetLikeT:
     if obj.is_params():
         # shield the user from 'param domain' complexity
-        obj = obj.from_params()
+        obj = cast("IslSetLikeT", obj.from_params())
+    return obj
+
+
+def make_basic_set(src: str | isl.BasicSet, ctx: isl.Context | None = None) -> BasicSet:
+    if isinstance(src, str):
+        return _parse_cached(make_basic_set, isl.BasicSet, src, ctx)
 
+    obj = _normalize_set_like(src)
     return BasicSet(obj, Space.from_isl(obj, BasicSet.active_dim_types))
 
 
@@ -495,6 +1122,261 @@ class StrideInfo:
     def offset(self):
         return self._obj.get_offset()
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., StrideInfo], tuple[object, ...]]:
+        return (_unpickle_stride_info, (str(self.stride), self.offset))
+
+
+def _unpickle_stride_info(stride: str, offset: isl.Aff) -> StrideInfo:
+    # isl has no constructor for stride info. Recover it from the set
+    # { x : (x[idx] - offset(x)) mod stride = 0 }, where idx is a dimension
+    # not involved in the offset (the one it was computed for is such a one).
+    ls = isl.LocalSpace.from_space(offset.get_domain_space())
+    idx = max(
+        i for i in range(ls.dim(isl.dim_type.set))
+        if not offset.involves_dims(isl.dim_type.in_, i, 1))
+    var = isl.Aff.var_on_domain(ls, isl.dim_type.set, idx)
+    bset = (var - offset).mod_val(
+        isl.Val(stride, offset.get_ctx())).zero_basic_set()
+    return StrideInfo(isl.Set.from_basic_set(bset).get_stride_info(idx))
+
+
+# {{{ point enumeration
+
+# Number of rows produced at once when enumerating all points of a set.
+_ENUMERATE_CHUNK_NROWS = 2**16
+
+
+def _int64_matrix(mat: isl.Mat) -> NDArray[np.int64]:
+    import numpy as np
+    return np.reshape(
+        np.array(_isl_mat_to_rows(mat), dtype=np.int64), (mat.rows(), mat.cols()))
+
+
+def _scan_level_bounds(
+            prefixes: NDArray[np.int64],
+            eq: NDArray[np.int64],
+            ineq: NDArray[np.int64],
+        ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    # Bounds on the next variable for each of *prefixes*, from constraints
+    # laid out as [*prefix, next variable, constant]. Empty ranges have
+    # hi < lo.
+    import numpy as np
+
+    shape: tuple[int, ...] = prefixes.shape
+    nprefixes = shape[0]
+    lo: NDArray[np.int64] = np.full(nprefixes, np.iinfo(np.int64).min, dtype=np.int64)
+    hi: NDArray[np.int64] = np.full(nprefixes, np.iinfo(np.int64).max, dtype=np.int64)
+    ok: NDArray[np.bool_] = np.ones(nprefixes, dtype=bool)
+
+    for is_eq, rows in ((True, eq), (False, ineq)):
+        for row in cast("list[list[int]]", rows.tolist()):
+            *prefix_coeffs, coeff, const = row
+            rest = np.full(nprefixes, const, dtype=np.int64)
+            for j, prefix_coeff in enumerate(prefix_coeffs):
+                # integer matmul is not BLAS-backed, skip zero coefficients
+                if prefix_coeff:
+                    rest += prefix_coeff * prefixes[:, j]
+            if coeff == 0:
+                ok &= np.equal(rest, 0) if is_eq else (rest >= 0)
+            elif is_eq:
+                # coeff * v + rest == 0
+                ok &= np.equal(rest % coeff, 0)
+                val = -(rest // coeff)
+                lo = np.maximum(lo, val)
+                hi = np.minimum(hi, val)
+            elif coeff > 0:
+                # v >= ceil(-rest / coeff)
+                lo = np.maximum(lo, -(rest // coeff))
+            else:
+                # v <= floor(rest / -coeff)
+                hi = np.minimum(hi, rest // -coeff)
+
+    hi = np.where(ok, hi, lo - 1)
+    return lo, hi
+
+
+def _scan_polyhedron(
+            levels: Sequence[tuple[NDArray[np.int64], NDArray[np.int64]]],
+            prefixes: NDArray[np.int64],
+            chunk_nrows: int,
+        ) -> Iterable[NDArray[np.int64]]:
+    # Yield the integer points with the given *prefixes*, in lexicographic
+    # order, in chunks of at most *chunk_nrows* rows. *levels* holds
+    # constraint matrices for the projections onto successively more
+    # variables. At most *chunk_nrows* rows are held per level.
+    import numpy as np
+
+    shape: tuple[int, ...] = prefixes.shape
+    level = shape[1]
+    if level == len(levels):
+        yield prefixes
+        return
+
+    lo, hi = _scan_level_bounds(prefixes, *levels[level])
+    counts: NDArray[np.int64] = np.maximum(hi - lo + 1, 0)
+    ends = np.cumsum(counts)
+    total = int(np.sum(counts))
+
+    for start in range(0, total, chunk_nrows):
+        idx = np.arange(start, min(start + chunk_nrows, total), dtype=np.int64)
+        iprefix = np.searchsorted(ends, idx, side="right")
+        vals = lo[iprefix] + idx - (ends[iprefix] - counts[iprefix])
+        yield from _scan_polyhedron(
+            levels,
+            np.concatenate([prefixes[iprefix], vals[:, np.newaxis]], axis=1),
+            chunk_nrows)
+
+
+def _rows_differ(a: NDArray[np.int64], b: NDArray[np.int64]) -> NDArray[np.bool_]:
+    import numpy as np
+    return cast("NDArray[np.bool_]", np.any(np.not_equal(a, b), axis=1))
+
+
+def _dedup_sorted(
+            rows: NDArray[np.int64], prev: NDArray[np.int64] | None
+        ) -> NDArray[np.int64]:
+    # *prev*, if given, is a single row preceding *rows*.
+    import numpy as np
+
+    keep: NDArray[np.bool_] = np.ones(len(rows), dtype=bool)
+    keep[1:] = _rows_differ(rows[1:], rows[:-1])
+    if prev is not None and len(rows):
+        keep[:1] = _rows_differ(rows[:1], prev)
+    return rows[keep]
+
+
+def _enumerate_basic_set_points(
+            bset: isl.BasicSet, perm: Sequence[int], chunk_nrows: int
+        ) -> Iterable[NDArray[np.int64]]:
+    # Existentially quantified variables become ordinary (trailing)
+    # dimensions of a polyhedron, whose integer points are scanned
+    # using bounds from its Fourier-Motzkin projections and then projected
+    # onto the set dimensions (permuted by *perm*), in lexicographic order.
+    import numpy as np
+
+    if bset.is_empty():
+        return
+
+    ndim = len(perm)
+    ndiv = bset.dim(isl.dim_type.div)
+    col_perm = [*perm, *range(ndim, ndim + ndiv), ndim + ndiv]
+    eq = _int64_matrix(bset.equalities_matrix(*_SET_MATRIX_DIM_TYPES))[:, col_perm]
+    ineq = _int64_matrix(bset.inequalities_matrix(*_SET_MATRIX_DIM_TYPES))[:, col_perm]
+
+    nvars = ndim + ndiv
+    ctx = bset.get_ctx()
+    lifted = isl.BasicSet.from_constraint_matrices(
+        isl.Space.set_alloc(ctx, 0, nvars),
+        _isl_mat_from_rows(ctx, cast("list[list[int]]", eq.tolist()), nvars + 1),
+        _isl_mat_from_rows(ctx, cast("list[list[int]]", ineq.tolist()), nvars + 1),
+        *_SET_MATRIX_DIM_TYPES)
+    if not lifted.is_bounded():
+        raise ValueError("existentially quantified variables are unbounded")
+
+    lifted_set = isl.Set.from_basic_set(lifted)
+    levels: list[tuple[NDArray[np.int64], NDArray[np.int64]]] = []
+    for level in range(nvars):
+        # Elimination may introduce existentially quantified variables,
+        # constraints involving them are dropped. The remaining ones are
+        # still valid, and the constant bounds keep the ranges finite.
+        proj = lifted.eliminate(
+            isl.dim_type.set, level + 1, nvars - level - 1).remove_divs()
+        cols = [*range(level + 1), nvars]
+        bounds = np.zeros((2, level + 2), dtype=np.int64)
+        bounds[:, level] = (1, -1)
+        bounds[:, -1] = (-lifted_set.dim_min_val(level).to_python(),
+                         lifted_set.dim_max_val(level).to_python())
+        levels.append((
+            _int64_matrix(proj.equalities_matrix(*_SET_MATRIX_DIM_TYPES))[:, cols],
+            np.concatenate([
+                _int64_matrix(
+                    proj.inequalities_matrix(*_SET_MATRIX_DIM_TYPES))[:, cols],
+                bounds])))
+
+    prev: NDArray[np.int64] | None = None
+    for chunk in _scan_polyhedron(
+            levels, np.zeros((1, 0), dtype=np.int64), chunk_nrows):
+        # distinct values of the existentials may yield the same point
+        chunk = _dedup_sorted(chunk[:, :ndim], prev) if ndiv else chunk
+        if len(chunk):
+            prev = chunk[-1:]
+            yield chunk
+
+
+def _lex_sorted(rows: NDArray[np.int64]) -> NDArray[np.int64]:
+    import numpy as np
+    return rows[np.lexsort(np.transpose(rows)[::-1])]
+
+
+def _lex_le_count(rows: NDArray[np.int64], bound: NDArray[np.int64]) -> int:
+    # number of leading rows of the sorted *rows* not greater than the
+    # single row *bound*
+    import numpy as np
+
+    diff = np.not_equal(rows, bound)
+    first = cast("NDArray[np.intp]", np.argmax(diff, axis=1))
+    le = ~_rows_differ(rows, bound) | (
+        rows[np.arange(len(rows)), first] < np.take(bound, first))
+    return int(np.count_nonzero(le))
+
+
+def _merge_sorted_chunks(
+            streams: Sequence[Iterable[NDArray[np.int64]]],
+        ) -> Iterable[NDArray[np.int64]]:
+    # Merge lexicographically sorted streams of chunks, dropping
+    # duplicates. Holds one chunk per stream.
+    import numpy as np
+
+    iters = [iter(stream) for stream in streams]
+    bufs = {i: next(it, None) for i, it in enumerate(iters)}
+    bufs = {i: buf for i, buf in bufs.items() if buf is not None}
+
+    prev: NDArray[np.int64] | None = None
+    while bufs:
+        # No row yet to come is smaller than the least of the last
+        # buffered rows.
+        bound = _lex_sorted(
+            np.concatenate([buf[-1:] for buf in bufs.values()]))[:1]
+        parts: list[NDArray[np.int64]] = []
+        for i, buf in list(bufs.items()):
+            n = _lex_le_count(buf, bound)
+            parts.append(buf[:n])
+            if n < len(buf):
+                bufs[i] = buf[n:]
+            elif (new_buf := next(iters[i], None)) is not None:
+                bufs[i] = new_buf
+            else:
+                del bufs[i]
+
+        rows = _dedup_sorted(_lex_sorted(np.concatenate(parts)), prev)
+        if len(rows):
+            prev = rows[-1:]
+            yield rows
+
+
+def _rechunk(
+            chunks: Iterable[NDArray[np.int64]], chunk_nrows: int
+        ) -> Iterable[NDArray[np.int64]]:
+    import numpy as np
+
+    pending: list[NDArray[np.int64]] = []
+    npending = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        npending += len(chunk)
+        if npending >= chunk_nrows:
+            rows = np.concatenate(pending)
+            nfull = len(rows) - len(rows) % chunk_nrows
+            for start in range(0, nfull, chunk_nrows):
+                yield rows[start:start + chunk_nrows]
+            pending = [rows[nfull:]]
+            npending = len(rows) - nfull
+    if npending:
+        yield np.concatenate(pending)
+
+# }}}
+
 
 @add_mro_docstrings
 class Set(_NamedIslSetLike[isl.Set], _NamedIslUnbasic[isl.Set]):
@@ -507,6 +1389,7 @@ class Set(_NamedIslSetLike[isl.Set], _NamedIslUnbasic[isl.Set]):
     .. automethod:: dim_min
     .. automethod:: stride_info
     .. automethod:: card
+    .. automethod:: enumerate_points
     .. autoattribute:: var_affs
     .. autoattribute:: var_pw_affs
     .. automethod:: as_map
@@ -518,11 +1401,13 @@ class Set(_NamedIslSetLike[isl.Set], _NamedIslUnbasic[isl.Set]):
     def complement(self) -> Set:
         return Set(self._obj.complement(), self.space)
 
-    def simple_hull(self):
-        return BasicSet(self._obj.simple_hull(), self.space)
+    def simple_hull(self, *, cache: Cache | None = None):
+        return BasicSet(
+            with_cache(cache, isl.Set.simple_hull, self._obj), self.space)
 
-    def convex_hull(self) -> BasicSet:
-        return BasicSet(self._obj.convex_hull(), self.space)
+    def convex_hull(self, *, cache: Cache | None = None) -> BasicSet:
+        return BasicSet(
+            with_cache(cache, isl.Set.convex_hull, self._obj), self.space)
 
     def basic_sets(self) -> list[BasicSet]:
         return [BasicSet(bs, self.space) for bs in self._obj.get_basic_sets()]
@@ -563,6 +1448,60 @@ class Set(_NamedIslSetLike[isl.Set], _NamedIslUnbasic[isl.Set]):
             with_cache(cache, isl.Set.card, self._obj),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportAttributeAccessIssue]
             self.space.drop_dim_type(DimType.out).with_empty_dim_type(DimType.in_))
 
+    @overload
+    def enumerate_points(
+            self, order: Sequence[str] | None = None, chunk_size: None = None
+        ) -> NDArray[np.int64]: ...
+
+    @overload
+    def enumerate_points(
+            self, order: Sequence[str] | None = None, *, chunk_size: int
+        ) -> Iterator[NDArray[np.int64]]: ...
+
+    def enumerate_points(
+                self,
+                order: Sequence[str] | None = None,
+                chunk_size: int | None = None,
+            ) -> NDArray[np.int64] | Iterator[NDArray[np.int64]]:
+        """Return all integer points of a bounded set without parameters as
+        an array of shape ``(npoints, ndims)``, sorted lexicographically.
+        The columns correspond to the set dimensions named in *order*,
+        by default in the order of :attr:`space`. Requires :mod:`numpy`.
+
+        If *chunk_size* is given, return an iterator over consecutive
+        arrays of (at most) *chunk_size* points instead. Memory use is then
+        proportional to *chunk_size* rather than to the number of points.
+
+        :raises ValueError: if the set is unbounded or has parameters.
+        """
+        set_names = self.space.dimtype_to_names[DimType.out]
+        if order is None:
+            order = set_names
+        elif sorted(order) != sorted(set_names):
+            raise ValueError("order must name each set dimension exactly once")
+        if self.space.param_names:
+            raise ValueError("cannot enumerate points of a set with parameters")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if not self._obj.is_bounded():
+            raise ValueError("cannot enumerate points of an unbounded set")
+
+        perm = [self.space.name_to_dim[name][1] for name in order]
+        chunk_nrows = chunk_size or _ENUMERATE_CHUNK_NROWS
+        streams = [
+            _enumerate_basic_set_points(bset, perm, chunk_nrows)
+            for bset in self._obj.compute_divs().get_basic_sets()]
+        chunks = _rechunk(
+            streams[0] if len(streams) == 1 else _merge_sorted_chunks(streams),
+            chunk_nrows)
+
+        if chunk_size is not None:
+            return iter(chunks)
+
+        import numpy as np
+        return np.concatenate(
+            [np.zeros((0, len(perm)), dtype=np.int64), *chunks])
+
     @cached_property
     def var_affs(self) -> Mapping[str | Literal[0], Aff]:
         r"""
@@ -617,15 +1556,25 @@ def make_set(src: isl.Set) -> Set: ...
 
 
 def make_set(src: isl.Set | str, ctx: isl.Context | None = None) -> Set:
-    obj = isl.Set(src, ctx) if isinstance(src, str) else src
-
-    if obj.is_params():
-        # shield the user from 'param domain' complexity
-        obj = obj.from_params()
+    """
+    Create a :class:`Set` from isl syntax or an :class:`islpy.Set`.
+    Results of parsing in :data:`islpy.DEFAULT_CONTEXT` are cached.
+    """
+    if isinstance(src, str):
+        return _parse_cached(make_set, isl.Set, src, ctx)
 
+    obj = _normalize_set_like(src)
     return Set(obj, Space.from_isl(obj, Set.active_dim_types))
 
 
+def make_sets(srcs: Iterable[str], ctx: isl.Context | None = None) -> list[Set]:
+    r"""
+    Create :class:`Set`\ s from isl syntax, sharing work (and
+    :class:`Space`\ s) among inputs with identical dimensions.
+    """
+    return _make_many(Set, isl.Set, _normalize_set_like, srcs, ctx)
+
+
 class _NamedIslMapLike(_NamedIslSetOrMapLike[IslMapLikeT]):
     """
     .. automethod:: reverse
@@ -680,10 +1629,15 @@ class BasicMap(_NamedIslMapLike[isl.BasicMap], _NamedIslBasic[isl.BasicMap]):
     def range(self) -> BasicSet:
         return BasicSet(self._obj.range(), self.space.drop_dim_type(DimType.in_))
 
-    def intersect_domain(self, domain: BasicSet) -> Self:
+    def intersect_domain(
+                self, domain: BasicSet, *, cache: Cache | None = None
+            ) -> Self:
         self_a, domain_a = align_for_compostition(
             self, DimType.in_, domain, DimType.out)
-        return type(self)(self_a._obj.intersect_domain(domain_a._obj), self_a.space)
+        return type(self)(
+            with_cache(cache, isl.BasicMap.intersect_domain,
+                       self_a._obj, domain_a._obj),
+            self_a.space)
 
     def intersect_range(self, range: BasicSet) -> Self:
         self_a, range_a = align_for_compostition(
@@ -703,8 +1657,9 @@ def make_basic_map(src: isl.BasicMap) -> BasicMap: ...
 
 
 def make_basic_map(src: str | isl.BasicMap, ctx: isl.Context | None = None) -> BasicMap:
-    obj = isl.BasicMap(src, ctx) if isinstance(src, str) else src
-    return BasicMap(obj, Space.from_isl(obj, BasicMap.active_dim_types))
+    if isinstance(src, str):
+        return _parse_cached(make_basic_map, isl.BasicMap, src, ctx)
+    return BasicMap(src, Space.from_isl(src, BasicMap.active_dim_types))
 
 
 def make_map_from_domain_and_range(
@@ -762,11 +1717,13 @@ class Map(_NamedIslMapLike[isl.Map], _NamedIslUnbasic[isl.Map]):
     def complement(self) -> Map:
         return Map(self._obj.complement(), self.space)
 
-    def simple_hull(self):
-        return BasicMap(self._obj.simple_hull(), self.space)
+    def simple_hull(self, *, cache: Cache | None = None):
+        return BasicMap(
+            with_cache(cache, isl.Map.simple_hull, self._obj), self.space)
 
-    def convex_hull(self) -> BasicMap:
-        return BasicMap(self._obj.convex_hull(), self.space)
+    def convex_hull(self, *, cache: Cache | None = None) -> BasicMap:
+        return BasicMap(
+            with_cache(cache, isl.Map.convex_hull, self._obj), self.space)
 
     def basic_maps(self) -> list[BasicMap]:
         return [BasicMap(bs, self.space) for bs in self._obj.get_basic_maps()]
@@ -782,30 +1739,32 @@ class Map(_NamedIslMapLike[isl.Map], _NamedIslUnbasic[isl.Map]):
     def range(self) -> Set:
         return Set(self._obj.range(), self.space.drop_dim_type(DimType.in_))
 
-    def intersect_domain(self, domain: Set) -> Self:
+    def intersect_domain(self, domain: Set, *, cache: Cache | None = None) -> Self:
         self_a, domain_a = align_for_compostition(
             self, DimType.in_, domain, DimType.out)
-        return type(self)(self_a._obj.intersect_domain(domain_a._obj), self_a.space)
+        return type(self)(
+            with_cache(cache, isl.Map.intersect_domain, self_a._obj, domain_a._obj),
+            self_a.space)
 
     def intersect_range(self, range: Set) -> Self:
         self_a, range_a = align_for_compostition(
             self, DimType.out, range, DimType.out)
         return type(self)(self_a._obj.intersect_range(range_a._obj), self_a.space)
 
-    def apply_range(self, other: Self) -> Self:
+    def apply_range(self, other: Self, *, cache: Cache | None = None) -> Self:
         self_a, other_a = align_for_compostition(self, DimType.out, other, DimType.in_)
         return type(self)(
-            self_a._obj.apply_range(other_a._obj),
+            with_cache(cache, isl.Map.apply_range, self_a._obj, other_a._obj),
             Space(constantdict({
                 DimType.param: self_a.space.dimtype_to_names[DimType.param],
                 DimType.in_: self_a.space.dimtype_to_names[DimType.in_],
                 DimType.out: other_a.space.dimtype_to_names[DimType.out],
             })))
 
-    def apply_domain(self, other: Self) -> Self:
+    def apply_domain(self, other: Self, *, cache: Cache | None = None) -> Self:
         self_a, other_a = align_for_compostition(self, DimType.in_, other, DimType.out)
         return type(self)(
-            self_a._obj.apply_domain(other_a._obj),
+            with_cache(cache, isl.Map.apply_domain, self_a._obj, other_a._obj),
             Space(constantdict({
                 DimType.param: self_a.space.dimtype_to_names[DimType.param],
                 DimType.in_: other_a.space.dimtype_to_names[DimType.in_],
@@ -864,5 +1823,18 @@ def make_map(src: isl.Map) -> Map: ...
 
 
 def make_map(src: str | isl.Map, ctx: isl.Context | None = None) -> Map:
-    obj = isl.Map(src, ctx) if isinstance(src, str) else src
-    return Map(obj, Space.from_isl(obj, Map.active_dim_types))
+    """
+    Create a :class:`Map` from isl syntax or an :class:`islpy.Map`.
+    Results of parsing in :data:`islpy.DEFAULT_CONTEXT` are cached.
+    """
+    if isinstance(src, str):
+        return _parse_cached(make_map, isl.Map, src, ctx)
+    return Map(src, Space.from_isl(src, Map.active_dim_types))
+
+
+def make_maps(srcs: Iterable[str], ctx: isl.Context | None = None) -> list[Map]:
+    r"""
+    Create :class:`Map`\ s from isl syntax, sharing work (and
+    :class:`Space`\ s) among inputs with identical dimensions.
+    """
+    return _make_many(Map, isl.Map, None, srcs, ctx)
@@ -27,6 +27,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from typing import cast
+
+import pytest
+
 import islpy as isl
 
 import namedisl as nisl
@@ -254,6 +258,55 @@ def test_move_dims_expression_input_to_param_reconstructs_like_isl() -> None:
         assert moved.space.in_names == frozenset()
         assert moved.space.param_names == frozenset({"n", "i"})
 
+
+def test_pw_aff_eval_many() -> None:
+    pytest.importorskip("numpy")
+    import numpy as np
+
+    pw_aff = nisl.make_pw_aff(
+        "[n] -> { [i, j] -> [(floor((i + floor(j/3))/2) + n)] : i >= 0 "
+        "and j mod 5 = 1 and exists e : 4e <= i + j <= 4e + 1; "
+        "[i, j] -> [(3i)/2 - (j mod 7)] : i < 0 and i mod 2 = 0 }")
+    names = [*pw_aff.space.dimtype_to_names[DimType.param],
+             *pw_aff.space.dimtype_to_names[DimType.in_]]
+
+    points = np.array([
+        (n, i, j)
+        for n in (-2, 3) for i in range(-10, 10) for j in range(-10, 12)])
+    result = pw_aff.eval_many(points)
+    assert result.dtype == np.int64
+    assert 0 < result.count() < len(points)
+
+    mask = np.ma.getmaskarray(result)
+    domain = pw_aff.aggregate_domain()
+    for point, value, masked in zip(
+            cast("list[list[int]]", points.tolist()),
+            cast("list[int]", result.data.tolist()),
+            cast("list[bool]", mask.tolist()),
+            strict=True):
+        value_dict = dict(zip(names, point, strict=True))
+        pt_set = nisl.Point.from_dict(domain.space, value_dict).as_set()
+        assert masked == (domain & pt_set).is_empty()
+        if not masked:
+            assert pw_aff.eval_with_dict(value_dict).to_python() == value
+
+    # mappings are broadcast
+    by_name = pw_aff.eval_many({"n": 3, "i": np.arange(-10, 10)[:, np.newaxis],
+                                "j": np.arange(-10, 12)})
+    assert by_name.shape == (20, 22)
+    assert np.ma.allequal(by_name.ravel(), result[len(result)//2:])
+    assert np.array_equal(
+        np.ma.getmaskarray(by_name).ravel(), mask[len(result)//2:])
+
+    with pytest.raises(ValueError):
+        pw_aff.eval_many(points[:, :2])
+    with pytest.raises(ValueError):
+        pw_aff.eval_many({"n": 0, "i": 0})
+    with pytest.raises(TypeError):
+        pw_aff.eval_many(points * 0.5)
+    with pytest.raises(ValueError):
+        nisl.make_pw_aff("{ [i] -> [(i/2)] }").eval_many(np.array([[1]]))
+
 # }}}
 
 
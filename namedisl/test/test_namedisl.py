@@ -26,6 +26,8 @@ THE SOFTWARE.
 """
 
 
+from typing import TYPE_CHECKING, TypeVar, cast
+
 import pytest
 
 import islpy as isl
@@ -36,6 +38,16 @@ from namedisl import to_named
 from namedisl.core import DimType
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from namedisl.core import IslObject, NamedIslObject
+
+
+T = TypeVar("T")
+
+
 @pytest.mark.parametrize("ndims", [2, 3, 4, 5])
 @pytest.mark.parametrize("has_params", [True, False])
 def test_names(ndims: int, has_params: bool):
@@ -228,3 +240,714 @@ def test_ticked_names_are_distinct_names() -> None:
     named_set = nisl.make_set(isl.Set.universe(space))
 
     assert named_set.space.names == frozenset({"x", "x'"})
+
+
+def test_align_obj_reuses_alignment_plan() -> None:
+    from namedisl.core import _get_alignment_plan
+
+    target = nisl.Space.from_names(param=["m", "n"], out=["i", "j", "k"])
+
+    results: list[nisl.Set] = []
+    hits_before = 0
+    for _ in range(2):
+        hits_before = _get_alignment_plan.cache_info().hits
+        s = nisl.make_set("[n] -> { [k, i] : 0 <= i < n and 0 <= k < i }")
+        results.append(nisl.align_obj(s, target))
+
+    assert _get_alignment_plan.cache_info().hits == hits_before + 1
+    assert results[0].space == target
+    assert results[0] == results[1]
+    assert results[1].equals(
+        nisl.make_set("[n, m] -> { [j, k, i] : 0 <= i < n and 0 <= k < i }"))
+
+    # replaying the plan outside the default context
+    other_ctx = isl.Context()
+    s = nisl.make_set("[n] -> { [k, i] : 0 <= i < n and 0 <= k < i }", other_ctx)
+    aligned = nisl.align_obj(s, target)
+    assert aligned._obj.get_ctx() == other_ctx
+    assert aligned.space == target
+    assert aligned._obj.get_var_names(isl.dim_type.param) == ["m", "n"]
+
+
+@pytest.mark.parametrize("ndims", [1, 3, 8, 20])
+def test_align_obj_random_permutations(ndims: int) -> None:
+    import random
+    rng = random.Random(ndims)
+
+    names = [f"x{i}" for i in range(ndims)]
+    params = [f"p{i}" for i in range(ndims // 2 + 1)]
+    conditions = " and ".join(
+        f"{rng.randint(-5, 0)} <= {name} <= {params[i % len(params)]}"
+        for i, name in enumerate(names))
+    s = nisl.make_set(f"[{', '.join(params)}] -> {{ [{', '.join(names)}] : "
+                      f"{conditions} }}")
+
+    for _ in range(5):
+        target_names = [*names, "new_out"]
+        target_params = [*params, "new_param"]
+        rng.shuffle(target_names)
+        rng.shuffle(target_params)
+        target = nisl.Space.from_names(param=target_params, out=target_names)
+
+        aligned = nisl.align_obj(s, target)
+        assert aligned.space == target
+        assert aligned.equals(s.add_dims(DimType.out, ["new_out"])
+                              .add_dims(DimType.param, ["new_param"]))
+
+
+def test_align_obj_cross_dim_type_and_larger_obj() -> None:
+    s = nisl.make_set("[n] -> { [i, j, k] : 0 <= i < n and j = i + 1 and k = 2i }")
+    target = nisl.Space.from_names(param=["i", "n"], out=["j"])
+
+    with pytest.raises(ValueError, match="across dim_types"):
+        nisl.align_obj(s, target, obj_larger_than_space_ok=True)
+
+    with pytest.raises(ValueError, match="more dimensions"):
+        nisl.align_obj(s, target, allow_cross_dim_type=True)
+
+    aligned = nisl.align_obj(s, target,
+        allow_cross_dim_type=True, obj_larger_than_space_ok=True)
+    assert aligned.space == nisl.Space.from_names(
+        param=["i", "n"], out=["j", "k"])
+    assert aligned.equals(
+        nisl.make_set("[i, n] -> { [j, k] : 0 <= i < n and j = i + 1 and k = 2i }"))
+
+
+def test_align_many() -> None:
+    sets = [
+        nisl.make_set("[n] -> { [i, j, k] : 0 <= i < n and 0 <= j < i and k = j }"),
+        nisl.make_set("[n] -> { [i, j, k] : 0 <= i < n and 0 <= j < i and k = i }"),
+        nisl.make_set("[n] -> { [k, i] : 0 <= i < n and k = 2i }"),
+        nisl.make_set("{ [j] : 0 <= j < 5 }"),
+        ]
+
+    aligned = nisl.align_many(sets)
+    assert len(aligned) == len(sets)
+
+    space = aligned[0].space
+    assert all(a.space is space for a in aligned)
+    # the most frequent ordering is retained, objects in it are untouched
+    assert space.dimtype_to_names[DimType.out] == ("i", "j", "k")
+    assert aligned[0] is sets[0]
+    assert aligned[1] is sets[1]
+
+    for orig, a in zip(sets, aligned, strict=True):
+        assert a.equals(orig)
+
+    union = aligned[0]._obj
+    for a in aligned[1:]:
+        union = union | a._obj
+    assert nisl.Set(union, space).equals(
+        sets[0] | sets[1] | sets[2] | sets[3])
+
+    assert nisl.align_many([]) == []
+
+    with pytest.raises(ValueError, match="duplicate dimension names"):
+        nisl.align_many([
+            nisl.make_set("[n] -> { [i] }"),
+            nisl.make_set("[i] -> { [n] }"),
+            nisl.make_set("{ [i] }"),
+            ])
+
+    with pytest.raises(ValueError, match="matching dimension types"):
+        nisl.align_many([
+            nisl.make_set("{ [i] }"),
+            nisl.make_map("{ [i] -> [j] }"),
+            ])
+
+
+@pytest.mark.parametrize(("make", "src", "target", "expected", "bulk"), [
+    (nisl.make_set,
+        "[n, q] -> { [a, b, c] : 0 <= a < n and b = 2a and c < q }",
+        nisl.Space.from_names(param=["z", "q", "n"], out=["c", "d", "a", "b"]),
+        "[z, q, n] -> { [c, d, a, b] : 0 <= a < n and b = 2a and c < q }",
+        True),
+    (nisl.make_map,
+        "[n] -> { [i, j] -> [a, b] : a = i + j and b = i - n }",
+        nisl.Space.from_names(param=["k", "n"], in_=["j", "x", "i"], out=["b", "a"]),
+        "[k, n] -> { [j, x, i] -> [b, a] : a = i + j and b = i - n }",
+        True),
+    (nisl.make_pw_aff,
+        "[n] -> { [i, j] -> [(i + 2j) mod 3] : i < n }",
+        nisl.Space.from_names(param=["k", "n"], in_=["j", "i"]),
+        "[n, k] -> { [j, i] -> [(i + 2j) mod 3] : i < n }",
+        True),
+    (nisl.make_pw_qpolynomial,
+        "[n] -> { [i, j] -> i * j * j + n : i < n }",
+        nisl.Space.from_names(param=["k", "n"], in_=["j", "i"]),
+        "[n, k] -> { [j, i] -> i * j * j + n : i < n }",
+        False),
+    ])
+def test_align_obj_bulk_permutation(
+            make: Callable[[str], NamedIslObject[IslObject]],
+            src: str, target: nisl.Space, expected: str, bulk: bool,
+        ) -> None:
+    from namedisl.core import _get_alignment_plan, _MoveDims
+
+    obj = make(src)
+    aligned = nisl.align_obj(obj, target)
+
+    assert aligned.space == target
+    assert aligned == nisl.align_obj(make(expected), target)
+
+    plan = _get_alignment_plan(type(obj._obj), obj.space, target, False, False)
+    assert bulk == (not any(isinstance(step, _MoveDims) for step in plan.steps))
+
+
+def test_align_obj_bulk_permutation_multi_aff() -> None:
+    map_ = nisl.make_map("[n] -> { [i, j] -> [a, b] : a = i + j and b = i - n }")
+    maff = map_.as_pw_multi_aff().as_multi_aff()
+    target = nisl.Space.from_names(param=["n"], in_=["j", "i"], out=["b", "a"])
+
+    aligned = nisl.align_obj(maff, target)
+    assert aligned.space == target
+    assert aligned["a"].equals(nisl.make_aff("[n] -> { [i, j] -> [(i + j)] }"))
+    assert aligned["b"].equals(nisl.make_aff("[n] -> { [i, j] -> [(i - n)] }"))
+
+
+def test_spaces_are_interned() -> None:
+    import gc
+    import pickle
+
+    from namedisl.core import _SPACE_INTERN_TABLE
+
+    sp1 = nisl.Space.from_names(param=["n"], out=["i", "j"])
+    sp2 = nisl.make_set("[n] -> { [i, j] : 0 <= i, j < n }").space
+    assert sp1 is sp2
+    assert sp1.name_to_dim is sp2.name_to_dim
+
+    assert pickle.loads(pickle.dumps(sp1)) is sp1
+
+    # order matters
+    sp3 = nisl.Space.from_names(param=["n"], out=["j", "i"])
+    assert sp3 is not sp1
+    assert sp3 != sp1
+
+    unique = nisl.Space.from_names(out=["test_spaces_are_interned"])
+    key = unique.dimtype_to_names
+    assert key in _SPACE_INTERN_TABLE
+    del unique
+    gc.collect()
+    assert key not in _SPACE_INTERN_TABLE
+
+
+def test_space_is_frozen_and_slotted() -> None:
+    from dataclasses import FrozenInstanceError
+
+    sp = nisl.Space.from_names(param=["n"], in_=["i"], out=["o"])
+    assert not hasattr(sp, "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        sp.dimtype_to_names = {}  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert sp.name_to_dim == {
+        "n": (DimType.param, 0), "i": (DimType.in_, 0), "o": (DimType.out, 0)}
+    assert sp.dim(DimType.in_) == 1
+    set_sp = sp.drop_dim_type(DimType.out).as_set_space()
+    assert set_sp.dim(DimType.out) == 1
+    with pytest.raises(KeyError):
+        set_sp.dim(DimType.in_)
+
+    with pytest.raises(ValueError, match="unique"):
+        nisl.Space.from_names(in_=["i"], out=["i"])
+
+
+def test_space_as_isl_is_cached_for_default_context() -> None:
+    sp = nisl.Space.from_names(param=["n"], out=["i", "j"])
+
+    assert sp.as_isl() is sp.as_isl()
+    assert sp.as_isl_set_space() is sp.as_isl_set_space()
+    assert sp.as_isl() is not sp.as_isl_set_space()
+    assert sp.as_isl_set_space().is_set()
+
+    # a fresh wrapper of the same context reuses the cached space
+    ctx = sp.as_isl().get_ctx()
+    assert sp.as_isl(ctx) is sp.as_isl()
+
+    other_ctx = isl.Context()
+    other = sp.as_isl_set_space(other_ctx)
+    assert other is not sp.as_isl_set_space()
+    assert other.get_ctx() == other_ctx
+    assert other.is_equal(isl.Space.create_from_names(
+        other_ctx, set=["i", "j"], params=["n"]))
+
+    # other contexts are not retained by the space
+    assert not any(
+        getattr(sp, slot, None) is other for slot in type(sp).__slots__)
+
+
+def test_cache_lru_eviction() -> None:
+    from namedisl.core import with_cache
+
+    calls: list[isl.Set] = []
+
+    def dim_max(obj: isl.Set, pos: int) -> isl.PwAff:
+        calls.append(obj)
+        return obj.dim_max(pos)
+
+    cache = nisl.Cache(maxsize=2)
+    sets = [isl.Set(f"{{ [i, j] : 0 <= i < {n} and 0 <= j < i }}")
+            for n in range(1, 4)]
+
+    with_cache(cache, dim_max, sets[0], 1)
+    with_cache(cache, dim_max, sets[1], 1)
+    assert len(cache) == 2
+    assert len(calls) == 2
+
+    # refresh the first entry, so that the second one gets evicted
+    with_cache(cache, dim_max, sets[0], 1)
+    assert len(calls) == 2
+    with_cache(cache, dim_max, sets[2], 1)
+    assert len(cache) == 2
+    assert len(calls) == 3
+
+    with_cache(cache, dim_max, sets[0], 1)
+    assert len(calls) == 3
+    with_cache(cache, dim_max, sets[1], 1)
+    assert len(calls) == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    with_cache(cache, dim_max, sets[1], 1)
+    assert len(calls) == 5
+
+    with pytest.raises(ValueError):
+        nisl.Cache(maxsize=-1)
+
+
+def test_cache_memory_budget() -> None:
+    from namedisl.core import _estimate_size
+
+    small = nisl.make_set("{ [i] : 0 <= i < 10 }")
+    large = nisl.make_set(
+        "[n] -> { [i, j, k] : 0 <= i < n and 0 <= j < i and 0 <= k < j + i }")
+    assert _estimate_size(small.as_isl()) < _estimate_size(large.as_isl())
+
+    budget = 3 * (_estimate_size(large.as_isl())
+                  + _estimate_size(large.dim_max("k").as_isl()))
+    cache = nisl.Cache(max_memory=budget)
+
+    large.dim_max("k", cache=cache)
+    large.dim_max("j", cache=cache)
+    assert len(cache) == 2
+    for name in ["i", "j", "k"]:
+        for s in [large, large.add_dims(DimType.param, ["m"])]:
+            s.dim_max(name, cache=cache)
+
+    assert 0 < len(cache) <= 3
+    assert cache._memory <= budget
+
+    unbounded = nisl.Cache()
+    for name in ["i", "j", "k"]:
+        large.dim_max(name, cache=unbounded)
+    assert len(unbounded) == 3
+
+
+def test_cache_stats() -> None:
+    cache = nisl.Cache(maxsize=3)
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+
+    s.dim_max("j", cache=cache)
+    # an equal, but distinct object
+    nisl.make_set(str(s)).dim_max("j", cache=cache)
+    s.dim_max("i", cache=cache)
+    s.project_out(["j"], cache=cache)
+    s.project_out(["j"], cache=cache)
+
+    stats = cache.stats()
+    dim_max_stats = stats.by_operation["Set.dim_max"]
+    assert dim_max_stats.hits == 1
+    assert dim_max_stats.misses == 2
+    assert dim_max_stats.comparisons == 1
+    assert dim_max_stats.max_chain_length == 1
+    assert dim_max_stats.time_saved > 0
+
+    project_out_stats = stats.by_operation["Set.project_out"]
+    assert project_out_stats.hits == 1
+    assert project_out_stats.misses == 1
+
+    assert stats.total.hits == 2
+    assert stats.total.misses == 3
+    assert stats.total.evictions == 0
+
+    s.dim_max("i", cache=cache)
+    s.dim_min("i", cache=cache)
+    stats2 = cache.stats()
+    assert stats2.total.evictions == 1
+    assert stats2.by_operation["Set.dim_max"].evictions == 1
+
+    # snapshots are not affected by later use
+    assert stats.total.evictions == 0
+    assert stats.by_operation["Set.dim_max"].hits == 1
+
+
+def test_cache_persistent_store(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    s = nisl.make_set(
+        "[n] -> { [i, j] : 0 <= i < n and 0 <= j < i and i mod 3 = 0 }")
+
+    def run(cache: nisl.Cache):
+        return (
+            s.dim_max("j", cache=cache),
+            s.project_out(["j"], cache=cache),
+            s.stride_info("i", cache=cache),
+            )
+
+    cache = nisl.Cache(persistent_path=path)
+    dim_max, projected, stride_info = run(cache)
+    assert cache.stats().total.persistent_hits == 0
+    cache.close()
+
+    # a fresh cache (standing in for a fresh process) finds stored results
+    cache = nisl.Cache(persistent_path=path)
+    dim_max2, projected2, stride_info2 = run(cache)
+    stats = cache.stats()
+    assert stats.by_operation["Set.dim_max"].persistent_hits == 1
+    assert stats.by_operation["Set.project_out"].persistent_hits == 1
+    # stride info has no textual form and is not stored
+    assert stats.by_operation["Set.get_stride_info"].misses == 1
+
+    assert dim_max2.equals(dim_max)
+    assert projected2.equals(projected)
+    assert stride_info2.stride == stride_info.stride
+
+    # persistent hits populate the in-memory cache
+    s.dim_max("j", cache=cache)
+    assert cache.stats().by_operation["Set.dim_max"].hits == 2
+    assert cache.stats().by_operation["Set.dim_max"].persistent_hits == 1
+    cache.close()
+
+
+def test_cache_persistent_key_ignores_stale_names(tmp_path: Path) -> None:
+    import sqlite3
+
+    path = tmp_path / "cache.sqlite"
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+
+    # names in the underlying isl object are only updated by as_isl()
+    renamed = s.rename_dims([("i", "k")])
+    assert not renamed._isl_names_ok
+    cache = nisl.Cache(persistent_path=path)
+    dim_max = renamed.dim_max("j", cache=cache)
+    cache.close()
+
+    renamed = s.rename_dims([("i", "k")])
+    assert "k" in str(renamed)
+    assert renamed._isl_names_ok
+    cache = nisl.Cache(persistent_path=path)
+    dim_max2 = renamed.dim_max("j", cache=cache)
+    assert cache.stats().total.persistent_hits == 1
+    assert dim_max2.space == dim_max.space
+    assert dim_max2.equals(dim_max)
+    cache.close()
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute(
+            "SELECT COUNT(*) FROM results").fetchone() == (1,)
+
+
+def test_cache_thread_stress() -> None:
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    nthreads = 16
+    ncalls_per_thread = 200
+
+    sets = [
+        nisl.make_set(
+            f"[n] -> {{ [i, j] : 0 <= i < n + {k} and 0 <= j < i "
+            f"and j mod {k + 2} = 0 }}")
+        for k in range(12)]
+    expected = [s.dim_max("j") for s in sets]
+
+    cache = nisl.Cache(maxsize=8)
+
+    def work(thread_idx: int) -> list[bool]:
+        results: list[bool] = []
+        for call_idx in range(ncalls_per_thread):
+            k = (thread_idx * 7 + call_idx) % len(sets)
+            results.append(sets[k].dim_max("j", cache=cache).equals(expected[k]))
+            # also exercise interning and lazy Space attributes concurrently
+            sp = nisl.Space.from_names(param=["n"], out=[f"x{call_idx % 5}", "y"])
+            assert sp is nisl.Space.from_names(
+                param=["n"], out=[f"x{call_idx % 5}", "y"])
+            assert sp.as_isl_set_space().is_set()
+        return results
+
+    old_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(nthreads) as pool:
+            all_results = list(pool.map(work, range(nthreads)))
+    finally:
+        sys.setswitchinterval(old_switch_interval)
+
+    assert all(all(results) for results in all_results)
+
+    stats = cache.stats().by_operation["Set.dim_max"]
+    assert stats.hits + stats.misses == nthreads * ncalls_per_thread
+    assert stats.misses - stats.evictions == len(cache) <= 8
+    assert len(cache) == sum(len(bucket) for bucket in cache._cache.values())
+
+
+def test_ambient_cache() -> None:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+
+    cache = nisl.Cache()
+    with nisl.caching(cache) as c:
+        assert c is cache
+        s.dim_max("j")
+        s.dim_max("j")
+
+        inner = nisl.Cache()
+        with nisl.caching(inner):
+            s.dim_max("j")
+        assert inner.stats().total.misses == 1
+
+        # explicitly passed caches take precedence
+        explicit = nisl.Cache()
+        s.dim_max("j", cache=explicit)
+        assert explicit.stats().total.misses == 1
+
+        # the ambient cache does not leak into other threads
+        with ThreadPoolExecutor(1) as pool:
+            pool.submit(s.dim_max, "j").result()
+
+    s.dim_max("j")
+    assert cache.stats().total.hits == 1
+    assert cache.stats().total.misses == 1
+
+    async def run_task(task_cache: nisl.Cache) -> None:
+        with nisl.caching(task_cache):
+            s.dim_min("j")
+            await asyncio.sleep(0)
+            s.dim_min("j")
+
+    async def main() -> list[nisl.Cache]:
+        task_caches = [nisl.Cache() for _ in range(3)]
+        await asyncio.gather(*(run_task(tc) for tc in task_caches))
+        return task_caches
+
+    for task_cache in asyncio.run(main()):
+        assert task_cache.stats().total.hits == 1
+        assert task_cache.stats().total.misses == 1
+
+
+def test_cache_identity_layer() -> None:
+    from namedisl.core import with_cache
+
+    cache = nisl.Cache(maxsize=2)
+    s = isl.Set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+    s_copy = isl.Set(str(s))
+    ctx = isl.Set("[n] -> { [i, j] : j >= 0 }")
+
+    first = with_cache(cache, isl.Set.gist, s, ctx)
+    assert with_cache(cache, isl.Set.gist, s, ctx) is first
+
+    stats = cache.stats().total
+    assert stats.identity_hits == 1
+    assert stats.comparisons == 0
+
+    # equal but distinct objects go through hashing and comparison, and are
+    # then remembered by identity as well
+    assert with_cache(cache, isl.Set.gist, s_copy, ctx) is first
+    assert with_cache(cache, isl.Set.gist, s_copy, ctx) is first
+    stats = cache.stats().total
+    assert stats.identity_hits == 2
+    assert stats.comparisons == 1
+    assert stats.hits == 3
+
+    # position of isl objects among the arguments matters
+    with_cache(cache, isl.Set.gist, ctx, s)
+    assert cache.stats().total.misses == 2
+
+    # eviction also drops the identity entries
+    with_cache(cache, isl.Set.gist, ctx, ctx)
+    assert len(cache) == 2
+    assert all(
+        identity_entry.key in cache._cache
+        for identity_entry in cache._identity.values())
+    with_cache(cache, isl.Set.gist, s, ctx)
+    assert cache.stats().total.misses == 4
+
+    cache.clear()
+    assert not cache._identity
+
+
+def test_cache_identity_layer_is_bounded() -> None:
+    from namedisl.core import _estimate_size
+
+    a = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+    b = nisl.make_set("[n] -> { [i] : i >= 0 }")
+
+    # alignment creates equal but distinct operands in each call
+    cache = nisl.Cache(maxsize=10)
+    for _ in range(200):
+        a.gist(b, cache=cache)
+
+    assert len(cache) == 1
+    assert cache.stats().total.hits == 199
+    assert len(cache._identity_aliases) == 9
+    assert len(cache._identity) == 10
+    assert cache._identity_keys == {
+        key: set(cache._identity) for key in cache._cache}
+
+    # aliases count towards the memory budget
+    budget = 20 * _estimate_size(a.as_isl())
+    cache = nisl.Cache(max_memory=budget)
+    for _ in range(200):
+        a.gist(b, cache=cache)
+    assert len(cache) == 1
+    assert 0 < len(cache._identity_aliases) < 20
+    assert cache._memory <= budget
+
+    # evicting a result drops its aliases
+    c = nisl.make_set("[n] -> { [i] : i <= n }")
+    cache = nisl.Cache(maxsize=10)
+    for _ in range(5):
+        a.gist(b, cache=cache)
+    a.gist(c, cache=cache)
+    cache.maxsize = 1
+    a.gist(c, cache=cache)
+    assert len(cache) == 1
+    assert not cache._identity_aliases
+    assert len(cache._identity) == 1
+    assert cache._memory == 0
+
+
+def test_named_object_hash_and_eq_short_circuits() -> None:
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+    s_copy = nisl.make_set(str(s))
+    other = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j <= i }")
+    reordered = nisl.make_set("[n] -> { [j, i] : 0 <= i < n and 0 <= j < i }")
+
+    assert hash(s) == hash(s) == hash(s_copy)
+    assert s._hash_cache == hash(s.as_isl())
+
+    # the hash stays stable across name restoration in as_isl
+    h = hash(s)
+    s.as_isl()
+    assert hash(s) == h
+
+    same = s
+    assert s == same
+    assert s == s_copy
+    assert s != other
+    assert s != reordered
+    assert s.equals(reordered)
+
+    table = {s: 1, other: 2}
+    assert table[s_copy] == 1
+    assert reordered not in table
+
+
+def _pickle_roundtrip(obj: T) -> T:
+    import pickle
+
+    return cast("T", pickle.loads(pickle.dumps(obj)))
+
+
+@pytest.mark.parametrize("make_obj", [
+    lambda: nisl.make_set("[n] -> { [i, j] : 0 <= i < n and i <= j }"),
+    lambda: nisl.make_basic_set("[n] -> { [i', j] : 0 <= i' < n and j = 2i' }"),
+    lambda: nisl.make_map("[n] -> { [i] -> [j] : 0 <= i < n and j = i + 1 }"),
+    lambda: nisl.make_basic_map("{ [i] -> [j] : exists a : j = 3a + i }"),
+    lambda: nisl.make_aff("[n] -> { [i] -> [(2i + n)] }"),
+    lambda: nisl.make_pw_aff("[n] -> { [i] -> [(i + n)] : i > 0 }"),
+    lambda: nisl.make_qpolynomial("[n] -> { [i] -> n * i^2 + 3 }"),
+    lambda: nisl.make_pw_qpolynomial("[n] -> { [i] -> i * i : 0 <= i < n }"),
+    lambda: (
+        nisl.make_map("[n] -> { [i] -> [j, k] : j = i + n and k = 2i }")
+        .as_pw_multi_aff()),
+    lambda: nisl.make_basic_set("[n] -> { [i, j] : 0 <= i < n }").constraints()[0],
+    lambda: nisl.make_basic_map("{ [i] -> [j] : j >= i + 1 }").constraints()[0],
+    lambda: (
+        nisl.make_basic_set("{ [i] : exists a : i = 2a }").constraints()[0]),
+    # constraints not involving the div of their local space
+    lambda: next(
+        c for c in nisl.make_basic_set(
+            "{ [i, j, k] : exists e : i = 3e + j and 0 <= i and k <= 5 }")
+        .constraints()
+        if c.num_divs and c.get_div_coefficient(0).is_zero()),
+    lambda: next(
+        c for c in nisl.make_basic_map(
+            "{ [i] -> [j] : exists e : i = 3e + j and 0 <= i }")
+        .constraints()
+        if c.num_divs and c.get_div_coefficient(0).is_zero()),
+    ])
+def test_pickle_named_objects(
+            make_obj: Callable[[], NamedIslObject[IslObject]]) -> None:
+    obj = make_obj()
+    unpickled = _pickle_roundtrip(obj)
+
+    assert type(unpickled) is type(obj)
+    assert unpickled.space is obj.space
+    assert unpickled._isl_names_ok
+    assert unpickled == obj
+    assert str(unpickled) == str(obj)
+
+    # caches are not part of the pickled state
+    hash(obj)
+    assert "_hash_cache" not in vars(_pickle_roundtrip(obj))
+
+
+def test_pickle_point_term_stride_info() -> None:
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and exists a : j = 3a + i + 1 }")
+    pt = s.sample_point()
+    pt2 = _pickle_roundtrip(pt)
+    assert pt2.space is pt.space
+    assert str(pt2) == str(pt)
+
+    void = nisl.make_set("{ [i] : false }").sample_point()
+    assert _pickle_roundtrip(void).is_void
+
+    si = s.stride_info("j")
+    si2 = _pickle_roundtrip(si)
+    assert si2.stride == si.stride
+    assert si2.offset.plain_is_equal(si.offset)
+
+    qp = nisl.make_qpolynomial("[n] -> { [i] -> 2 * n * i^2 + 3 }")
+    for term in qp.terms():
+        term2 = _pickle_roundtrip(term)
+        assert term2.space is term.space
+        assert term2.coefficient == term.coefficient
+        assert term2.get_exp("i") == term.get_exp("i")
+        assert term2.get_exp("n") == term.get_exp("n")
+
+
+def test_parse_cache_and_bulk_parsing() -> None:
+    src = "[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }"
+    assert nisl.make_set(src) is nisl.make_set(src)
+    assert nisl.make_pw_aff("[n] -> { [i] -> [(i + n)] }") is nisl.make_pw_aff(
+        "[n] -> { [i] -> [(i + n)] }")
+
+    assert nisl.make_set(src, isl.DEFAULT_CONTEXT) is nisl.make_set(src)
+
+    # parsing in other contexts is not cached
+    from namedisl.core import _parse_cached_in_default_context
+    cache_info = _parse_cached_in_default_context.cache_info()
+    other_ctx = isl.Context()
+    in_other_ctx = nisl.make_set(src, other_ctx)
+    assert in_other_ctx is not nisl.make_set(src)
+    assert in_other_ctx is not nisl.make_set(src, other_ctx)
+    assert in_other_ctx._obj.get_ctx() == other_ctx
+    assert _parse_cached_in_default_context.cache_info().currsize == (
+        cache_info.currsize)
+
+    srcs = [f"[n] -> {{ [i, j] : {k} <= i < n and 0 <= j < i }}" for k in range(5)]
+    sets = nisl.make_sets([*srcs, srcs[0], "[n] -> { [i, j] : i = j }"], other_ctx)
+    assert len(sets) == 7
+    assert all(s.space is sets[0].space for s in sets)
+    assert sets[5] is sets[0]
+    for s, s_src in zip(sets, srcs, strict=False):
+        assert s.equals(nisl.make_set(s_src, other_ctx))
+        assert s._obj.get_ctx() == other_ctx
+
+    maps = nisl.make_maps(["{ [i] -> [j] : j = i + 1 }", "{ [i] -> [j] : j > i }"])
+    assert maps[0].space is maps[1].space
+    pw_affs = nisl.make_pw_affs(["[n] -> { [i] -> [(i)] }", "[n] -> { [i] -> [(n)] }"])
+    assert pw_affs[0].space is pw_affs[1].space
+    assert pw_affs[1].equals(nisl.make_pw_aff("[n] -> { [i] -> [(n)] }"))
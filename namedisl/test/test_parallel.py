@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+
+__copyright__ = """
+Copyright (C) 2025- University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from operator import methodcaller
+
+import pytest
+
+import islpy as isl
+
+import namedisl as nisl
+import namedisl.parallel as nisl_parallel
+
+
+def _domains(n: int, ctx: isl.Context | None = None) -> list[nisl.Set]:
+    return [
+        nisl.make_set(f"[n] -> {{ [i, j] : {k} <= i < n and 0 <= j < i }}", ctx)
+        for k in range(n)]
+
+
+def _convex_hull(s: nisl.Set) -> nisl.BasicSet:
+    return s.convex_hull()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("chunksize", [None, 1, 3])
+def test_parallel_map_keeps_order(workers: int, chunksize: int | None) -> None:
+    domains = _domains(10)
+    hulls = nisl_parallel.map(
+        _convex_hull, domains, workers=workers, chunksize=chunksize)
+
+    assert len(hulls) == len(domains)
+    for dom, hull in zip(domains, hulls, strict=True):
+        assert isinstance(hull, nisl.BasicSet)
+        assert hull.space is dom.space
+        assert hull.equals(dom.convex_hull())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_map_result_context(workers: int) -> None:
+    hulls = nisl_parallel.map(_convex_hull, _domains(4), workers=workers)
+    assert all(hull._obj.get_ctx() == isl.DEFAULT_CONTEXT for hull in hulls)
+
+    # in the calling process, results stay in the context of the operands
+    other_ctx = isl.Context()
+    hulls = nisl_parallel.map(_convex_hull, _domains(4, other_ctx), workers=1)
+    assert all(hull._obj.get_ctx() == other_ctx for hull in hulls)
+
+
+def test_parallel_starmap() -> None:
+    maps = [
+        nisl.make_map(f"{{ [i] -> [j] : j = i + {k} }}") for k in range(6)]
+    shift = nisl.make_map("{ [j] -> [k] : k = 2j }")
+
+    results = nisl_parallel.starmap(
+        nisl.Map.apply_range, [(m, shift) for m in maps], workers=2)
+    for m, result in zip(maps, results, strict=True):
+        assert result.equals(m.apply_range(shift))
+
+
+def _intersect_with_bad_set(s: nisl.Set) -> nisl.Set:
+    return s & nisl.make_set("{ [i] : i >= }")
+
+
+def test_parallel_map_propagates_isl_errors() -> None:
+    domains = _domains(4)
+    with pytest.raises(isl.Error):
+        nisl_parallel.map(_intersect_with_bad_set, domains, workers=2)
+
+    with pytest.raises(ValueError):
+        nisl_parallel.map(methodcaller("coalesce"), domains, workers=0)
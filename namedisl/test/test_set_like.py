@@ -25,6 +25,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from typing import TYPE_CHECKING, cast
+
 import pytest
 
 import islpy as isl
@@ -34,6 +36,13 @@ from .utils_for_tests import generate_random_named_map, generate_random_named_se
 from namedisl.core import _find_joint_space
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from namedisl.core import IslSetOrMapLike
+    from namedisl.set_like import _NamedIslSetOrMapLike
+
+
 # {{{ sets
 
 
@@ -132,6 +141,81 @@ def test_set_intersection_rejects_name_collision_across_dim_types() -> None:
         _find_joint_space(set_with_n.space, param_with_n.space)
 
 
+def test_joint_space_reuses_superset_order() -> None:
+    big = nisl.make_set("[n] -> { [z, y, x] : 0 <= x, y, z < n }")
+    small = nisl.make_set("{ [x, z] : x < z }")
+
+    assert _find_joint_space(big.space, small.space) is big.space
+    assert _find_joint_space(small.space, big.space) is big.space
+
+    result = big & small
+    assert result.space is big.space
+    assert result.equals(
+        nisl.make_set("[n] -> { [z, y, x] : 0 <= x, y, z < n and x < z }"))
+
+
+def test_joint_space_chain_keeps_accumulated_order() -> None:
+    a = nisl.make_set("{ [d, c, b] : 0 <= c, d < 10 }")
+    b = nisl.make_set("{ [b] : 0 <= b < 10 }")
+    c = nisl.make_set("{ [d, b] : d = b }")
+
+    result = a & b & c
+    assert result.space is a.space
+    assert result.equals(nisl.make_set(
+        "{ [b, c, d] : 0 <= b, c, d < 10 and d = b }"))
+
+
+def test_joint_space_is_independent_of_operand_order() -> None:
+    a = nisl.make_set("[n] -> { [d, c] : 0 <= c, d < n }")
+    b = nisl.make_set("[m] -> { [b, c] : 0 <= b < m }")
+
+    assert _find_joint_space(a.space, b.space) == _find_joint_space(b.space, a.space)
+    assert (a & b) == (b & a)
+    assert hash(a & b) == hash(b & a)
+
+
+@pytest.mark.parametrize("coalesce_threshold", [None, 1])
+def test_set_union_all_and_intersect_all(coalesce_threshold: int | None) -> None:
+    sets = [
+        nisl.make_set(f"[n] -> {{ [i, j] : {k} <= i < n and 0 <= j < {k + 3} }}")
+        for k in range(7)
+    ] + [nisl.make_set("{ [j, k] : 0 <= j < 5 and k = j }")]
+
+    expected_union = sets[0]
+    expected_intersection = sets[0]
+    for s in sets[1:]:
+        expected_union = expected_union | s
+        expected_intersection = expected_intersection & s
+
+    union = nisl.Set.union_all(sets, coalesce_threshold=coalesce_threshold)
+    assert union.equals(expected_union)
+
+    intersection = nisl.Set.intersect_all(
+        iter(sets), coalesce_threshold=coalesce_threshold)
+    assert intersection.equals(expected_intersection)
+
+    assert nisl.Set.union_all(sets[:1]) is sets[0]
+
+    with pytest.raises(ValueError, match="at least one"):
+        nisl.Set.union_all([])
+
+
+def test_map_union_all_and_intersect_all() -> None:
+    maps = [
+        nisl.make_map(f"{{ [i] -> [j] : j = i + {k} and 0 <= i < 10 }}")
+        for k in range(5)
+    ] + [nisl.make_map("[n] -> { [i] -> [o] : o = i and 0 <= i < n }")]
+
+    expected_union = maps[0]
+    expected_intersection = maps[0]
+    for m in maps[1:]:
+        expected_union = expected_union | m
+        expected_intersection = expected_intersection & m
+
+    assert nisl.Map.union_all(maps, coalesce_threshold=2).equals(expected_union)
+    assert nisl.Map.intersect_all(maps).equals(expected_intersection)
+
+
 def test_set_add_constraint_uses_named_dimensions() -> None:
     bset = nisl.make_basic_set("[m,n,p] -> { [j, i] }")
 
@@ -664,3 +748,210 @@ def test_basic_map_domain_produces_suitable_space() -> None:
 
 
 # }}}
+
+
+def test_two_operand_operations_use_cache() -> None:
+    cache = nisl.Cache()
+
+    s = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and 0 <= j < i }")
+    ctx = nisl.make_set("[n] -> { [i, j] : 0 <= i < n and j >= 0 }")
+    other_ctx = nisl.make_set("[n] -> { [i, j] : j >= 0 }")
+
+    gisted = s.gist(ctx, cache=cache)
+    assert s.gist(ctx, cache=cache).equals(gisted)
+    assert not s.gist(other_ctx, cache=cache).equals(gisted)
+
+    gist_stats = cache.stats().by_operation["Set.gist"]
+    assert gist_stats.hits == 1
+    assert gist_stats.misses == 2
+
+    assert s.is_subset(ctx, cache=cache)
+    assert s.is_subset(ctx, cache=cache)
+    assert not ctx.is_subset(s, cache=cache)
+    assert s.equals(s, cache=cache)
+    stats = cache.stats().by_operation
+    assert stats["Set.is_subset"].hits == 1
+    assert stats["Set.is_subset"].misses == 2
+    assert stats["Set.is_equal"].misses == 1
+
+    m = nisl.make_map("{ [i] -> [j] : j = i + 1 }")
+    m2 = nisl.make_map("{ [j] -> [k] : k = 2j }")
+    composed = m.apply_range(m2, cache=cache)
+    assert m.apply_range(m2, cache=cache).equals(composed)
+    assert composed.equals(nisl.make_map("{ [i] -> [k] : k = 2i + 2 }"))
+    assert cache.stats().by_operation["Map.apply_range"].hits == 1
+
+    for _ in range(2):
+        assert not s.is_empty(cache=cache)
+        s.convex_hull(cache=cache)
+        (s | other_ctx).coalesce(cache=cache)
+    stats = cache.stats().by_operation
+    for op_name in ["Set.is_empty", "Set.convex_hull", "Set.coalesce"]:
+        assert stats[op_name].hits == 1
+
+    a = nisl.make_pw_aff("[n] -> { [i] -> [(i)] }")
+    b = nisl.make_pw_aff("[n] -> { [i] -> [(n)] }")
+    pw_max = a.max(b, cache=cache)
+    assert a.max(b, cache=cache).as_isl().is_equal(pw_max.as_isl())
+    assert cache.stats().by_operation["PwAff.max"].hits == 1
+
+
+def _div_definitions(obj: _NamedIslSetOrMapLike[IslSetOrMapLike]) -> list[str]:
+    result: list[str] = []
+    for basic in obj._isl_basics():
+        div_bset = basic if isinstance(basic, isl.BasicSet) else basic.wrap()
+        for pos in range(div_bset.dim(isl.dim_type.div)):
+            try:
+                result.append(str(div_bset.get_div(pos)))
+            except isl.Error:
+                result.append("unknown")
+    return result
+
+
+@pytest.mark.parametrize(("make", "src"), [
+    (nisl.make_set,
+        "[n] -> { [i, j] : 0 <= i < n and exists a : j = 2a; [i, j] : i = n }"),
+    (nisl.make_set, "{ [i] : false }"),
+    (nisl.make_set, f"{{ [i] : i = {2**70} }}"),
+    (nisl.make_basic_set, "[n] -> { [i', j] : 0 <= i' < n and j = 3i' }"),
+    (nisl.make_map,
+        "[n] -> { [i] -> [j] : 0 <= i < n and exists a : j = 2a + i; [i] -> [i] }"),
+    (nisl.make_basic_map, "{ [i] -> [j] : j >= i + 5 }"),
+    (nisl.make_set, "[n] -> { [i] : 2*floor(i/2) < i and 3*floor(i/3) < i < n }"),
+    (nisl.make_map, "{ [i] -> [j] : j = floor(i/2) + floor(i/3) }"),
+    ])
+def test_to_bytes_round_trip(
+            make: Callable[[str], _NamedIslSetOrMapLike[IslSetOrMapLike]],
+            src: str) -> None:
+    obj = make(src)
+    data = obj.to_bytes()
+    restored = type(obj).from_bytes(data)
+
+    assert restored.space is obj.space
+    assert restored.equals(obj)
+    assert _div_definitions(restored) == _div_definitions(obj)
+    if str(2**70) not in src:
+        assert len(data) < len(str(obj))
+
+    other_ctx = isl.Context()
+    in_other_ctx = type(obj).from_bytes(data, other_ctx)
+    assert in_other_ctx._obj.get_ctx() == other_ctx
+
+    with pytest.raises(ValueError):
+        (nisl.Map if isinstance(obj, nisl.Set) else nisl.Set).from_bytes(data)
+    with pytest.raises(ValueError):
+        type(obj).from_bytes(data[:-1])
+
+
+def test_constraint_matrices() -> None:
+    pytest.importorskip("numpy")
+    import numpy as np
+
+    bset = nisl.make_basic_set(
+        "[n] -> { [i, j] : 0 <= i < n and exists a : j = 2a and j <= 100 }")
+    eq = bset.equalities_matrix()
+    ineq = bset.inequalities_matrix()
+    assert eq.names == ineq.names == ("n", "i", "j")
+    assert eq.n_div == ineq.n_div == 1
+    assert eq.matrix.dtype == np.int64
+    assert eq.matrix.shape == (1, 5)
+    assert ineq.matrix.shape == (3, 5)
+
+    # rows agree with the per-constraint interface
+    assert np.array_equal(np.concatenate([eq.matrix, ineq.matrix]), [
+        [*(cns.get_coefficient(name).to_python() for name in eq.names),
+         *(cns.get_div_coefficient(i).to_python() for i in range(cns.num_divs)),
+         cns.constant.to_python()]
+        for cns in bset.constraints()])
+
+    bmap = nisl.make_basic_map(f"[n] -> {{ [i] -> [j] : j = i + {2**70} }}")
+    eq = bmap.equalities_matrix()
+    assert eq.names == ("n", "i", "j")
+    assert eq.matrix.dtype == object
+    assert eq.matrix.tolist() in ([[0, 1, -1, 2**70]], [[0, -1, 1, -2**70]])
+    assert bmap.inequalities_matrix().matrix.shape == (0, 4)
+
+
+def test_from_constraint_matrices() -> None:
+    pytest.importorskip("numpy")
+    import numpy as np
+
+    bset = nisl.make_basic_set(
+        "[n] -> { [i, j] : 0 <= i < n and exists a : j = 2a and j <= 100 }")
+    rebuilt = nisl.BasicSet.from_constraint_matrices(
+        bset.space,
+        bset.equalities_matrix().matrix, bset.inequalities_matrix().matrix)
+    assert rebuilt.space is bset.space
+    assert rebuilt.equals(bset)
+
+    space = nisl.Space.from_names(param=["n"], in_=["i"], out=["j"])
+    bmap = nisl.BasicMap.from_constraint_matrices(
+        space,
+        np.array([[0, 1, -1, 2**70]], dtype=object),
+        [[1, -1, 0, -1]])
+    assert bmap.equals(nisl.make_basic_map(
+        f"[n] -> {{ [i] -> [j] : j = i + {2**70} and i < n }}"))
+
+    assert nisl.BasicSet.from_constraint_matrices(
+        nisl.Space.from_names(param=[], out=["i"]), [], []).plain_is_universe()
+
+    with pytest.raises(ValueError):
+        nisl.BasicSet.from_constraint_matrices(bset.space, [[1, 2, 3, 4]], [[1, 2]])
+    with pytest.raises(TypeError):
+        nisl.BasicSet.from_constraint_matrices(bset.space, [[0.5, 0, 0, 0]], [])
+
+
+def _points_via_isl(set_: nisl.Set, order: list[str]) -> list[tuple[int, ...]]:
+    names = set_.space.dimtype_to_names[nisl.DimType.out]
+    points: list[tuple[int, ...]] = []
+    set_.as_isl().foreach_point(lambda pt: points.append(tuple(
+        pt.get_coordinate_val(isl.dim_type.set, names.index(name)).to_python()
+        for name in order)))
+    return sorted(points)
+
+
+@pytest.mark.parametrize("src", [
+    "{ [i, j] : 0 <= i < 5 and i <= j <= 2i and (i + j) mod 3 = 0 }",
+    ("{ [i, j, k] : 0 <= i < 20 and i <= j <= 2i and (i + j) mod 3 = 0 "
+     "and exists e : 5e <= i + k <= 5e + 2 and 0 <= k <= j }"),
+    # overlapping pieces
+    ("{ [i, j] : 0 <= i < 5 and i <= j <= 2i; [i, j] : 0 <= i, j < 3; "
+     "[i, j] : exists a, b : i = 4a and j = 3b and 0 <= i, j < 30 }"),
+    # several values of the existential for each point
+    "{ [i] : exists e : 0 <= i <= 20 and 3e <= i <= 3e + 5 and 0 <= e <= 100 }",
+    "{ [i] : 1 = 0 }",
+    "{ [] }",
+])
+def test_enumerate_points(src: str) -> None:
+    pytest.importorskip("numpy")
+    import numpy as np
+
+    set_ = nisl.make_set(src)
+    names = list(set_.space.dimtype_to_names[nisl.DimType.out])
+    for order in [None, names[::-1]]:
+        points = set_.enumerate_points(order)
+        assert points.dtype == np.int64
+        assert points.shape[1] == len(names)
+        rows = cast("list[list[int]]", points.tolist())
+        assert [tuple(pt) for pt in rows] == _points_via_isl(
+            set_, names if order is None else order)
+
+        chunks = list(set_.enumerate_points(order, chunk_size=4))
+        assert all(len(chunk) == 4 for chunk in chunks[:-1])
+        assert np.array_equal(
+            np.concatenate([points[:0], *chunks]), points)
+
+
+def test_enumerate_points_errors() -> None:
+    pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError):
+        nisl.make_set("{ [i] : i >= 0 }").enumerate_points()
+    with pytest.raises(ValueError):
+        nisl.make_set("[n] -> { [i] : 0 <= i < n and n = 5 }").enumerate_points()
+
+    set_ = nisl.make_set("{ [i, j] : 0 <= i, j < 3 }")
+    with pytest.raises(ValueError):
+        set_.enumerate_points(["i"])
+    with pytest.raises(ValueError):
+        set_.enumerate_points(chunk_size=0)